@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+
+from src.auth.dependencies import current_user_cache
+from src.main import app
+
+
+async def register_user(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/auth/register",
+        json={
+            "email": f"bench_{uuid.uuid4().hex[:8]}@mail.com",
+            "password": "BenchPassword123!",
+            "name": "Bench",
+            "surname": "User",
+            "date_of_birth": "1990-01-01",
+            "gender": "m",
+            "country": "Russia",
+            "city": "Moscow",
+        },
+    )
+    response.raise_for_status()
+    client.cookies.clear()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def run(
+    client: AsyncClient, headers: dict, requests: int, concurrency: int, cached: bool
+) -> float:
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            if not cached:
+                current_user_cache.clear()
+            response = await client.get("/auth/me", headers=headers)
+            response.raise_for_status()
+
+    current_user_cache.clear()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        headers = await register_user(client)
+        await run(client, headers, concurrency, concurrency, cached=True)
+
+        db_rps = await run(client, headers, requests, concurrency, cached=False)
+        cached_rps = await run(client, headers, requests, concurrency, cached=True)
+
+    print(f"GET /auth/me, {requests} requests, concurrency {concurrency}")
+    print(f"  users lookup per request: {db_rps:10.1f} req/s")
+    print(f"  cached principal:         {cached_rps:10.1f} req/s")
+    print(f"  speedup:                  {cached_rps / db_rps:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
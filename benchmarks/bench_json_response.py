@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import date
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from src.responses import FastJSONResponse, FastJSONRoute
+from src.user_profile.schemas import UserRead
+
+
+def make_users(count: int) -> List[UserRead]:
+    return [
+        UserRead(
+            user_id=uuid.uuid4(),
+            email=f"user{index}@mail.com",
+            name="Ivan",
+            surname="Ivanov",
+            date_of_birth=date(1990, 1, 1),
+            bio="Hello there",
+            gender="m",
+            country="Russia",
+            city="Moscow",
+            role="user",
+        )
+        for index in range(count)
+    ]
+
+
+async def list_users() -> List[UserRead]:
+    return []
+
+
+# Runs the same two steps as FastAPI's request handler: serialize_response() with
+# the route's response field, then rendering the body with the response class.
+async def render(route: APIRoute, response_class, users: List[UserRead]) -> bytes:
+    content = await serialize_response(
+        field=route.secure_cloned_response_field, response_content=users
+    )
+    return response_class(content).body
+
+
+async def timed(route: APIRoute, response_class, users: List[UserRead], rounds: int):
+    await render(route, response_class, users)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        body = await render(route, response_class, users)
+    return (time.perf_counter() - started) / rounds, body
+
+
+async def main(items: int, rounds: int) -> None:
+    users = make_users(items)
+    default_route = APIRoute("/users", list_users, response_model=List[UserRead])
+    fast_route = FastJSONRoute("/users", list_users, response_model=List[UserRead])
+
+    default_seconds, default_body = await timed(
+        default_route, JSONResponse, users, rounds
+    )
+    fast_seconds, fast_body = await timed(fast_route, FastJSONResponse, users, rounds)
+    assert json.loads(default_body) == json.loads(fast_body)
+
+    print(f"List[UserRead] with {items} items, {rounds} rounds")
+    print(f"  validate + dump_python + json.dumps: {default_seconds * 1000:8.2f} ms")
+    print(f"  prerendered dump_json:               {fast_seconds * 1000:8.2f} ms")
+    print(
+        f"  speedup:                             {default_seconds / fast_seconds:8.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.rounds))
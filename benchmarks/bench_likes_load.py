@@ -0,0 +1,208 @@
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+import src.auth.models  # noqa: F401  # registers RefreshToken for the User mapper
+from src.database import create_db_engine
+from src.likes.dao import LikeDAO
+
+EMAIL_PREFIX = "bench_likes_"
+
+SEED_STATEMENT = f"""
+    INSERT INTO users (
+        id, email, hash_password, name, surname, date_of_birth, bio,
+        gender, country, city, role
+    )
+    SELECT
+        gen_random_uuid(),
+        '{EMAIL_PREFIX}' || g || '@mail.com',
+        'x',
+        'Name',
+        'Surname',
+        date '1990-01-01',
+        NULL,
+        CASE WHEN g % 2 = 0 THEN 'm' ELSE 'f' END,
+        'Country',
+        'City',
+        'user'
+    FROM generate_series(1, CAST(:users AS int)) AS g
+    RETURNING id
+"""
+
+
+async def seed(engine: AsyncEngine, users: int) -> List:
+    async with AsyncSession(engine) as db_session:
+        async with db_session.begin():
+            db_response = await db_session.execute(text(SEED_STATEMENT), {"users": users})
+            user_ids = db_response.scalars().all()
+        async with db_session.begin():
+            await db_session.execute(text("ANALYZE users"))
+        return user_ids
+
+
+# Likes and matches go first: cascading them row by row from 100k deleted users is
+# far slower than two set-based deletes.
+async def cleanup(engine: AsyncEngine) -> None:
+    async with AsyncSession(engine) as db_session:
+        async with db_session.begin():
+            for statement in (
+                "DELETE FROM matches USING users WHERE matches.user_id = users.id "
+                "AND users.email LIKE :prefix",
+                "DELETE FROM likes USING users WHERE likes.user_low = users.id "
+                "AND users.email LIKE :prefix",
+                "DELETE FROM users WHERE email LIKE :prefix",
+            ):
+                await db_session.execute(text(statement), {"prefix": f"{EMAIL_PREFIX}%"})
+
+
+# Each worker likes random users in its own transaction, and likes back a like it
+# sent earlier with probability like_back, so matches form under load.
+async def worker(
+    engine: AsyncEngine,
+    user_ids: List,
+    deadline: float,
+    like_back: float,
+    rng: random.Random,
+    latencies: List[float],
+) -> None:
+    sent = []
+    async with AsyncSession(engine) as db_session:
+        while time.perf_counter() < deadline:
+            if sent and rng.random() < like_back:
+                other_id, user_id = sent.pop(rng.randrange(len(sent)))
+            else:
+                user_id, other_id = rng.sample(user_ids, 2)
+                sent.append((user_id, other_id))
+
+            started = time.perf_counter()
+            async with db_session.begin():
+                await LikeDAO(db_session).like(user_id, other_id)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run_workers(
+    user_ids: List, concurrency: int, seconds: float, like_back: float, seed: int
+) -> List[float]:
+    engine = create_db_engine()
+    latencies: List[float] = []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *(
+            worker(
+                engine,
+                user_ids,
+                deadline,
+                like_back,
+                random.Random(seed * concurrency + n),
+                latencies,
+            )
+            for n in range(concurrency)
+        )
+    )
+    await engine.dispose()
+    return latencies
+
+
+# One client process tops out around the CPU cost of a transaction, so the load is
+# spread over several processes, each with its own engine and workers.
+def run_process(
+    user_ids: List, concurrency: int, seconds: float, like_back: float, seed: int
+) -> List[float]:
+    return asyncio.run(run_workers(user_ids, concurrency, seconds, like_back, seed))
+
+
+def percentile(values: List[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+async def main(
+    users: int,
+    processes: int,
+    concurrency: int,
+    seconds: float,
+    like_back: float,
+    p99_target_ms: float,
+) -> int:
+    engine = create_db_engine()
+    await cleanup(engine)
+    print(f"Seeding {users} users")
+    user_ids = await seed(engine, users)
+
+    try:
+        started = time.perf_counter()
+        with ProcessPoolExecutor(processes) as pool:
+            results = await asyncio.gather(
+                *(
+                    asyncio.get_running_loop().run_in_executor(
+                        pool,
+                        run_process,
+                        user_ids,
+                        concurrency,
+                        seconds,
+                        like_back,
+                        n,
+                    )
+                    for n in range(processes)
+                )
+            )
+        elapsed = time.perf_counter() - started
+        latencies = [latency for result in results for latency in result]
+
+        async with AsyncSession(engine) as db_session:
+            async with db_session.begin():
+                match_rows = await db_session.scalar(
+                    text(
+                        "SELECT count(*) FROM matches JOIN users "
+                        "ON users.id = matches.user_id WHERE users.email LIKE :prefix"
+                    ),
+                    {"prefix": f"{EMAIL_PREFIX}%"},
+                )
+
+        p99 = percentile(latencies, 99)
+        print(
+            f"{len(latencies)} likes from {processes} x {concurrency} workers in "
+            f"{elapsed:.1f} s: {len(latencies) / elapsed:,.0f} likes/s, "
+            f"{match_rows // 2} matches"
+        )
+        print(
+            f"  milliseconds per like: p50 {percentile(latencies, 50):.2f}  "
+            f"p95 {percentile(latencies, 95):.2f}  p99 {p99:.2f}  "
+            f"{'ok' if p99 <= p99_target_ms else 'OVER TARGET'}"
+        )
+    finally:
+        await cleanup(engine)
+        await engine.dispose()
+    return 0 if p99 <= p99_target_ms else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Sustained PUT /likes/{id} load against DATABASE_URL."
+    )
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=4, help="workers per process")
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--like-back", type=float, default=0.2)
+    parser.add_argument("--p99-target-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    sys.exit(
+        asyncio.run(
+            main(
+                args.users,
+                args.processes,
+                args.concurrency,
+                args.seconds,
+                args.like_back,
+                args.p99_target_ms,
+            )
+        )
+    )
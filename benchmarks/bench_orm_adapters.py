@@ -0,0 +1,112 @@
+import argparse
+import time
+import uuid
+from datetime import date
+from typing import Callable, List
+
+import src.auth.models  # noqa: F401  # registers RefreshToken for the User mapper
+from src.user_profile.models import User, UserPhoto, UserSocialMediaLinks
+from src.user_profile.schemas import (
+    UserPhotoRead,
+    UserProfileRead,
+    UserRead,
+    UserSocialMediaLinkRead,
+)
+
+
+def make_users(count: int) -> List[User]:
+    users = []
+    for index in range(count):
+        user_id = uuid.uuid4()
+        users.append(
+            User(
+                id=user_id,
+                email=f"user{index}@mail.com",
+                hash_password="x",
+                name="Ivan",
+                surname="Ivanov",
+                date_of_birth=date(1990, 1, 1),
+                bio="Hello there",
+                gender="m",
+                country="Russia",
+                city="Moscow",
+                role="user",
+                photos=[
+                    UserPhoto(id=n, user_id=user_id, url=f"https://example.com/{n}.jpg")
+                    for n in range(3)
+                ],
+                social_media_links=[
+                    UserSocialMediaLinks(
+                        id=n, user_id=user_id, link=f"https://t.me/{n}", name="Telegram"
+                    )
+                    for n in range(2)
+                ],
+            )
+        )
+    return users
+
+
+# The converters this module replaced: keyword construction re-runs every field
+# validator, EmailStr parsing included.
+def validated_user(user: User) -> UserRead:
+    return UserRead(
+        user_id=user.id,
+        email=user.email,
+        name=user.name,
+        surname=user.surname,
+        date_of_birth=user.date_of_birth,
+        bio=user.bio,
+        gender=user.gender,
+        country=user.country,
+        city=user.city,
+        role=user.role,
+    )
+
+
+def validated_profile(user: User) -> UserProfileRead:
+    return UserProfileRead(
+        **validated_user(user).model_dump(),
+        photos=[
+            UserPhotoRead(id=photo.id, user_id=photo.user_id, url=photo.url)
+            for photo in user.photos
+        ],
+        social_media_links=[
+            UserSocialMediaLinkRead(
+                id=link.id, user_id=link.user_id, name=link.name, link=link.link
+            )
+            for link in user.social_media_links
+        ],
+    )
+
+
+def per_object_us(convert: Callable, users: List[User], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for user in users:
+            convert(user)
+    return (time.perf_counter() - started) / (rounds * len(users)) * 1_000_000
+
+
+def main(items: int, rounds: int) -> None:
+    users = make_users(items)
+    assert validated_profile(users[0]) == UserProfileRead.from_orm_obj(users[0])
+
+    print(f"{items} ORM rows, {rounds} rounds, microseconds per object")
+    for label, validated, trusted in (
+        ("UserRead", validated_user, UserRead.from_orm_obj),
+        ("UserProfileRead", validated_profile, UserProfileRead.from_orm_obj),
+    ):
+        before = per_object_us(validated, users, rounds)
+        after = per_object_us(trusted, users, rounds)
+        print(
+            f"  {label:16} validated {before:7.2f}  trusted {after:7.2f}"
+            f"  speedup {before / after:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
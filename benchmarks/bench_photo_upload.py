@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.multipart import MultipartReader
+from src.storage import LocalFileStorage
+
+BOUNDARY = b"bench-boundary"
+CHUNK_SIZE = 64 * 1024
+
+
+async def request_body(size_mb: int, seed: bytes):
+    # Mimics an ASGI server handing over the body in CHUNK_SIZE pieces; the content
+    # is generated on the fly so the benchmark itself never holds the whole file.
+    yield (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="photo.jpg"\r\n'
+        b"Content-Type: image/jpeg\r\n\r\n"
+    )
+    block = (seed * (CHUNK_SIZE // len(seed) + 1))[:CHUNK_SIZE]
+    for _ in range(size_mb * 1024 * 1024 // CHUNK_SIZE):
+        yield block
+    yield b"\r\n--" + BOUNDARY + b"--\r\n"
+
+
+async def upload(storage: LocalFileStorage, size_mb: int, seed: bytes) -> str:
+    reader = MultipartReader(request_body(size_mb, seed), BOUNDARY)
+    await reader.next_part()
+    return await storage.save(reader.read_part(), ".jpg", size_mb * 1024 * 1024)
+
+
+async def main(size_mb: int, uploads: int, max_peak_mb: float) -> int:
+    with tempfile.TemporaryDirectory() as root:
+        storage = LocalFileStorage(root, "/media")
+        tracemalloc.start()
+        started = time.perf_counter()
+        keys = set()
+        for index in range(uploads):
+            # Every other upload repeats the previous content and must be deduplicated.
+            keys.add(await upload(storage, size_mb, b"%d" % (index // 2)))
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        temp_dir = os.path.join(root, "tmp")
+        stored = sum(len(files) for path, _, files in os.walk(root) if path != temp_dir)
+
+    peak_mb = peak / 1024 / 1024
+    print(
+        f"{uploads} uploads of {size_mb} MiB: {uploads * size_mb / elapsed:.1f} MiB/s, "
+        f"peak traced memory {peak_mb:.2f} MiB (target {max_peak_mb} MiB), "
+        f"{stored} stored files for {len(keys)} distinct contents"
+    )
+    return 0 if peak_mb <= max_peak_mb and stored == len(keys) else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Streams multipart uploads into local content-addressed storage"
+    )
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--uploads", type=int, default=8)
+    parser.add_argument("--max-peak-mb", type=float, default=2.0)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.size_mb, args.uploads, args.max_peak_mb)))
@@ -0,0 +1,159 @@
+import argparse
+import time
+from datetime import date
+from typing import Annotated, Any, Dict, Optional, Type
+
+from pydantic import BaseModel, EmailStr, StringConstraints, field_validator
+
+from src.auth.schemas import RegisterRequest
+from src.user_profile.schemas import UserUpdate
+
+NameStr = Annotated[
+    str, StringConstraints(min_length=1, max_length=50, strip_whitespace=True)
+]
+GenderStr = Annotated[
+    str, StringConstraints(min_length=1, max_length=1, strip_whitespace=True)
+]
+CountryCityStr = Annotated[
+    str, StringConstraints(min_length=1, max_length=50, strip_whitespace=True)
+]
+PasswordStr = Annotated[str, StringConstraints(min_length=8)]
+
+
+# The schemas src.constraints replaced: every check below runs as a Python
+# field_validator on top of the core string constraints.
+class ValidatorRegisterRequest(BaseModel):
+    email: EmailStr
+    password: PasswordStr
+    name: NameStr
+    surname: NameStr
+    date_of_birth: date
+    bio: Optional[str] = None
+    gender: GenderStr
+    country: CountryCityStr
+    city: CountryCityStr
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, v):
+        if not v.strip():
+            raise ValueError("Password cannot be empty")
+        return v
+
+    @field_validator("gender")
+    @classmethod
+    def validate_gender(cls, v):
+        if v not in ("m", "f"):
+            raise ValueError("Gender must be m or f")
+        return v
+
+    @field_validator("bio")
+    @classmethod
+    def validate_bio(cls, v):
+        if v and len(v) > 5000:
+            raise ValueError("Bio must not exceed 5000 characters")
+        return v
+
+    @field_validator("date_of_birth")
+    @classmethod
+    def validate_date_of_birth(cls, v: date) -> date:
+        today = date.today()
+        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
+        if v > today:
+            raise ValueError("Date of birth cannot be in the future")
+        if age < 18:
+            raise ValueError("User must be at least 18 years old")
+        return v
+
+    @field_validator("country")
+    @classmethod
+    def validate_country(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("Country cannot be empty")
+        return v
+
+    @field_validator("city")
+    @classmethod
+    def validate_city(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("City cannot be empty")
+        return v
+
+
+class ValidatorUserUpdate(BaseModel):
+    email: Optional[EmailStr] = None
+    password: Optional[PasswordStr] = None
+    name: Optional[NameStr] = None
+    surname: Optional[NameStr] = None
+    date_of_birth: Optional[date] = None
+    bio: Optional[str] = None
+    gender: Optional[GenderStr] = None
+    country: Optional[CountryCityStr] = None
+    city: Optional[CountryCityStr] = None
+
+    @field_validator("gender")
+    @classmethod
+    def validate_gender(cls, v):
+        if v is not None and v not in ("m", "f"):
+            raise ValueError("Gender must be 'm' or 'f'")
+        return v
+
+    @field_validator("bio")
+    @classmethod
+    def validate_bio(cls, v):
+        if v is not None and len(v) > 5000:
+            raise ValueError("Bio must not exceed 5000 characters")
+        return v
+
+
+REGISTER_PAYLOAD = {
+    "email": "ivan@mail.com",
+    "password": "password123",
+    "name": "Ivan",
+    "surname": "Ivanov",
+    "date_of_birth": "1990-01-01",
+    "bio": "Hello there " * 20,
+    "gender": "m",
+    "country": "Russia",
+    "city": "Moscow",
+}
+UPDATE_PAYLOAD = {"name": "Petr", "bio": "Updated bio " * 20, "gender": "f"}
+
+
+def per_payload_us(
+    schema: Type[BaseModel], payload: Dict[str, Any], iterations: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        schema.model_validate(payload)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main(iterations: int) -> None:
+    print(f"{iterations} validations per schema, microseconds per payload")
+    for label, before_schema, after_schema, payload in (
+        (
+            "RegisterRequest",
+            ValidatorRegisterRequest,
+            RegisterRequest,
+            REGISTER_PAYLOAD,
+        ),
+        ("UserUpdate", ValidatorUserUpdate, UserUpdate, UPDATE_PAYLOAD),
+    ):
+        assert (
+            before_schema.model_validate(payload).model_dump()
+            == after_schema.model_validate(payload).model_dump()
+        )
+        before = per_payload_us(before_schema, payload, iterations)
+        after = per_payload_us(after_schema, payload, iterations)
+        print(
+            f"  {label:16} validators {before:6.2f}  declarative {after:6.2f}"
+            f"  speedup {before / after:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.iterations)
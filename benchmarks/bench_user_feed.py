@@ -0,0 +1,168 @@
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.auth.models  # noqa: F401  # registers RefreshToken for the User mapper
+from src.config import FEED_CANDIDATES, FEED_GENERATION_BATCH_SIZE
+from src.database import create_db_engine
+from src.feed.generator import generate_feeds
+from src.feed.service import _get_user_feed
+
+EMAIL_PREFIX = "bench_feed_"
+
+# Users are spread round-robin over the gazetteer; one in ten lives in a city that
+# is not in it and only matches on country.
+SEED_STATEMENT = f"""
+    WITH gazetteer AS (
+        SELECT array_agg(id ORDER BY id) AS ids, count(*)::int AS total FROM cities
+    )
+    INSERT INTO users (
+        id, email, hash_password, name, surname, date_of_birth, bio,
+        gender, country, city, city_id, role
+    )
+    SELECT
+        gen_random_uuid(),
+        '{EMAIL_PREFIX}' || g || '@mail.com',
+        'x',
+        'Name',
+        'Surname',
+        current_date - (18 * 365 + floor(random() * 52 * 365))::int,
+        CASE WHEN random() < 0.6 THEN 'Bio ' || g END,
+        CASE WHEN random() < 0.5 THEN 'm' ELSE 'f' END,
+        cities.country,
+        CASE WHEN g % 10 = 0 THEN 'Village' || g ELSE cities.name END,
+        CASE WHEN g % 10 = 0 THEN NULL ELSE cities.id END,
+        'user'
+    FROM generate_series(CAST(:start AS int), CAST(:stop AS int)) AS g
+    CROSS JOIN gazetteer
+    JOIN cities ON cities.id = gazetteer.ids[1 + g % gazetteer.total]
+"""
+
+
+async def seed(db_session: AsyncSession, users: int, chunk: int) -> None:
+    for start in range(1, users + 1, chunk):
+        stop = min(start + chunk - 1, users)
+        async with db_session.begin():
+            await db_session.execute(text(SEED_STATEMENT), {"start": start, "stop": stop})
+        print(f"  seeded {stop}/{users}", end="\r", flush=True)
+    print()
+    async with db_session.begin():
+        await db_session.execute(text("ANALYZE users"))
+
+
+async def cleanup(db_session: AsyncSession) -> None:
+    async with db_session.begin():
+        await db_session.execute(
+            text("DELETE FROM users WHERE email LIKE :prefix"),
+            {"prefix": f"{EMAIL_PREFIX}%"},
+        )
+
+
+async def sample_user_ids(db_session: AsyncSession, count: int) -> List:
+    async with db_session.begin():
+        db_response = await db_session.execute(
+            text("SELECT user_id FROM user_feeds TABLESAMPLE SYSTEM (1) LIMIT :count"),
+            {"count": count},
+        )
+        return db_response.scalars().all()
+
+
+async def timed_feed(
+    db_session: AsyncSession, user_id, limit: int, pages: int
+) -> List[float]:
+    viewer = SimpleNamespace(user_id=user_id)
+    timings = []
+    cursor = None
+    for _ in range(pages):
+        started = time.perf_counter()
+        page = await _get_user_feed(user_id, viewer, db_session, limit, cursor)
+        timings.append((time.perf_counter() - started) * 1000)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    return timings
+
+
+def percentile(values: List[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+async def main(
+    users: int,
+    candidates: int,
+    batch_size: int,
+    queries: int,
+    limit: int,
+    pages: int,
+    keep: bool,
+) -> int:
+    engine = create_db_engine()
+
+    async with AsyncSession(engine, expire_on_commit=False) as db_session:
+        print(f"Seeding {users} users")
+        await cleanup(db_session)
+        await seed(db_session, users, chunk=100_000)
+
+        try:
+            started = time.perf_counter()
+            generated = await generate_feeds(db_session, batch_size, candidates)
+            elapsed = time.perf_counter() - started
+            print(
+                f"Generated {generated} feeds of up to {candidates} candidates in "
+                f"{elapsed:.1f} s ({generated / elapsed:,.0f} feeds/s)"
+            )
+
+            user_ids = await sample_user_ids(db_session, queries)
+            random.Random(23).shuffle(user_ids)
+            timings: List[float] = []
+            for user_id in user_ids:
+                timings.extend(await timed_feed(db_session, user_id, limit, pages))
+            print(
+                f"{len(user_ids)} feeds, {pages} pages of {limit}, milliseconds per "
+                f"page: p50 {percentile(timings, 50):.2f}  p95 "
+                f"{percentile(timings, 95):.2f}  p99 {percentile(timings, 99):.2f}"
+            )
+        finally:
+            if not keep:
+                await cleanup(db_session)
+
+    await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seeds users into DATABASE_URL, times the feed generator and reads "
+            "GET /users/{id}/feed pages."
+        )
+    )
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--candidates", type=int, default=FEED_CANDIDATES)
+    parser.add_argument("--batch-size", type=int, default=FEED_GENERATION_BATCH_SIZE)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded users")
+    args = parser.parse_args()
+    sys.exit(
+        asyncio.run(
+            main(
+                args.users,
+                args.candidates,
+                args.batch_size,
+                args.queries,
+                args.limit,
+                args.pages,
+                args.keep,
+            )
+        )
+    )
@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.auth.models  # noqa: F401  # registers RefreshToken for the User mapper
+from src.config import USER_SEARCH_MAX_AGE
+from src.constraints import MIN_USER_AGE
+from src.database import create_db_engine
+from src.geo.models import City
+from src.user_profile.service import _search_users_nearby
+
+EMAIL_PREFIX = "bench_nearby_"
+
+# Every user lives in a gazetteer city, picked round-robin so each city holds
+# roughly users / cities profiles.
+SEED_STATEMENT = f"""
+    WITH gazetteer AS (
+        SELECT array_agg(id ORDER BY id) AS ids, count(*)::int AS total FROM cities
+    )
+    INSERT INTO users (
+        id, email, hash_password, name, surname, date_of_birth, bio,
+        gender, country, city, city_id, role
+    )
+    SELECT
+        gen_random_uuid(),
+        '{EMAIL_PREFIX}' || g || '@mail.com',
+        'x',
+        'Name',
+        'Surname',
+        current_date - (18 * 365 + floor(random() * 52 * 365))::int,
+        NULL,
+        CASE WHEN random() < 0.5 THEN 'm' ELSE 'f' END,
+        cities.country,
+        cities.name,
+        cities.id,
+        'user'
+    FROM generate_series(CAST(:start AS int), CAST(:stop AS int)) AS g
+    CROSS JOIN gazetteer
+    JOIN cities ON cities.id = gazetteer.ids[1 + g % gazetteer.total]
+"""
+
+
+async def seed(db_session: AsyncSession, users: int, chunk: int) -> None:
+    for start in range(1, users + 1, chunk):
+        stop = min(start + chunk - 1, users)
+        async with db_session.begin():
+            await db_session.execute(text(SEED_STATEMENT), {"start": start, "stop": stop})
+        print(f"  seeded {stop}/{users}", end="\r", flush=True)
+    print()
+    async with db_session.begin():
+        await db_session.execute(text("ANALYZE users"))
+
+
+async def cleanup(db_session: AsyncSession) -> None:
+    async with db_session.begin():
+        await db_session.execute(
+            text("DELETE FROM users WHERE email LIKE :prefix"),
+            {"prefix": f"{EMAIL_PREFIX}%"},
+        )
+
+
+async def timed_nearby(
+    db_session: AsyncSession,
+    city_id: int,
+    radius_km: float,
+    gender: str,
+    limit: int,
+    pages: int,
+) -> List[float]:
+    caller = SimpleNamespace(user_id=uuid4())
+    timings = []
+    cursor = None
+    for _ in range(pages):
+        started = time.perf_counter()
+        page = await _search_users_nearby(
+            caller,
+            db_session,
+            radius_km,
+            limit,
+            MIN_USER_AGE,
+            USER_SEARCH_MAX_AGE,
+            cursor,
+            gender=gender,
+            city_id=city_id,
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    return timings
+
+
+def percentile(values: List[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+async def main(
+    users: int,
+    queries: int,
+    limit: int,
+    pages: int,
+    radii: List[float],
+    p95_target_ms: float,
+    keep: bool,
+) -> int:
+    engine = create_db_engine()
+    rng = random.Random(22)
+    failed = False
+
+    async with AsyncSession(engine, expire_on_commit=False) as db_session:
+        async with db_session.begin():
+            city_ids = (await db_session.scalars(select(City.id))).all()
+
+        print(f"Seeding {users} users across {len(city_ids)} cities")
+        await cleanup(db_session)
+        await seed(db_session, users, chunk=100_000)
+
+        try:
+            print(
+                f"{queries} searches per radius, {pages} pages of {limit}, "
+                f"milliseconds per page (p95 target {p95_target_ms} ms)"
+            )
+            for radius_km in radii:
+                timings: List[float] = []
+                for _ in range(queries):
+                    timings.extend(
+                        await timed_nearby(
+                            db_session,
+                            rng.choice(city_ids),
+                            radius_km,
+                            rng.choice("mf"),
+                            limit,
+                            pages,
+                        )
+                    )
+                p95 = percentile(timings, 95)
+                failed = failed or p95 > p95_target_ms
+                print(
+                    f"  {radius_km:6.0f} km  p50 {percentile(timings, 50):7.2f}"
+                    f"  p95 {p95:7.2f}  p99 {percentile(timings, 99):7.2f}"
+                    f"  {'ok' if p95 <= p95_target_ms else 'OVER TARGET'}"
+                )
+        finally:
+            if not keep:
+                await cleanup(db_session)
+
+    await engine.dispose()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Seeds users into DATABASE_URL and times GET /users/nearby queries."
+    )
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument(
+        "--radius-km", type=float, nargs="+", default=[25.0, 100.0, 500.0, 1000.0]
+    )
+    parser.add_argument("--p95-target-ms", type=float, default=15.0)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded users")
+    args = parser.parse_args()
+    sys.exit(
+        asyncio.run(
+            main(
+                args.users,
+                args.queries,
+                args.limit,
+                args.pages,
+                args.radius_km,
+                args.p95_target_ms,
+                args.keep,
+            )
+        )
+    )
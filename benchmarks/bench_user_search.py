@@ -0,0 +1,160 @@
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.auth.models  # noqa: F401  # registers RefreshToken for the User mapper
+from src.database import create_db_engine
+from src.user_profile.dao import UserDAO
+from src.user_profile.utils import years_before
+
+EMAIL_PREFIX = "bench_search_"
+COUNTRIES = 20
+CITIES_PER_COUNTRY = 20
+
+SEED_STATEMENT = f"""
+    INSERT INTO users (
+        id, email, hash_password, name, surname, date_of_birth, bio,
+        gender, country, city, role
+    )
+    SELECT
+        gen_random_uuid(),
+        '{EMAIL_PREFIX}' || g || '@mail.com',
+        'x',
+        'Name',
+        'Surname',
+        current_date - (18 * 365 + floor(random() * 52 * 365))::int,
+        NULL,
+        CASE WHEN random() < 0.5 THEN 'm' ELSE 'f' END,
+        'Country' || (g % {COUNTRIES}),
+        'City' || (g % {COUNTRIES}) || '_' || ((g / {COUNTRIES}) % {CITIES_PER_COUNTRY}),
+        'user'
+    FROM generate_series(CAST(:start AS int), CAST(:stop AS int)) AS g
+"""
+
+
+async def seed(db_session: AsyncSession, users: int, chunk: int) -> None:
+    for start in range(1, users + 1, chunk):
+        stop = min(start + chunk - 1, users)
+        async with db_session.begin():
+            await db_session.execute(text(SEED_STATEMENT), {"start": start, "stop": stop})
+        print(f"  seeded {stop}/{users}", end="\r", flush=True)
+    print()
+    async with db_session.begin():
+        await db_session.execute(text("ANALYZE users"))
+
+
+async def cleanup(db_session: AsyncSession) -> None:
+    async with db_session.begin():
+        await db_session.execute(
+            text("DELETE FROM users WHERE email LIKE :prefix"),
+            {"prefix": f"{EMAIL_PREFIX}%"},
+        )
+
+
+def random_filters(rng: random.Random, shape: str) -> Dict:
+    today = date.today()
+    min_age = rng.randint(18, 50)
+    max_age = min_age + rng.randint(3, 15)
+    country = rng.randrange(COUNTRIES)
+    filters = {
+        "born_after": years_before(today, max_age + 1),
+        "born_on_or_before": years_before(today, min_age),
+        "gender": rng.choice("mf"),
+    }
+    if shape in ("city", "country"):
+        filters["country"] = f"Country{country}"
+    if shape == "city":
+        filters["city"] = f"City{country}_{rng.randrange(CITIES_PER_COUNTRY)}"
+    return filters
+
+
+async def timed_search(
+    db_session: AsyncSession, filters: Dict, limit: int, pages: int
+) -> List[float]:
+    timings = []
+    after = None
+    for _ in range(pages):
+        started = time.perf_counter()
+        async with db_session.begin():
+            users = await UserDAO(db_session).search_users(
+                limit=limit + 1, after=after, **filters
+            )
+        timings.append((time.perf_counter() - started) * 1000)
+        if len(users) <= limit:
+            break
+        after = (users[limit - 1].date_of_birth, users[limit - 1].id)
+    return timings
+
+
+def percentile(values: List[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+async def main(
+    users: int, queries: int, limit: int, pages: int, p95_target_ms: float, keep: bool
+) -> int:
+    engine = create_db_engine()
+    rng = random.Random(20)
+    failed = False
+
+    async with AsyncSession(engine, expire_on_commit=False) as db_session:
+        print(f"Seeding {users} users")
+        await cleanup(db_session)
+        await seed(db_session, users, chunk=100_000)
+
+        try:
+            print(
+                f"{queries} searches per shape, {pages} pages of {limit}, "
+                f"milliseconds per page (p95 target {p95_target_ms} ms)"
+            )
+            for shape in ("city", "country", "gender"):
+                timings: List[float] = []
+                for _ in range(queries):
+                    filters = random_filters(rng, shape)
+                    timings.extend(await timed_search(db_session, filters, limit, pages))
+                p95 = percentile(timings, 95)
+                failed = failed or p95 > p95_target_ms
+                print(
+                    f"  {shape:8} p50 {percentile(timings, 50):7.2f}  p95 {p95:7.2f}"
+                    f"  p99 {percentile(timings, 99):7.2f}"
+                    f"  {'ok' if p95 <= p95_target_ms else 'OVER TARGET'}"
+                )
+        finally:
+            if not keep:
+                await cleanup(db_session)
+
+    await engine.dispose()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Seeds users into DATABASE_URL and times GET /users/search queries."
+    )
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--p95-target-ms", type=float, default=10.0)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded users")
+    args = parser.parse_args()
+    sys.exit(
+        asyncio.run(
+            main(
+                args.users,
+                args.queries,
+                args.limit,
+                args.pages,
+                args.p95_target_ms,
+                args.keep,
+            )
+        )
+    )
@@ -6,6 +6,9 @@ from dotenv import load_dotenv
 from sqlalchemy import engine_from_config, pool
 
 from src.auth.models import RefreshToken  # noqa: F401
+from src.feed.models import UserFeed  # noqa: F401
+from src.geo.models import City  # noqa: F401
+from src.likes.models import Like, Match  # noqa: F401
 from src.models import Base
 from src.user_profile.models import (
     User,  # noqa: F401
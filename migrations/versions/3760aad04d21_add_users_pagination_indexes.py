@@ -0,0 +1,31 @@
+"""Add users pagination indexes
+
+Revision ID: 3760aad04d21
+Revises: 6d1aa9cf36b6
+Create Date: 2026-10-18 01:50:12.318402
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3760aad04d21"
+down_revision: Union[str, Sequence[str], None] = "6d1aa9cf36b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_users_role_id", "users", ["role", "id"], unique=False)
+    op.create_index(
+        "ix_users_country_city_id", "users", ["country", "city", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_country_city_id", table_name="users")
+    op.drop_index("ix_users_role_id", table_name="users")
@@ -0,0 +1,56 @@
+"""Add foreign key indexes
+
+Revision ID: 5a7c711fc794
+Revises: 3760aad04d21
+Create Date: 2026-10-18 02:14:37.529164
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a7c711fc794"
+down_revision: Union[str, Sequence[str], None] = "3760aad04d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_user_photo_user_id"),
+            "user_photo",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_user_social_media_links_user_id"),
+            "user_social_media_links",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_user_social_media_links_user_id"),
+            table_name="user_social_media_links",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            op.f("ix_user_photo_user_id"),
+            table_name="user_photo",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,59 @@
+"""Add likes and matches
+
+Revision ID: a7c2e4f9b318
+Revises: f3a6b8c1d257
+Create Date: 2026-10-18 19:26:37.104922
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c2e4f9b318"
+down_revision: Union[str, Sequence[str], None] = "f3a6b8c1d257"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "likes",
+        sa.Column("user_low", sa.UUID(), nullable=False),
+        sa.Column("user_high", sa.UUID(), nullable=False),
+        sa.Column("low_liked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("high_liked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_low"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_high"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_low", "user_high"),
+    )
+    op.create_index("ix_likes_user_high", "likes", ["user_high"], unique=False)
+    op.create_table(
+        "matches",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("other_id", sa.UUID(), nullable=False),
+        sa.Column("matched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("seen_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["other_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "other_id"),
+    )
+    op.create_index(
+        "ix_matches_inbox",
+        "matches",
+        ["user_id", "matched_at", "other_id"],
+        unique=False,
+    )
+    op.create_index("ix_matches_other_id", "matches", ["other_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_matches_other_id", table_name="matches")
+    op.drop_index("ix_matches_inbox", table_name="matches")
+    op.drop_table("matches")
+    op.drop_index("ix_likes_user_high", table_name="likes")
+    op.drop_table("likes")
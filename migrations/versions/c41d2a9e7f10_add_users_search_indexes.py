@@ -0,0 +1,46 @@
+"""Add users search indexes
+
+Revision ID: c41d2a9e7f10
+Revises: 5a7c711fc794
+Create Date: 2026-10-18 12:40:27.902114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d2a9e7f10"
+down_revision: Union[str, Sequence[str], None] = "5a7c711fc794"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_search_city",
+        "users",
+        ["country", "city", "gender", "date_of_birth", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_users_search_country",
+        "users",
+        ["country", "gender", "date_of_birth", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_users_search_gender",
+        "users",
+        ["gender", "date_of_birth", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_search_gender", table_name="users")
+    op.drop_index("ix_users_search_country", table_name="users")
+    op.drop_index("ix_users_search_city", table_name="users")
@@ -0,0 +1,45 @@
+"""Add users bio search
+
+Revision ID: d5e8f1a3b962
+Revises: c41d2a9e7f10
+Create Date: 2026-10-18 13:55:03.418207
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e8f1a3b962"
+down_revision: Union[str, Sequence[str], None] = "c41d2a9e7f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "bio_search",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple', coalesce(bio, ''))", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_users_bio_search",
+        "users",
+        ["bio_search"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_bio_search", table_name="users", postgresql_using="gin")
+    op.drop_column("users", "bio_search")
@@ -0,0 +1,206 @@
+"""Add cities gazetteer
+
+Revision ID: e2b7c9d04a15
+Revises: d5e8f1a3b962
+Create Date: 2026-10-18 15:12:48.230716
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c9d04a15"
+down_revision: Union[str, Sequence[str], None] = "d5e8f1a3b962"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, country, latitude, longitude) seeded by this revision. Kept inline so the
+# migration inserts the same rows however the application code changes later.
+CITIES = [
+    ("Moscow", "Russia", 55.7558, 37.6173),
+    ("Saint Petersburg", "Russia", 59.9343, 30.3351),
+    ("Novosibirsk", "Russia", 55.0084, 82.9357),
+    ("Yekaterinburg", "Russia", 56.8389, 60.6057),
+    ("Kazan", "Russia", 55.7963, 49.1088),
+    ("Nizhny Novgorod", "Russia", 56.2965, 43.9361),
+    ("Chelyabinsk", "Russia", 55.1644, 61.4368),
+    ("Krasnoyarsk", "Russia", 56.0153, 92.8932),
+    ("Samara", "Russia", 53.1959, 50.1002),
+    ("Ufa", "Russia", 54.7388, 55.9721),
+    ("Rostov-on-Don", "Russia", 47.2357, 39.7015),
+    ("Omsk", "Russia", 54.9885, 73.3242),
+    ("Krasnodar", "Russia", 45.0355, 38.9753),
+    ("Voronezh", "Russia", 51.6720, 39.1843),
+    ("Perm", "Russia", 58.0105, 56.2502),
+    ("Volgograd", "Russia", 48.7080, 44.5133),
+    ("Saratov", "Russia", 51.5336, 46.0343),
+    ("Tyumen", "Russia", 57.1530, 65.5343),
+    ("Tolyatti", "Russia", 53.5303, 49.3461),
+    ("Izhevsk", "Russia", 56.8526, 53.2045),
+    ("Barnaul", "Russia", 53.3548, 83.7698),
+    ("Ulyanovsk", "Russia", 54.3142, 48.4031),
+    ("Irkutsk", "Russia", 52.2870, 104.3050),
+    ("Khabarovsk", "Russia", 48.4802, 135.0719),
+    ("Yaroslavl", "Russia", 57.6261, 39.8845),
+    ("Vladivostok", "Russia", 43.1155, 131.8855),
+    ("Makhachkala", "Russia", 42.9849, 47.5047),
+    ("Tomsk", "Russia", 56.4977, 84.9744),
+    ("Orenburg", "Russia", 51.7682, 55.0970),
+    ("Kemerovo", "Russia", 55.3547, 86.0873),
+    ("Novokuznetsk", "Russia", 53.7596, 87.1216),
+    ("Ryazan", "Russia", 54.6269, 39.6916),
+    ("Astrakhan", "Russia", 46.3497, 48.0408),
+    ("Naberezhnye Chelny", "Russia", 55.7436, 52.3958),
+    ("Penza", "Russia", 53.2007, 45.0046),
+    ("Kirov", "Russia", 58.6036, 49.6680),
+    ("Lipetsk", "Russia", 52.6031, 39.5708),
+    ("Cheboksary", "Russia", 56.1439, 47.2489),
+    ("Kaliningrad", "Russia", 54.7104, 20.4522),
+    ("Tula", "Russia", 54.1931, 37.6173),
+    ("Kursk", "Russia", 51.7304, 36.1939),
+    ("Sochi", "Russia", 43.6028, 39.7342),
+    ("Stavropol", "Russia", 45.0428, 41.9734),
+    ("Tver", "Russia", 56.8587, 35.9176),
+    ("Magnitogorsk", "Russia", 53.4186, 59.0472),
+    ("Ivanovo", "Russia", 57.0004, 40.9739),
+    ("Bryansk", "Russia", 53.2521, 34.3717),
+    ("Belgorod", "Russia", 50.5997, 36.5983),
+    ("Surgut", "Russia", 61.2500, 73.4167),
+    ("Vladimir", "Russia", 56.1290, 40.4066),
+    ("Arkhangelsk", "Russia", 64.5401, 40.5433),
+    ("Chita", "Russia", 52.0317, 113.5009),
+    ("Kaluga", "Russia", 54.5293, 36.2754),
+    ("Smolensk", "Russia", 54.7826, 32.0453),
+    ("Kostroma", "Russia", 57.7665, 40.9269),
+    ("Vologda", "Russia", 59.2181, 39.8886),
+    ("Cherepovets", "Russia", 59.1333, 37.9000),
+    ("Oryol", "Russia", 52.9651, 36.0785),
+    ("Tambov", "Russia", 52.7213, 41.4523),
+    ("Saransk", "Russia", 54.1838, 45.1749),
+    ("Yoshkar-Ola", "Russia", 56.6344, 47.8999),
+    ("Syktyvkar", "Russia", 61.6688, 50.8364),
+    ("Petrozavodsk", "Russia", 61.7849, 34.3469),
+    ("Murmansk", "Russia", 68.9585, 33.0827),
+    ("Veliky Novgorod", "Russia", 58.5215, 31.2755),
+    ("Pskov", "Russia", 57.8136, 28.3496),
+    ("Grozny", "Russia", 43.3180, 45.6987),
+    ("Vladikavkaz", "Russia", 43.0205, 44.6819),
+    ("Nalchik", "Russia", 43.4853, 43.6071),
+    ("Pyatigorsk", "Russia", 44.0486, 43.0594),
+    ("Novorossiysk", "Russia", 44.7239, 37.7689),
+    ("Taganrog", "Russia", 47.2362, 38.8969),
+    ("Ulan-Ude", "Russia", 51.8335, 107.5841),
+    ("Yakutsk", "Russia", 62.0355, 129.6755),
+    ("Blagoveshchensk", "Russia", 50.2907, 127.5272),
+    ("Yuzhno-Sakhalinsk", "Russia", 46.9591, 142.7380),
+    ("Petropavlovsk-Kamchatsky", "Russia", 53.0452, 158.6483),
+    ("Magadan", "Russia", 59.5612, 150.8301),
+    ("Norilsk", "Russia", 69.3558, 88.1893),
+    ("Nizhnevartovsk", "Russia", 60.9344, 76.5531),
+    ("Podolsk", "Russia", 55.4312, 37.5458),
+    ("Khimki", "Russia", 55.8970, 37.4297),
+    ("Balashikha", "Russia", 55.8094, 37.9581),
+    ("Mytishchi", "Russia", 55.9116, 37.7308),
+    ("Korolyov", "Russia", 55.9142, 37.8256),
+    ("Lyubertsy", "Russia", 55.6783, 37.8936),
+    ("Krasnogorsk", "Russia", 55.8204, 37.3302),
+    ("Odintsovo", "Russia", 55.6780, 37.2777),
+    ("Zelenograd", "Russia", 55.9825, 37.1814),
+    ("Kolomna", "Russia", 55.0794, 38.7783),
+    ("Sergiyev Posad", "Russia", 56.3153, 38.1358),
+    ("Minsk", "Belarus", 53.9006, 27.5590),
+    ("Kyiv", "Ukraine", 50.4501, 30.5234),
+    ("Almaty", "Kazakhstan", 43.2220, 76.8512),
+    ("Astana", "Kazakhstan", 51.1694, 71.4491),
+    ("Tashkent", "Uzbekistan", 41.2995, 69.2401),
+    ("Bishkek", "Kyrgyzstan", 42.8746, 74.5698),
+    ("Tbilisi", "Georgia", 41.7151, 44.8271),
+    ("Yerevan", "Armenia", 40.1792, 44.4991),
+    ("Baku", "Azerbaijan", 40.4093, 49.8671),
+    ("Chisinau", "Moldova", 47.0105, 28.8638),
+    ("Riga", "Latvia", 56.9496, 24.1052),
+    ("Vilnius", "Lithuania", 54.6872, 25.2797),
+    ("Tallinn", "Estonia", 59.4370, 24.7536),
+    ("Helsinki", "Finland", 60.1699, 24.9384),
+    ("Warsaw", "Poland", 52.2297, 21.0122),
+    ("Berlin", "Germany", 52.5200, 13.4050),
+    ("Munich", "Germany", 48.1351, 11.5820),
+    ("Hamburg", "Germany", 53.5511, 9.9937),
+    ("Paris", "France", 48.8566, 2.3522),
+    ("London", "United Kingdom", 51.5074, -0.1278),
+    ("Madrid", "Spain", 40.4168, -3.7038),
+    ("Barcelona", "Spain", 41.3851, 2.1734),
+    ("Rome", "Italy", 41.9028, 12.4964),
+    ("Milan", "Italy", 45.4642, 9.1900),
+    ("Vienna", "Austria", 48.2082, 16.3738),
+    ("Prague", "Czechia", 50.0755, 14.4378),
+    ("Budapest", "Hungary", 47.4979, 19.0402),
+    ("Amsterdam", "Netherlands", 52.3676, 4.9041),
+    ("Brussels", "Belgium", 50.8503, 4.3517),
+    ("Stockholm", "Sweden", 59.3293, 18.0686),
+    ("Oslo", "Norway", 59.9139, 10.7522),
+    ("Copenhagen", "Denmark", 55.6761, 12.5683),
+    ("Lisbon", "Portugal", 38.7223, -9.1393),
+    ("Athens", "Greece", 37.9838, 23.7275),
+    ("Istanbul", "Turkey", 41.0082, 28.9784),
+    ("Belgrade", "Serbia", 44.7866, 20.4489),
+    ("Bucharest", "Romania", 44.4268, 26.1025),
+    ("Sofia", "Bulgaria", 42.6977, 23.3219),
+    ("Dubai", "United Arab Emirates", 25.2048, 55.2708),
+    ("New York", "United States", 40.7128, -74.0060),
+    ("Los Angeles", "United States", 34.0522, -118.2437),
+    ("Tokyo", "Japan", 35.6762, 139.6503),
+    ("Beijing", "China", 39.9042, 116.4074),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    cities = op.create_table(
+        "cities",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("country", sa.String(length=50), nullable=False),
+        sa.Column("latitude", sa.Float(), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_cities_country_name",
+        "cities",
+        [sa.text("lower(country)"), sa.text("lower(name)")],
+        unique=True,
+    )
+    op.create_index(
+        "ix_cities_latitude_longitude", "cities", ["latitude", "longitude"], unique=False
+    )
+    op.bulk_insert(
+        cities,
+        [
+            {"name": name, "country": country, "latitude": lat, "longitude": lon}
+            for name, country, lat, lon in CITIES
+        ],
+    )
+
+    op.add_column("users", sa.Column("city_id", sa.Integer(), nullable=True))
+    op.create_foreign_key("users_city_id_fkey", "users", "cities", ["city_id"], ["id"])
+    op.create_index("ix_users_city_id_id", "users", ["city_id", "id"], unique=False)
+    op.execute("""
+        UPDATE users SET city_id = cities.id
+        FROM cities
+        WHERE lower(cities.country) = lower(users.country)
+          AND lower(cities.name) = lower(users.city)
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_city_id_id", table_name="users")
+    op.drop_constraint("users_city_id_fkey", "users", type_="foreignkey")
+    op.drop_column("users", "city_id")
+    op.drop_index("ix_cities_latitude_longitude", table_name="cities")
+    op.drop_index("ux_cities_country_name", table_name="cities")
+    op.drop_table("cities")
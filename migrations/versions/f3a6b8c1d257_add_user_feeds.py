@@ -0,0 +1,41 @@
+"""Add user feeds
+
+Revision ID: f3a6b8c1d257
+Revises: e2b7c9d04a15
+Create Date: 2026-10-18 17:41:05.512384
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a6b8c1d257"
+down_revision: Union[str, Sequence[str], None] = "e2b7c9d04a15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_feeds",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("candidate_ids", postgresql.ARRAY(sa.UUID()), nullable=False),
+        sa.Column(
+            "generated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_feeds")
@@ -0,0 +1,26 @@
+from typing import Iterable
+
+from pydantic import TypeAdapter
+
+from src.cache import create_cache
+from src.config import (
+    REFRESH_TOKEN_STATE_CACHE_MAXSIZE,
+    REFRESH_TOKEN_STATE_CACHE_TTL_SECONDS,
+)
+
+REFRESH_TOKEN_REVOKED = "revoked"
+REFRESH_TOKEN_DELETED = "deleted"
+
+# Refresh tokens that can no longer be used, keyed by token. Active tokens are never
+# cached, so a miss always falls through to the refresh_tokens table.
+refresh_token_state_cache = create_cache(
+    "refresh_token_state",
+    TypeAdapter(str),
+    REFRESH_TOKEN_STATE_CACHE_MAXSIZE,
+    REFRESH_TOKEN_STATE_CACHE_TTL_SECONDS,
+)
+
+
+async def remember_refresh_tokens(tokens: Iterable[str], state: str) -> None:
+    for token in tokens:
+        await refresh_token_state_cache.set(token, state)
@@ -1,17 +1,51 @@
+from typing import Optional
 from uuid import UUID
 
 from fastapi import Cookie, Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import ALGORITHM, SECRET_KEY
+from src.cache import create_cache
+from src.config import (
+    ALGORITHM,
+    CURRENT_USER_CACHE_MAXSIZE,
+    CURRENT_USER_CACHE_TTL_SECONDS,
+    SECRET_KEY,
+)
 from src.database import get_async_db_session
 from src.user_profile.dao import UserDAO
 from src.user_profile.schemas import UserRead
 
 security = HTTPBearer(auto_error=False)
 
+# Principals resolved from the users table, keyed by user id. Entries are dropped by
+# the services that change or delete a user; with the in-memory backend other
+# workers may lag by the TTL.
+current_user_cache = create_cache(
+    "current_user",
+    TypeAdapter(UserRead),
+    CURRENT_USER_CACHE_MAXSIZE,
+    CURRENT_USER_CACHE_TTL_SECONDS,
+)
+
+
+async def invalidate_current_user(user_id: UUID) -> None:
+    await current_user_cache.invalidate(user_id)
+
+
+async def _load_current_user(
+    user_id: UUID, db_session: AsyncSession
+) -> Optional[UserRead]:
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        user = await user_dao.get_user_by_id(user_id)
+
+    if user is None:
+        return None
+    return UserRead.from_orm_obj(user)
+
 
 async def get_current_user(
     access_token: str = Cookie(None),
@@ -39,14 +73,24 @@ async def get_current_user(
         raise credentials_exception
 
     try:
-        user_dao = UserDAO(db_session)
-        user = await user_dao.get_user_by_id(UUID(user_id))
+        user_id = UUID(user_id)
+    except ValueError:
+        raise credentials_exception
 
-        if user is None:
-            raise credentials_exception
+    user = await current_user_cache.get_or_load(
+        user_id, lambda: _load_current_user(user_id, db_session)
+    )
+    if user is None:
+        raise credentials_exception
 
-        user_read = UserRead.from_orm_obj(user)
-        user_read.role = user_role
-        return user_read
-    finally:
-        await db_session.close()
+    return user.model_copy(update={"role": user_role})
+
+
+async def get_current_admin(
+    current_user: UserRead = Depends(get_current_user),
+) -> UserRead:
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=403, detail="Only admins can access this resource"
+        )
+    return current_user
@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from src.auth.dependencies import get_current_user
 from src.auth.schemas import (
@@ -15,8 +16,8 @@ from src.auth.schemas import (
 from src.auth.service import (
     _create_user,
     _demote_moderator,
-    _get_all_users,
-    _get_users_by_role,
+    _export_users,
+    _get_users_page,
     _login_user,
     _promote_user,
     _revoke_all_refresh_tokens_by_user,
@@ -24,17 +25,20 @@ from src.auth.service import (
     _update_access_token,
 )
 from src.config import (
+    ADMIN_USERS_MAX_PAGE_SIZE,
+    ADMIN_USERS_PAGE_SIZE,
     COOKIE_ACCESS_TOKEN_MAX_AGE,
     COOKIE_HTTPONLY,
     COOKIE_REFRESH_TOKEN_MAX_AGE,
     COOKIE_SAMESITE,
     COOKIE_SECURE,
 )
-from src.database import get_async_db_session
-from src.user_profile.schemas import UserRead
+from src.database import get_async_db_session, get_db_engine
+from src.responses import FastJSONRoute
+from src.user_profile.schemas import UserPage, UserRead
 
-auth_router = APIRouter(prefix="/auth", tags=["auth"])
-admin_router = APIRouter(prefix="/admin", tags=["admin"])
+auth_router = APIRouter(prefix="/auth", tags=["auth"], route_class=FastJSONRoute)
+admin_router = APIRouter(prefix="/admin", tags=["admin"], route_class=FastJSONRoute)
 
 
 @auth_router.post("/login", response_model=TokenResponse)
@@ -166,28 +170,68 @@ async def get_current_user_info(
     return current_user
 
 
-@admin_router.get("/users", response_model=List[UserRead])
+@admin_router.get("/users", response_model=UserPage)
 async def get_all_users(
+    limit: int = Query(ADMIN_USERS_PAGE_SIZE, ge=1, le=ADMIN_USERS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
     current_user: UserRead = Depends(get_current_user),
     db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return await _get_all_users(current_user, db_session)
+    return await _get_users_page(
+        current_user, db_session, limit, cursor, role=role, country=country, city=city
+    )
 
 
-@admin_router.get("/users/moderators", response_model=List[UserRead])
+@admin_router.get("/users/moderators", response_model=UserPage)
 async def get_moderators(
+    limit: int = Query(ADMIN_USERS_PAGE_SIZE, ge=1, le=ADMIN_USERS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
     current_user: UserRead = Depends(get_current_user),
     db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return await _get_users_by_role("moderator", current_user, db_session)
+    return await _get_users_page(
+        current_user,
+        db_session,
+        limit,
+        cursor,
+        role="moderator",
+        country=country,
+        city=city,
+    )
 
 
-@admin_router.get("/users/admins", response_model=List[UserRead])
+@admin_router.get("/users/admins", response_model=UserPage)
 async def get_admins(
+    limit: int = Query(ADMIN_USERS_PAGE_SIZE, ge=1, le=ADMIN_USERS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
     current_user: UserRead = Depends(get_current_user),
     db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return await _get_users_by_role("admin", current_user, db_session)
+    return await _get_users_page(
+        current_user, db_session, limit, cursor, role="admin", country=country, city=city
+    )
+
+
+@admin_router.get("/users/export", response_class=StreamingResponse)
+async def export_users(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    current_user: UserRead = Depends(get_current_user),
+    bind: AsyncEngine = Depends(get_db_engine),
+):
+    chunks = await _export_users(current_user, bind, format)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=users.{format}"},
+    )
 
 
 @admin_router.post("/users/{user_id}/promote", response_model=UserRead)
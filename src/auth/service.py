@@ -1,11 +1,20 @@
-from typing import List
+import csv
+import io
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 from jose import JWTError, jwt
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from src.auth.cache import (
+    REFRESH_TOKEN_DELETED,
+    REFRESH_TOKEN_REVOKED,
+    refresh_token_state_cache,
+    remember_refresh_tokens,
+)
 from src.auth.dao import RefreshTokenDAO
+from src.auth.dependencies import invalidate_current_user
 from src.auth.schemas import (
     LoginRequest,
     RefreshTokenResponse,
@@ -17,32 +26,86 @@ from src.auth.utils import (
     check_role_management_permission,
     check_view_users_permission,
     create_access_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
 )
-from src.config import ALGORITHM, SECRET_KEY
+from src.config import ALGORITHM, SECRET_KEY, USERS_EXPORT_BATCH_SIZE
+from src.database import request_session
+from src.pagination import decode_cursor, encode_cursor
+from src.user_profile.cache import invalidate_user_profile, missing_users
 from src.user_profile.dao import UserDAO
-from src.user_profile.schemas import UserRead
+from src.user_profile.schemas import UserPage, UserRead
+
+
+async def _get_users_page(
+    current_user: UserRead,
+    db_session: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+) -> UserPage:
+    check_view_users_permission(current_user)
 
+    after_id = None
+    if cursor is not None:
+        try:
+            after_id = UUID(str(decode_cursor(cursor)["id"]))
+        except (KeyError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-async def _get_all_users(
-    current_user: UserRead, db_session: AsyncSession
-) -> List[UserRead]:
-    check_view_users_permission(current_user)
     async with db_session.begin():
         user_dao = UserDAO(db_session)
-        users = await user_dao.get_all_users()
-        return [UserRead.from_orm_obj(user) for user in users]
-
+        users = await user_dao.get_users_page(
+            limit=limit + 1, after_id=after_id, role=role, country=country, city=city
+        )
 
-async def _get_users_by_role(
-    role: str, current_user: UserRead, db_session: AsyncSession
-) -> List[UserRead]:
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = encode_cursor({"id": str(users[-1].id)})
+
+    return UserPage(
+        items=[UserRead.from_orm_obj(user) for user in users], next_cursor=next_cursor
+    )
+
+
+async def _stream_users_export(
+    bind: AsyncEngine, export_format: str
+) -> AsyncIterator[str]:
+    fields = list(UserRead.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+
+    if export_format == "csv":
+        writer.writeheader()
+        yield buffer.getvalue()
+
+    async with request_session(bind) as db_session:
+        async with db_session.begin():
+            user_dao = UserDAO(db_session)
+            async for users in user_dao.stream_users(USERS_EXPORT_BATCH_SIZE):
+                if export_format == "csv":
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows(
+                        UserRead.from_orm_obj(user).model_dump(mode="json")
+                        for user in users
+                    )
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(
+                        UserRead.from_orm_obj(user).model_dump_json() + "\n"
+                        for user in users
+                    )
+
+
+async def _export_users(
+    current_user: UserRead, bind: AsyncEngine, export_format: str
+) -> AsyncIterator[str]:
     check_view_users_permission(current_user)
-    async with db_session.begin():
-        user_dao = UserDAO(db_session)
-        users = await user_dao.get_users_by_role(role)
-        return [UserRead.from_orm_obj(user) for user in users]
+    return _stream_users_export(bind, export_format)
 
 
 async def _promote_user(
@@ -58,7 +121,10 @@ async def _promote_user(
         user = await user_dao.update_user_role(user_id, "moderator")
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
-        return UserRead.from_orm_obj(user)
+
+    await invalidate_current_user(user_id)
+    await invalidate_user_profile(user_id)
+    return UserRead.from_orm_obj(user)
 
 
 async def _demote_moderator(
@@ -74,7 +140,10 @@ async def _demote_moderator(
         user = await user_dao.update_user_role(user_id, "user")
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
-        return UserRead.from_orm_obj(user)
+
+    await invalidate_current_user(user_id)
+    await invalidate_user_profile(user_id)
+    return UserRead.from_orm_obj(user)
 
 
 async def _create_tokens_by_user(
@@ -91,22 +160,30 @@ async def _login_user(body: LoginRequest, db_session: AsyncSession) -> TokenResp
         user_dao = UserDAO(db_session)
         user = await user_dao.get_user_by_email(email=body.email)
 
-        if user is None or not verify_password(body.password, user.hash_password):
+        if user is None or not await verify_password_async(
+            body.password, user.hash_password
+        ):
             raise HTTPException(status_code=400, detail="Incorrect email or password")
 
         refresh_dao = RefreshTokenDAO(db_session)
-        await refresh_dao.revoke_all_refresh_tokens_by_user(user.id)
+        revoked_tokens = await refresh_dao.revoke_all_refresh_tokens_by_user(user.id)
+
+        tokens = await _create_tokens_by_user(user.id, user.role, db_session)
 
-        return await _create_tokens_by_user(user.id, user.role, db_session)
+    await remember_refresh_tokens(
+        [revoked_token.token for revoked_token in revoked_tokens], REFRESH_TOKEN_REVOKED
+    )
+    return tokens
 
 
 async def _create_user(body: RegisterRequest, db_session: AsyncSession) -> TokenResponse:
+    hash_password = await get_password_hash_async(body.password)
     async with db_session.begin():
         user_dao = UserDAO(db_session)
         try:
             new_user = await user_dao.create_user(
                 email=body.email,
-                hash_password=get_password_hash(body.password),
+                hash_password=hash_password,
                 name=body.name,
                 surname=body.surname,
                 date_of_birth=body.date_of_birth,
@@ -115,6 +192,7 @@ async def _create_user(body: RegisterRequest, db_session: AsyncSession) -> Token
                 country=body.country,
                 city=body.city,
             )
+            missing_users.discard(new_user.id)
 
             return await _create_tokens_by_user(new_user.id, "user", db_session)
 
@@ -125,9 +203,21 @@ async def _create_user(body: RegisterRequest, db_session: AsyncSession) -> Token
                 )
 
 
+async def _check_refresh_token_state(
+    plain_refresh_token: str, revoked_detail: str
+) -> None:
+    state = await refresh_token_state_cache.get(plain_refresh_token)
+    if state == REFRESH_TOKEN_DELETED:
+        raise HTTPException(status_code=401, detail="Refresh token not found")
+    if state == REFRESH_TOKEN_REVOKED:
+        raise HTTPException(status_code=401, detail=revoked_detail)
+
+
 async def _update_access_token(
     plain_refresh_token: str, db_session: AsyncSession
 ) -> TokenResponse:
+    await _check_refresh_token_state(plain_refresh_token, "Refresh token is not active")
+
     async with db_session.begin():
         refresh_dao = RefreshTokenDAO(db_session)
         stored_refresh_token = await refresh_dao.get_refresh_token(plain_refresh_token)
@@ -156,14 +246,17 @@ async def _update_access_token(
             payload={"sub": str(user_id), "role": user.role}
         )
 
-        return TokenResponse(
-            access_token=access_token, refresh_token=new_refresh_token.token
-        )
+    await remember_refresh_tokens([plain_refresh_token], REFRESH_TOKEN_REVOKED)
+    return TokenResponse(access_token=access_token, refresh_token=new_refresh_token.token)
 
 
 async def _revoke_refresh_token(
     body: TokenRevokeRequest, db_session: AsyncSession
 ) -> RefreshTokenResponse:
+    await _check_refresh_token_state(
+        body.refresh_token, "Refresh token is already revoked"
+    )
+
     async with db_session.begin():
         refresh_dao = RefreshTokenDAO(db_session)
         stored_refresh_token = await refresh_dao.get_refresh_token(body.refresh_token)
@@ -183,7 +276,8 @@ async def _revoke_refresh_token(
 
         await refresh_dao.revoke_refresh_token(body.refresh_token)
 
-        return RefreshTokenResponse(refresh_token=body.refresh_token, active=False)
+    await remember_refresh_tokens([body.refresh_token], REFRESH_TOKEN_REVOKED)
+    return RefreshTokenResponse(refresh_token=body.refresh_token, active=False)
 
 
 async def _revoke_all_refresh_tokens_by_user(
@@ -198,6 +292,12 @@ async def _revoke_all_refresh_tokens_by_user(
         ]
 
         # cleanup: delete all revoked refresh tokens for this user
-        await refresh_dao.delete_all_revoked_refresh_tokens_by_user(user_id)
+        deleted_tokens = await refresh_dao.delete_all_revoked_refresh_tokens_by_user(
+            user_id
+        )
 
-        return responses
+    await remember_refresh_tokens(
+        [deleted_token.token for deleted_token in deleted_tokens],
+        REFRESH_TOKEN_DELETED,
+    )
+    return responses
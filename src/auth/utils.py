@@ -1,6 +1,10 @@
+import asyncio
 import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import HTTPException, status
 from jose import jwt
@@ -9,6 +13,8 @@ from passlib.context import CryptContext
 from src.config import (
     ACCESS_TOKEN_EXPIRES_MINUTES,
     ALGORITHM,
+    PASSWORD_HASH_MAX_QUEUE,
+    PASSWORD_HASH_WORKERS,
     REFRESH_TOKEN_EXPIRE_DAYS,
     SECRET_KEY,
 )
@@ -17,6 +23,74 @@ from src.user_profile.schemas import UserRead
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+# bcrypt releases the GIL, so a thread pool hashes in parallel without blocking the
+# event loop. Calls beyond max_workers + max_queue are rejected with 503.
+class PasswordHashExecutor:
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_hash_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, try again later",
+            )
+
+        submitted_at = time.perf_counter()
+
+        def timed_call():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self._record(started_at - submitted_at, time.perf_counter() - started_at)
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, timed_call)
+        finally:
+            self.in_flight -= 1
+
+    def _record(self, wait_seconds: float, hash_seconds: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.total_wait_seconds += wait_seconds
+            self.total_hash_seconds += hash_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        completed = self.completed or 1
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_seconds": self.total_wait_seconds / completed,
+            "max_wait_seconds": self.max_wait_seconds,
+            "avg_hash_seconds": self.total_hash_seconds / completed,
+        }
+
+
+password_hash_executor = PasswordHashExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, max_queue=PASSWORD_HASH_MAX_QUEUE
+)
+
+
 def create_access_token(payload: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = payload.copy()
     if expires_delta:
@@ -47,6 +121,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    return await password_hash_executor.run(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_executor.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
 def check_view_users_permission(current_user: UserRead) -> None:
     if current_user.role not in ["moderator", "admin"]:
         raise HTTPException(
@@ -0,0 +1,457 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from src.config import CACHE_BACKEND, CACHE_REDIS_POOL_SIZE, CACHE_REDIS_URL
+from src.redis_client import RedisClient, RedisError, RedisUnavailable
+
+logger = logging.getLogger("kindle.cache")
+
+
+class TTLCache:
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    # A load that overlaps an invalidation is returned to its caller but not
+    # stored, so a value read before a write never outlives that write.
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.generation
+        value = await loader()
+        if value is not None and generation == self.generation:
+            self.set(key, value)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        self.generation += 1
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def cache_key(key: Hashable) -> str:
+    if isinstance(key, tuple):
+        return ":".join(str(part) for part in key)
+    return str(key)
+
+
+# Bounded set of keys known to be missing, each remembered for ttl seconds. It is
+# exact, so a hit can be answered as a 404 without asking the database; when full,
+# the least recently seen keys are dropped and simply fall through to a real lookup.
+class NegativeCache:
+
+    def __init__(self, capacity: int, ttl: float):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._keys = TTLCache(maxsize=capacity, ttl=ttl)
+
+    def add(self, key: Hashable) -> None:
+        self._keys.set(key, True)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._keys.get(key) is not None
+
+    def discard(self, key: Hashable) -> None:
+        self._keys.delete(key)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._keys.stats()
+        stats["capacity"] = stats.pop("maxsize")
+        return stats
+
+
+# Concurrent calls for the same key share one in-flight load: the first caller runs
+# the loader and every caller that arrives meanwhile awaits its result or exception.
+class SingleFlight:
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                break
+
+            self.collapsed += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled rather than us; take over the load.
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._in_flight),
+        }
+
+
+class MemoryCache:
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        self.namespace = namespace
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        return self.local.get(cache_key(key))
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        self.local.set(cache_key(key), value)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        return await self.local.get_or_load(cache_key(key), loader)
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        values = {}
+        for key in keys:
+            value = self.local.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def _set_many(self, items: Dict[str, Any]) -> None:
+        for key, value in items.items():
+            self.local.set(key, value)
+
+    # Every key that misses goes to a single loader call, which returns the values
+    # it found by key. As in get_or_load, results are not stored if an
+    # invalidation overlapped the load.
+    async def get_or_load_many(
+        self,
+        keys: List[Hashable],
+        loader: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+    ) -> Dict[Hashable, Any]:
+        keys_by_name = {cache_key(key): key for key in keys}
+        found = await self._get_many(list(keys_by_name))
+        values = {keys_by_name[name]: value for name, value in found.items()}
+
+        missing = [key for name, key in keys_by_name.items() if name not in found]
+        if missing:
+            generation = self.local.generation
+            loaded = await loader(missing)
+            if generation == self.local.generation:
+                await self._set_many(
+                    {
+                        cache_key(key): value
+                        for key, value in loaded.items()
+                        if value is not None
+                    }
+                )
+            values.update(loaded)
+        return values
+
+    async def invalidate(self, key: Hashable) -> None:
+        self.local.delete(cache_key(key))
+
+    def clear(self) -> None:
+        self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", **self.local.stats()}
+
+
+# Values live in Redis so every worker shares them, with the in-process TTLCache
+# in front as a hot tier. Invalidations delete the shared key and are published
+# so every worker evicts its local copy too. Redis errors degrade to cache misses.
+#
+# Writers also bump a per-key version in Redis. Shared values are tagged with the
+# version read before their load and are only served while it is still current, so
+# a load that raced a write on another worker cannot republish the old value.
+class RedisCache(MemoryCache):
+
+    def __init__(
+        self,
+        namespace: str,
+        adapter: TypeAdapter,
+        client: RedisClient,
+        maxsize: int,
+        ttl: float,
+    ):
+        super().__init__(namespace, maxsize, ttl)
+        self.adapter = adapter
+        self.client = client
+        self.key_prefix = f"kindle:cache:{namespace}:"
+        self.version_prefix = f"kindle:cache-version:{namespace}:"
+        self.channel = f"kindle:invalidate:{namespace}"
+        # A version must outlive the values tagged with older ones; those are written
+        # with the cache TTL, assuming loads finish well within it.
+        self.version_ttl_ms = int(ttl * 2000)
+        self.errors = 0
+        self.skipped = 0
+        self._subscribed = False
+
+    async def _ensure_subscribed(self) -> None:
+        if not self._subscribed:
+            self._subscribed = True
+            await self.client.subscribe(self.channel, self._on_invalidation)
+
+    def _on_invalidation(self, key: Optional[str]) -> None:
+        if key is None:
+            self.local.clear()
+        else:
+            self.local.delete(key)
+
+    async def _execute_many(self, *commands: Tuple[Any, ...]) -> Optional[List[Any]]:
+        try:
+            replies = await self.client.pipeline(*commands)
+        except RedisUnavailable:
+            self.skipped += 1
+            return None
+        except (OSError, RedisError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            self.errors += 1
+            logger.warning("Redis cache %s unavailable", self.namespace, exc_info=True)
+            return None
+
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                self.errors += 1
+                logger.warning("Redis cache %s command failed: %s", self.namespace, reply)
+                return None
+        return replies
+
+    def _decode(self, raw: Optional[bytes], version: bytes) -> Optional[Any]:
+        if raw is None:
+            return None
+        tag, _, payload = raw.partition(b":")
+        if tag != version:
+            return None
+        return self.adapter.validate_json(payload)
+
+    # Returns the current values (None where missing or stale) and the versions
+    # they were read at, or None when Redis could not be reached.
+    async def _read_shared(
+        self, keys: List[str]
+    ) -> Optional[Tuple[List[Optional[Any]], List[bytes]]]:
+        replies = await self._execute_many(
+            ("MGET", *(self.key_prefix + key for key in keys)),
+            ("MGET", *(self.version_prefix + key for key in keys)),
+        )
+        if replies is None:
+            return None
+        versions = [version or b"0" for version in replies[1]]
+        return [self._decode(*item) for item in zip(replies[0], versions)], versions
+
+    def _set_command(self, key: str, value: Any, version: bytes) -> Tuple[Any, ...]:
+        return (
+            "SET",
+            self.key_prefix + key,
+            version + b":" + self.adapter.dump_json(value),
+            "PX",
+            int(self.local.ttl * 1000),
+        )
+
+    def _bump_commands(self, key: str) -> List[Tuple[Any, ...]]:
+        return [
+            ("INCR", self.version_prefix + key),
+            ("PEXPIRE", self.version_prefix + key, self.version_ttl_ms),
+        ]
+
+    async def _get_shared(self, key: str) -> Optional[Any]:
+        shared = await self._read_shared([key])
+        return None if shared is None else shared[0][0]
+
+    async def _load_shared(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        shared = await self._read_shared([key])
+        if shared is not None and shared[0][0] is not None:
+            return shared[0][0]
+
+        generation = self.local.generation
+        value = await loader()
+        if (
+            value is not None
+            and shared is not None
+            and generation == self.local.generation
+        ):
+            await self._execute_many(self._set_command(key, value, shared[1][0]))
+        return value
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        await self._ensure_subscribed()
+        key = cache_key(key)
+        return await self.local.get_or_load(key, lambda: self._get_shared(key))
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        await self._ensure_subscribed()
+        key = cache_key(key)
+        self.local.set(key, value)
+        replies = await self._execute_many(*self._bump_commands(key))
+        if replies is not None:
+            version = str(replies[0]).encode()
+            await self._execute_many(self._set_command(key, value, version))
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        await self._ensure_subscribed()
+        key = cache_key(key)
+        return await self.local.get_or_load(key, lambda: self._load_shared(key, loader))
+
+    # One pipelined round trip of SET PX commands, however many keys were loaded.
+    async def _set_shared_many(self, items: Dict[str, Any], versions: Dict[str, bytes]):
+        commands = []
+        for key, value in items.items():
+            self.local.set(key, value)
+            if key in versions:
+                commands.append(self._set_command(key, value, versions[key]))
+        if commands:
+            await self._execute_many(*commands)
+
+    async def get_or_load_many(
+        self,
+        keys: List[Hashable],
+        loader: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+    ) -> Dict[Hashable, Any]:
+        await self._ensure_subscribed()
+        keys_by_name = {cache_key(key): key for key in keys}
+        found = await self._get_many(list(keys_by_name))
+        unresolved = [name for name in keys_by_name if name not in found]
+
+        versions = {}
+        shared = await self._read_shared(unresolved) if unresolved else None
+        if shared is not None:
+            for name, value, version in zip(unresolved, *shared):
+                versions[name] = version
+                if value is not None:
+                    found[name] = value
+                    self.local.set(name, value)
+
+        values = {keys_by_name[name]: value for name, value in found.items()}
+        missing = [keys_by_name[name] for name in unresolved if name not in found]
+        if missing:
+            generation = self.local.generation
+            loaded = await loader(missing)
+            if generation == self.local.generation:
+                await self._set_shared_many(
+                    {
+                        cache_key(key): value
+                        for key, value in loaded.items()
+                        if value is not None
+                    },
+                    versions,
+                )
+            values.update(loaded)
+        return values
+
+    async def invalidate(self, key: Hashable) -> None:
+        await self._ensure_subscribed()
+        key = cache_key(key)
+        self.local.delete(key)
+        await self._execute_many(
+            *self._bump_commands(key),
+            ("DEL", self.key_prefix + key),
+            ("PUBLISH", self.channel, key),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "backend": "redis",
+            "errors": self.errors,
+            "skipped": self.skipped,
+        }
+
+
+_redis_client: Optional[RedisClient] = None
+
+
+def get_redis_client() -> RedisClient:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = RedisClient(CACHE_REDIS_URL, pool_size=CACHE_REDIS_POOL_SIZE)
+    return _redis_client
+
+
+def create_cache(
+    namespace: str, adapter: TypeAdapter, maxsize: int, ttl: float
+) -> MemoryCache:
+    if CACHE_BACKEND == "redis":
+        return RedisCache(namespace, adapter, get_redis_client(), maxsize, ttl)
+    return MemoryCache(namespace, maxsize, ttl)
@@ -14,6 +14,17 @@ port = os.getenv("POSTGRES_PORT")
 db = os.getenv("POSTGRES_DB")
 DATABASE_URL = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db}"
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
+SQL_LOG_SAMPLE_RATE = float(os.getenv("SQL_LOG_SAMPLE_RATE", 0.01))
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", 200))
+
 PATH_ENV_AUTH = pathlib.Path(__file__).parent.parent / "env" / ".env.auth"
 load_dotenv(dotenv_path=PATH_ENV_AUTH, override=False)
 
@@ -22,6 +33,56 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRES_MINUTES = 5
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 4))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+
+ADMIN_USERS_PAGE_SIZE = 50
+ADMIN_USERS_MAX_PAGE_SIZE = 200
+USERS_EXPORT_BATCH_SIZE = 1000
+USER_PROFILES_BATCH_MAX = 100
+USER_MEDIA_BATCH_MAX = 50
+USER_LOOKUP_BATCH_MAX = 100
+USER_SEARCH_PAGE_SIZE = 20
+USER_SEARCH_MAX_PAGE_SIZE = 100
+USER_SEARCH_MAX_AGE = 120
+USER_NEARBY_RADIUS_KM = 50
+USER_NEARBY_MAX_RADIUS_KM = 1000
+FEED_PAGE_SIZE = 20
+FEED_MAX_PAGE_SIZE = 100
+FEED_CANDIDATES = int(os.getenv("FEED_CANDIDATES", 200))
+FEED_GENERATION_BATCH_SIZE = int(os.getenv("FEED_GENERATION_BATCH_SIZE", 1000))
+FEED_MAX_DISTANCE_KM = float(os.getenv("FEED_MAX_DISTANCE_KM", 300))
+FEED_AGE_SPAN_YEARS = int(os.getenv("FEED_AGE_SPAN_YEARS", 10))
+MATCHES_PAGE_SIZE = 20
+MATCHES_MAX_PAGE_SIZE = 100
+MATCHES_SEEN_BATCH_MAX = 100
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+MEDIA_ROOT = pathlib.Path(
+    os.getenv("MEDIA_ROOT", pathlib.Path(__file__).parent.parent / "media")
+)
+MEDIA_URL = os.getenv("MEDIA_URL", "/media")
+PHOTO_UPLOAD_MAX_BYTES = int(os.getenv("PHOTO_UPLOAD_MAX_BYTES", 10 * 1024 * 1024))
+
+CURRENT_USER_CACHE_TTL_SECONDS = int(os.getenv("CURRENT_USER_CACHE_TTL_SECONDS", 30))
+CURRENT_USER_CACHE_MAXSIZE = int(os.getenv("CURRENT_USER_CACHE_MAXSIZE", 10_000))
+
+PROFILE_CACHE_TTL_SECONDS = int(os.getenv("PROFILE_CACHE_TTL_SECONDS", 60))
+PROFILE_CACHE_MAXSIZE = int(os.getenv("PROFILE_CACHE_MAXSIZE", 10_000))
+
+MISSING_USER_CACHE_CAPACITY = int(os.getenv("MISSING_USER_CACHE_CAPACITY", 100_000))
+MISSING_USER_CACHE_TTL_SECONDS = int(os.getenv("MISSING_USER_CACHE_TTL_SECONDS", 300))
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_REDIS_POOL_SIZE = int(os.getenv("CACHE_REDIS_POOL_SIZE", 4))
+REFRESH_TOKEN_STATE_CACHE_TTL_SECONDS = int(
+    os.getenv("REFRESH_TOKEN_STATE_CACHE_TTL_SECONDS", 3600)
+)
+REFRESH_TOKEN_STATE_CACHE_MAXSIZE = int(
+    os.getenv("REFRESH_TOKEN_STATE_CACHE_MAXSIZE", 100_000)
+)
+
 COOKIE_ACCESS_TOKEN_MAX_AGE = ACCESS_TOKEN_EXPIRES_MINUTES * 60
 COOKIE_REFRESH_TOKEN_MAX_AGE = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 COOKIE_SECURE = False
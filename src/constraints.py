@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Annotated, Any, Literal
+
+from pydantic import AfterValidator, BeforeValidator, StringConstraints
+
+BIO_MAX_LENGTH = 5000
+MIN_USER_AGE = 18
+
+
+def check_date_of_birth(v: date) -> date:
+    today = date.today()
+    age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
+    if v > today:
+        raise ValueError("Date of birth cannot be in the future")
+    if age < MIN_USER_AGE:
+        raise ValueError(f"User must be at least {MIN_USER_AGE} years old")
+    return v
+
+
+def strip_string(v: Any) -> Any:
+    return v.strip() if isinstance(v, str) else v
+
+
+def check_password_not_blank(v: str) -> str:
+    if not v.strip():
+        raise ValueError("Password cannot be empty")
+    return v
+
+
+# Field types shared by the auth and user_profile schemas. Everything except the
+# gender strip and the date-of-birth and blank-password checks is declarative, so
+# pydantic-core validates it without calling back into Python.
+NameStr = Annotated[
+    str, StringConstraints(min_length=1, max_length=50, strip_whitespace=True)
+]
+CountryCityStr = Annotated[
+    str, StringConstraints(min_length=1, max_length=50, strip_whitespace=True)
+]
+# Surrounding whitespace is stripped before the literal check, as it was when
+# gender was a stripped one-character string.
+GenderStr = Annotated[Literal["m", "f"], BeforeValidator(strip_string)]
+BioStr = Annotated[str, StringConstraints(max_length=BIO_MAX_LENGTH)]
+BirthDate = Annotated[date, AfterValidator(check_date_of_birth)]
+PasswordStr = Annotated[
+    str, StringConstraints(min_length=8), AfterValidator(check_password_not_blank)
+]
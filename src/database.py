@@ -1,14 +1,115 @@
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.config import DATABASE_URL
+from src.config import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_CACHE_SIZE,
+)
+from src.sql_logging import sql_query_logger
 
-engine = create_async_engine(DATABASE_URL, future=True, echo=True)
+_connection_checkouts: ContextVar[Optional[List[int]]] = ContextVar(
+    "connection_checkouts", default=None
+)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    counter = _connection_checkouts.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def track_connection_checkouts(bind: AsyncEngine) -> None:
+    event.listen(bind.sync_engine, "checkout", _on_checkout)
+
+
+@contextmanager
+def count_connection_checkouts() -> Iterator[List[int]]:
+    counter = [0]
+    token = _connection_checkouts.set(counter)
+    try:
+        yield counter
+    finally:
+        _connection_checkouts.reset(token)
+
+
+class PoolMetrics:
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def snapshot(self, bind: AsyncEngine) -> Dict[str, Any]:
+        pool = bind.sync_engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "timeout": pool.timeout(),
+            "checkouts": self.checkouts,
+            "avg_wait_seconds": self.total_wait_seconds / (self.checkouts or 1),
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+def create_db_engine(url: str = DATABASE_URL) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        future=True,
+        echo=DB_ECHO,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+engine = create_db_engine()
+track_connection_checkouts(engine)
+sql_query_logger.install(engine)
+pool_metrics = PoolMetrics()
 async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+# The session is bound to one connection for the whole request, so the auth
+# dependency and the handler share it and the pool is hit exactly once.
+@asynccontextmanager
+async def request_session(bind: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    requested_at = time.perf_counter()
+    async with bind.connect() as connection:
+        pool_metrics.record_wait(time.perf_counter() - requested_at)
+        async with async_session(bind=connection) as db_session:
+            yield db_session
+
+
+def get_db_engine() -> AsyncEngine:
+    return engine
+
+
 async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as db_session:
+    async with request_session(engine) as db_session:
         yield db_session
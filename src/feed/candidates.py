@@ -0,0 +1,172 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from src.config import FEED_AGE_SPAN_YEARS, FEED_MAX_DISTANCE_KM
+from src.geo.gazetteer import haversine_km
+
+AGE_WEIGHT = 0.5
+LOCATION_WEIGHT = 0.4
+BIO_WEIGHT = 0.1
+# Location score of candidates in the viewer's country that are not close enough to
+# score on distance, including those whose city is not in the gazetteer.
+SAME_COUNTRY_LOCATION_SCORE = 0.25
+DAYS_PER_YEAR = 365.25
+
+# There is no orientation field on profiles yet, so feeds pair opposite genders.
+OPPOSITE_GENDER = {"m": "f", "f": "m"}
+
+
+# Candidates of one gender, location and bio presence sorted by date of birth. Every
+# candidate in a bucket shares the location and bio parts of the score, so the best
+# ones for a viewer are those born closest to them.
+class Bucket:
+
+    def __init__(self):
+        self.birthdays = array("l")
+        self.positions = array("l")
+
+    def append(self, birthday: int, position: int) -> None:
+        self.birthdays.append(birthday)
+        self.positions.append(position)
+
+    def sort(self) -> None:
+        order = sorted(range(len(self.birthdays)), key=self.birthdays.__getitem__)
+        self.birthdays = array("l", (self.birthdays[i] for i in order))
+        self.positions = array("l", (self.positions[i] for i in order))
+
+    # (negated score, position) pairs, best first: walks outwards from the viewer's
+    # birthday until the age gap leaves the span.
+    def ranked(
+        self, birthday: int, base_score: float, span_days: int
+    ) -> Iterator[Tuple[float, int]]:
+        birthdays, positions = self.birthdays, self.positions
+        size, out_of_span = len(birthdays), span_days + 1
+        best, per_day = -(base_score + AGE_WEIGHT), AGE_WEIGHT / span_days
+        right = bisect_left(birthdays, birthday)
+        left = right - 1
+        while True:
+            left_gap = birthday - birthdays[left] if left >= 0 else out_of_span
+            right_gap = birthdays[right] - birthday if right < size else out_of_span
+            if left_gap <= right_gap:
+                gap, position = left_gap, left
+                left -= 1
+            else:
+                gap, position = right_gap, right
+                right += 1
+            if gap > span_days:
+                return
+            yield best + gap * per_day, positions[position]
+
+
+# Array-backed copy of the profile attributes the feed scores on, loaded once per
+# generation run. Buckets are merged lazily, so ranking a viewer costs the number
+# of buckets near them plus the candidates kept, not the number of users.
+class ProfileSnapshot:
+
+    def __init__(
+        self,
+        cities: Sequence[Tuple[int, float, float]],
+        max_distance_km: float = FEED_MAX_DISTANCE_KM,
+        age_span_years: int = FEED_AGE_SPAN_YEARS,
+    ):
+        if age_span_years < 1:
+            raise ValueError("FEED_AGE_SPAN_YEARS must be at least 1")
+        self.span_days = int(age_span_years * DAYS_PER_YEAR)
+
+        self.ids: List[UUID] = []
+        self.genders: List[str] = []
+        self.birthdays = array("l")
+        self.city_ids = array("l")
+        self.countries = array("l")
+        self.buckets: Dict[Tuple[str, Hashable, bool], Bucket] = {}
+
+        self.country_codes: Dict[str, int] = {}
+        # Distance scores between gazetteer cities within max_distance_km.
+        self.nearby_cities: Dict[int, List[Tuple[int, float]]] = {}
+        for city_id, latitude, longitude in cities:
+            self.nearby_cities[city_id] = [
+                (other_id, 1 - distance / max_distance_km)
+                for other_id, other_latitude, other_longitude in cities
+                if (
+                    distance := haversine_km(
+                        latitude, longitude, other_latitude, other_longitude
+                    )
+                )
+                <= max_distance_km
+            ]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _country_code(self, country: str) -> int:
+        return self.country_codes.setdefault(country, len(self.country_codes))
+
+    def add(
+        self,
+        id: UUID,
+        gender: str,
+        date_of_birth: date,
+        city_id: Optional[int],
+        country: str,
+        has_bio: bool,
+    ) -> None:
+        position = len(self.ids)
+        birthday = date_of_birth.toordinal()
+        country_code = self._country_code(country)
+
+        self.ids.append(id)
+        self.genders.append(gender)
+        self.birthdays.append(birthday)
+        self.city_ids.append(city_id or 0)
+        self.countries.append(country_code)
+
+        # Everyone is also in their country's bucket, which scores the whole country
+        # at once instead of one stream per city.
+        locations = [("country", country_code)]
+        if city_id:
+            locations.append(("city", city_id))
+        for location in locations:
+            bucket = self.buckets.setdefault((gender, location, bool(has_bio)), Bucket())
+            bucket.append(birthday, position)
+
+    def build(self) -> None:
+        for bucket in self.buckets.values():
+            bucket.sort()
+
+    def _locations(self, position: int) -> Dict[Hashable, float]:
+        locations: Dict[Hashable, float] = {
+            ("country", self.countries[position]): SAME_COUNTRY_LOCATION_SCORE
+        }
+        for city_id, score in self.nearby_cities.get(self.city_ids[position], []):
+            locations[("city", city_id)] = score
+        return locations
+
+    def candidates_for(self, position: int, limit: int) -> List[UUID]:
+        gender = OPPOSITE_GENDER.get(self.genders[position])
+        if gender is None:
+            return []
+
+        birthday = self.birthdays[position]
+        streams = []
+        for location, location_score in self._locations(position).items():
+            for has_bio in (True, False):
+                bucket = self.buckets.get((gender, location, has_bio))
+                if bucket is not None:
+                    base_score = LOCATION_WEIGHT * location_score + BIO_WEIGHT * has_bio
+                    streams.append(bucket.ranked(birthday, base_score, self.span_days))
+
+        # A candidate near the viewer is in both a city and the country bucket; the
+        # merge yields the better score first, so later repeats are dropped.
+        seen: Set[int] = set()
+        candidates: List[UUID] = []
+        for _, position in heapq.merge(*streams):
+            if len(candidates) == limit:
+                break
+            if position not in seen:
+                seen.add(position)
+                candidates.append(self.ids[position])
+        return candidates
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row, bindparam, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.feed.models import UserFeed
+from src.user_profile.models import User
+
+# Feeds are computed from a snapshot that can be minutes old, so users deleted since
+# then are skipped instead of failing the user_feeds foreign key for the whole batch.
+SAVE_FEED_STATEMENT = text("""
+    INSERT INTO user_feeds (user_id, candidate_ids)
+    SELECT :user_id, :candidate_ids
+    WHERE EXISTS (SELECT 1 FROM users WHERE users.id = :user_id)
+    ON CONFLICT (user_id) DO UPDATE SET
+        candidate_ids = excluded.candidate_ids,
+        generated_at = now()
+    """).bindparams(
+    bindparam("user_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("candidate_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+)
+
+
+class FeedDAO:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    # Only the attributes the candidate generator scores on, streamed in id order.
+    async def stream_profiles(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        db_query = (
+            select(
+                User.id,
+                User.gender,
+                User.date_of_birth,
+                User.city_id,
+                func.lower(User.country),
+                User.bio.is_not(None),
+            )
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        db_response = await self.db_session.stream(db_query)
+        async for rows in db_response.partitions():
+            yield rows
+
+    async def save_feeds(self, feeds: List[Tuple[UUID, List[UUID]]]) -> None:
+        await self.db_session.execute(
+            SAVE_FEED_STATEMENT,
+            [
+                {"user_id": user_id, "candidate_ids": candidate_ids}
+                for user_id, candidate_ids in feeds
+            ],
+        )
+
+    # Postgres arrays are 1-based and slices include both ends.
+    async def get_feed_page(
+        self, user_id: UUID, offset: int, limit: int
+    ) -> Optional[Tuple[List[UUID], datetime, int]]:
+        db_query = select(
+            UserFeed.candidate_ids[offset + 1 : offset + limit],
+            UserFeed.generated_at,
+            func.cardinality(UserFeed.candidate_ids),
+        ).where(UserFeed.user_id == user_id)
+        db_response = await self.db_session.execute(db_query)
+        row = db_response.one_or_none()
+        if row is None:
+            return None
+        candidate_ids, generated_at, total = row
+        return list(candidate_ids or []), generated_at, total
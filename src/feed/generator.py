@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.auth.models  # noqa: F401  # registers RefreshToken for the User mapper
+from src.config import FEED_CANDIDATES, FEED_GENERATION_BATCH_SIZE
+from src.database import async_session
+from src.feed.candidates import ProfileSnapshot
+from src.feed.dao import FeedDAO
+from src.geo.dao import CityDAO
+
+logger = logging.getLogger("kindle.feed")
+
+
+async def load_snapshot(db_session: AsyncSession, batch_size: int) -> ProfileSnapshot:
+    async with db_session.begin():
+        cities = await CityDAO(db_session).get_all_cities()
+        snapshot = ProfileSnapshot(
+            [(city.id, city.latitude, city.longitude) for city in cities]
+        )
+        async for rows in FeedDAO(db_session).stream_profiles(batch_size):
+            for row in rows:
+                snapshot.add(*row)
+    snapshot.build()
+    return snapshot
+
+
+# Rewrites every user's feed, one transaction per batch so readers keep seeing the
+# previous list until its replacement is committed.
+async def generate_feeds(
+    db_session: AsyncSession,
+    batch_size: int = FEED_GENERATION_BATCH_SIZE,
+    candidates: int = FEED_CANDIDATES,
+) -> int:
+    snapshot = await load_snapshot(db_session, batch_size)
+
+    for start in range(0, len(snapshot), batch_size):
+        positions = range(start, min(start + batch_size, len(snapshot)))
+        feeds = [
+            (snapshot.ids[position], snapshot.candidates_for(position, candidates))
+            for position in positions
+        ]
+        async with db_session.begin():
+            await FeedDAO(db_session).save_feeds(feeds)
+    return len(snapshot)
+
+
+# A failed run is logged and retried on the next interval rather than stopping the
+# loop; a one-off run still exits with the error.
+async def main(interval_seconds: float) -> None:
+    while True:
+        started = time.perf_counter()
+        try:
+            async with async_session() as db_session:
+                generated = await generate_feeds(db_session)
+        except Exception:
+            if interval_seconds <= 0:
+                raise
+            logger.exception("Feed generation failed")
+        else:
+            logger.info(
+                "Generated %d feeds in %.1f s", generated, time.perf_counter() - started
+            )
+        if interval_seconds <= 0:
+            return
+        await asyncio.sleep(interval_seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Precomputes ranked candidate lists for GET /users/{id}/feed."
+    )
+    parser.add_argument(
+        "--interval-seconds",
+        type=float,
+        default=0,
+        help="regenerate every N seconds instead of running once",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args.interval_seconds))
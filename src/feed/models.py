@@ -0,0 +1,27 @@
+import uuid
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import UUID, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import Base
+
+
+# Ranked candidates written by src.feed.generator. A feed page is a slice of
+# candidate_ids, so reading it costs the page size however large the table is.
+class UserFeed(Base):
+    __tablename__ = "user_feeds"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    candidate_ids: Mapped[List[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)), nullable=False
+    )
+    generated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,27 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import get_current_user
+from src.config import FEED_MAX_PAGE_SIZE, FEED_PAGE_SIZE
+from src.database import get_async_db_session
+from src.feed.service import _get_user_feed
+from src.responses import FastJSONRoute
+from src.user_profile.schemas import UserCardPage, UserRead
+
+feed_router = APIRouter(prefix="/users", tags=["feed"], route_class=FastJSONRoute)
+
+
+@feed_router.get(
+    "/{user_id}/feed", response_model=UserCardPage, status_code=status.HTTP_200_OK
+)
+async def get_user_feed(
+    user_id: UUID,
+    limit: int = Query(FEED_PAGE_SIZE, ge=1, le=FEED_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _get_user_feed(user_id, current_user, db_session, limit, cursor)
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.feed.dao import FeedDAO
+from src.pagination import decode_cursor, encode_cursor
+from src.user_profile.cache import missing_users, user_cache
+from src.user_profile.schemas import UserCard, UserCardPage, UserRead
+from src.user_profile.service import _load_users_by_ids
+
+
+async def _get_user_feed(
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> UserCardPage:
+    if current_user.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view your own feed",
+        )
+
+    offset, generated_at = 0, None
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        try:
+            offset = int(values["offset"])
+            generated_at = datetime.fromisoformat(values["generated_at"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if offset < 0:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async with db_session.begin():
+        feed_dao = FeedDAO(db_session)
+        page = await feed_dao.get_feed_page(user_id, offset, limit)
+
+    if page is None:
+        return UserCardPage(items=[], next_cursor=None)
+
+    candidate_ids, feed_generated_at, total = page
+    if generated_at is not None and generated_at != feed_generated_at:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Feed has been regenerated, start again from the first page",
+        )
+
+    # Candidates deleted since the feed was generated are skipped.
+    users = await user_cache.get_or_load_many(
+        [id for id in candidate_ids if id not in missing_users],
+        lambda ids: _load_users_by_ids(ids, db_session),
+    )
+
+    next_cursor = None
+    if offset + limit < total:
+        next_cursor = encode_cursor(
+            {"offset": offset + limit, "generated_at": feed_generated_at.isoformat()}
+        )
+
+    return UserCardPage(
+        items=[UserCard.from_user(users[id]) for id in candidate_ids if id in users],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,53 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.geo.models import City
+from src.user_profile.models import User
+
+
+# Scalar subquery resolving free-text country and city to a gazetteer id, so the
+# INSERT or UPDATE that writes them sets users.city_id in the same statement.
+def city_id_subquery(country, city):
+    return (
+        select(City.id)
+        .where(
+            func.lower(City.country) == func.lower(country),
+            func.lower(City.name) == func.lower(city),
+        )
+        .scalar_subquery()
+    )
+
+
+class CityDAO:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_city_by_id(self, city_id: int) -> Optional[City]:
+        db_query = select(City).where(City.id == city_id)
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalar_one_or_none()
+
+    async def get_city_of_user(self, user_id: UUID) -> Optional[City]:
+        db_query = (
+            select(City).join(User, User.city_id == City.id).where(User.id == user_id)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalar_one_or_none()
+
+    async def get_cities_in_box(
+        self, min_lat: float, max_lat: float, min_lon: float, max_lon: float
+    ) -> List[City]:
+        db_query = select(City).where(
+            City.latitude.between(min_lat, max_lat),
+            City.longitude.between(min_lon, max_lon),
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
+    async def get_all_cities(self) -> List[City]:
+        db_query = select(City).order_by(City.id)
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
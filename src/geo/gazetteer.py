@@ -0,0 +1,37 @@
+import math
+from typing import Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+# Derived from the same radius as haversine_km, so a bounding box never cuts off
+# points that are within the radius along a meridian.
+KM_PER_DEGREE_LATITUDE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+# (min_lat, max_lat, min_lon, max_lon) enclosing every point within radius_km.
+# Boxes that reach a pole or cross the antimeridian span every longitude.
+def bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> Tuple[float, float, float, float]:
+    d_lat = radius_km / KM_PER_DEGREE_LATITUDE
+    min_lat, max_lat = latitude - d_lat, latitude + d_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    d_lon = radius_km / (
+        KM_PER_DEGREE_LATITUDE * math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    )
+    min_lon, max_lon = longitude - d_lon, longitude + d_lon
+    if min_lon < -180 or max_lon > 180:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, min_lon, max_lon
@@ -0,0 +1,26 @@
+from sqlalchemy import Float, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import Base
+
+
+# Offline gazetteer seeded by migration e2b7c9d04a15. Users point at it through
+# users.city_id whenever their free-text country and city match an entry.
+class City(Base):
+    __tablename__ = "cities"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    country: Mapped[str] = mapped_column(String(50), nullable=False)
+    latitude: Mapped[float] = mapped_column(Float, nullable=False)
+    longitude: Mapped[float] = mapped_column(Float, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ux_cities_country_name",
+            func.lower(country),
+            func.lower(name),
+            unique=True,
+        ),
+        Index("ix_cities_latitude_longitude", "latitude", "longitude"),
+    )
@@ -0,0 +1,39 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from src.auth.cache import refresh_token_state_cache
+from src.auth.dependencies import current_user_cache, get_current_admin
+from src.auth.utils import password_hash_executor
+from src.database import engine, pool_metrics
+from src.responses import FastJSONRoute
+from src.user_profile.cache import PROFILE_CACHES, missing_users, profile_loads
+
+# Operational metrics expose pool, executor and cache internals, so every route here
+# is admin-only; include_in_schema=False merely keeps them out of the public docs.
+internal_router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(get_current_admin)],
+    route_class=FastJSONRoute,
+)
+
+
+@internal_router.get("/metrics/db-pool")
+async def get_db_pool_metrics() -> Dict[str, Any]:
+    return pool_metrics.snapshot(engine)
+
+
+@internal_router.get("/metrics/password-hash")
+async def get_password_hash_metrics() -> Dict[str, Any]:
+    return password_hash_executor.stats()
+
+
+@internal_router.get("/metrics/caches")
+async def get_cache_metrics() -> Dict[str, Any]:
+    caches = [current_user_cache, refresh_token_state_cache, *PROFILE_CACHES]
+    metrics = {cache.namespace: cache.stats() for cache in caches}
+    metrics["profile_loads"] = profile_loads.stats()
+    metrics["missing_users"] = missing_users.stats()
+    return metrics
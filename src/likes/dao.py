@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Boolean, bindparam, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.likes.models import Match
+from src.user_profile.dao import uuid_array
+
+# Records the like and, if the other user already liked back, the match rows of both
+# users, in one statement. SQLAlchemy never caches compiled ON CONFLICT inserts, so
+# this hot path is a text statement compiled once.
+LIKE_STATEMENT = (
+    text("""
+        WITH liked AS (
+            INSERT INTO likes (user_low, user_high, low_liked_at, high_liked_at)
+            VALUES (
+                :user_low,
+                :user_high,
+                CASE WHEN :by_low THEN now() END,
+                CASE WHEN NOT :by_low THEN now() END
+            )
+            ON CONFLICT (user_low, user_high) DO UPDATE SET
+                low_liked_at = coalesce(likes.low_liked_at, excluded.low_liked_at),
+                high_liked_at = coalesce(likes.high_liked_at, excluded.high_liked_at)
+            RETURNING user_low, user_high, low_liked_at, high_liked_at
+        ), mutual AS (
+            SELECT
+                user_low, user_high, greatest(low_liked_at, high_liked_at) AS matched_at
+            FROM liked
+            WHERE low_liked_at IS NOT NULL AND high_liked_at IS NOT NULL
+        ), matched AS (
+            INSERT INTO matches (user_id, other_id, matched_at)
+            SELECT user_low, user_high, matched_at FROM mutual
+            UNION ALL
+            SELECT user_high, user_low, matched_at FROM mutual
+            ON CONFLICT DO NOTHING
+        )
+        SELECT EXISTS (SELECT 1 FROM mutual) AS matched
+        """)
+    .bindparams(
+        bindparam("user_low", type_=PG_UUID(as_uuid=True)),
+        bindparam("user_high", type_=PG_UUID(as_uuid=True)),
+        bindparam("by_low", type_=Boolean),
+    )
+    .columns(matched=Boolean)
+)
+
+
+class LikeDAO:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    # Returns whether the pair is matched after the like.
+    async def like(self, user_id: UUID, other_id: UUID) -> bool:
+        user_low, user_high = sorted((user_id, other_id))
+        try:
+            db_response = await self.db_session.execute(
+                LIKE_STATEMENT,
+                {
+                    "user_low": user_low,
+                    "user_high": user_high,
+                    "by_low": user_id == user_low,
+                },
+            )
+            return db_response.scalar_one()
+
+        except IntegrityError as error:
+            if "foreign key constraint" in str(error.orig):
+                raise ValueError(f"User with id {other_id} doesn't exist")
+            raise
+
+    async def get_matches_page(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Match]:
+        db_query = select(Match).where(Match.user_id == user_id)
+        if after is not None:
+            db_query = db_query.where(tuple_(Match.matched_at, Match.other_id) < after)
+        db_query = db_query.order_by(
+            Match.matched_at.desc(), Match.other_id.desc()
+        ).limit(limit)
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
+    # Returns the ids acknowledged by this call; matches seen before are skipped.
+    async def mark_matches_seen(self, user_id: UUID, other_ids: List[UUID]) -> List[UUID]:
+        db_query = (
+            update(Match)
+            .where(
+                Match.user_id == user_id,
+                Match.other_id == uuid_array("other_ids", other_ids),
+                Match.seen_at.is_(None),
+            )
+            .values(seen_at=func.now())
+            .returning(Match.other_id)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import UUID, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import Base
+
+
+# Both directions of a pair share one row keyed by (user_low, user_high), the two
+# ids in sorted order. Liking and checking for the like back are then a single
+# upsert on the primary key, and concurrent likes of a pair serialise on its row.
+class Like(Base):
+    __tablename__ = "likes"
+
+    user_low: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_high: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    low_liked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    high_liked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (Index("ix_likes_user_high", "user_high"),)
+
+
+# One row per participant, so each user's inbox is a range of their own rows.
+class Match(Base):
+    __tablename__ = "matches"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    other_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    matched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    seen_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        Index("ix_matches_inbox", "user_id", "matched_at", "other_id"),
+        Index("ix_matches_other_id", "other_id"),
+    )
@@ -0,0 +1,48 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import get_current_user
+from src.config import MATCHES_MAX_PAGE_SIZE, MATCHES_PAGE_SIZE
+from src.database import get_async_db_session
+from src.likes.schemas import LikeRead, MatchesSeenRequest, MatchesSeenResult, MatchPage
+from src.likes.service import _get_matches, _like_user, _mark_matches_seen
+from src.responses import FastJSONRoute
+from src.user_profile.schemas import UserRead
+
+likes_router = APIRouter(prefix="/likes", tags=["likes"], route_class=FastJSONRoute)
+matches_router = APIRouter(prefix="/matches", tags=["likes"], route_class=FastJSONRoute)
+
+
+# Idempotent: liking someone again keeps the original like and reports the current
+# match state.
+@likes_router.put("/{user_id}", response_model=LikeRead, status_code=status.HTTP_200_OK)
+async def like_user(
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _like_user(user_id, current_user, db_session)
+
+
+@matches_router.get("", response_model=MatchPage, status_code=status.HTTP_200_OK)
+async def get_matches(
+    limit: int = Query(MATCHES_PAGE_SIZE, ge=1, le=MATCHES_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _get_matches(current_user, db_session, limit, cursor)
+
+
+@matches_router.post(
+    "/seen", response_model=MatchesSeenResult, status_code=status.HTTP_200_OK
+)
+async def mark_matches_seen(
+    body: MatchesSeenRequest,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _mark_matches_seen(body, current_user, db_session)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.config import MATCHES_SEEN_BATCH_MAX
+from src.user_profile.schemas import UserCard
+
+
+class LikeRead(BaseModel):
+    user_id: UUID
+    matched: bool
+
+
+class MatchRead(BaseModel):
+    user: UserCard
+    matched_at: datetime
+    seen: bool
+
+
+class MatchPage(BaseModel):
+    items: List[MatchRead]
+    next_cursor: Optional[str] = None
+
+
+class MatchesSeenRequest(BaseModel):
+    user_ids: List[UUID] = Field(min_length=1, max_length=MATCHES_SEEN_BATCH_MAX)
+
+
+class MatchesSeenResult(BaseModel):
+    acknowledged: List[UUID]
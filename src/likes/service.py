@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.likes.dao import LikeDAO
+from src.likes.schemas import (
+    LikeRead,
+    MatchesSeenRequest,
+    MatchesSeenResult,
+    MatchPage,
+    MatchRead,
+)
+from src.pagination import decode_cursor, encode_cursor
+from src.user_profile.cache import missing_users, user_cache
+from src.user_profile.schemas import UserCard, UserRead
+from src.user_profile.service import _load_users_by_ids
+
+
+async def _like_user(
+    user_id: UUID, current_user: UserRead, db_session: AsyncSession
+) -> LikeRead:
+    if user_id == current_user.user_id:
+        raise HTTPException(status_code=400, detail="You cannot like yourself")
+
+    async with db_session.begin():
+        like_dao = LikeDAO(db_session)
+        try:
+            matched = await like_dao.like(current_user.user_id, user_id)
+        except ValueError as error:
+            raise HTTPException(status_code=404, detail=str(error))
+
+    return LikeRead(user_id=user_id, matched=matched)
+
+
+async def _get_matches(
+    current_user: UserRead,
+    db_session: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> MatchPage:
+    after = None
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        try:
+            after = (datetime.fromisoformat(values["matched_at"]), UUID(values["id"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async with db_session.begin():
+        like_dao = LikeDAO(db_session)
+        matches = await like_dao.get_matches_page(
+            current_user.user_id, limit=limit + 1, after=after
+        )
+
+    next_cursor = None
+    if len(matches) > limit:
+        matches = matches[:limit]
+        next_cursor = encode_cursor(
+            {
+                "matched_at": matches[-1].matched_at.isoformat(),
+                "id": str(matches[-1].other_id),
+            }
+        )
+
+    users = await user_cache.get_or_load_many(
+        [match.other_id for match in matches if match.other_id not in missing_users],
+        lambda ids: _load_users_by_ids(ids, db_session),
+    )
+    return MatchPage(
+        items=[
+            MatchRead(
+                user=UserCard.from_user(users[match.other_id]),
+                matched_at=match.matched_at,
+                seen=match.seen_at is not None,
+            )
+            for match in matches
+            if match.other_id in users
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+async def _mark_matches_seen(
+    body: MatchesSeenRequest, current_user: UserRead, db_session: AsyncSession
+) -> MatchesSeenResult:
+    async with db_session.begin():
+        like_dao = LikeDAO(db_session)
+        acknowledged = await like_dao.mark_matches_seen(
+            current_user.user_id, list(dict.fromkeys(body.user_ids))
+        )
+
+    return MatchesSeenResult(acknowledged=acknowledged)
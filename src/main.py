@@ -2,16 +2,26 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRouter
+from fastapi.staticfiles import StaticFiles
 
 from src.auth.router import admin_router, auth_router
+from src.config import MEDIA_ROOT, MEDIA_URL
+from src.feed.router import feed_router
+from src.internal.router import internal_router
+from src.likes.router import likes_router, matches_router
+from src.responses import FastJSONResponse, FastJSONRoute
 from src.user_profile.router import users_router
 
-main_api_router = APIRouter()
+main_api_router = APIRouter(route_class=FastJSONRoute)
 main_api_router.include_router(admin_router)
 main_api_router.include_router(auth_router)
 main_api_router.include_router(users_router)
+main_api_router.include_router(feed_router)
+main_api_router.include_router(likes_router)
+main_api_router.include_router(matches_router)
+main_api_router.include_router(internal_router)
 
-app = FastAPI(title="Kindle")
+app = FastAPI(title="Kindle", default_response_class=FastJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:8000"],
@@ -21,5 +31,10 @@ app.add_middleware(
 )
 app.include_router(main_api_router)
 
+# Local storage is served by the app itself; with an external MEDIA_URL (a CDN or
+# object store) the files are served from there instead.
+if MEDIA_URL.startswith("/"):
+    app.mount(MEDIA_URL, StaticFiles(directory=MEDIA_ROOT, check_dir=False), name="media")
+
 if __name__ == "__main__":
     uvicorn.run(app, host="localhost", port=8000)
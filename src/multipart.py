@@ -0,0 +1,130 @@
+import re
+from typing import AsyncIterator, Dict, Optional
+
+MAX_PART_HEADER_BYTES = 16 * 1024
+
+OPTION_PATTERN = re.compile(r';\s*([\w*-]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+class MultipartError(ValueError):
+    pass
+
+
+def parse_options(value: str) -> Dict[str, str]:
+    options = {}
+    for key, raw in OPTION_PATTERN.findall(";" + value.partition(";")[2]):
+        raw = raw.strip()
+        if raw.startswith('"'):
+            raw = re.sub(r"\\(.)", r"\1", raw[1:-1])
+        options[key.lower()] = raw
+    return options
+
+
+def parse_boundary(content_type: Optional[str]) -> bytes:
+    media_type = (content_type or "").partition(";")[0].strip().lower()
+    if media_type != "multipart/form-data":
+        raise MultipartError("Expected a multipart/form-data body")
+
+    boundary = parse_options(content_type).get("boundary", "")
+    if not 1 <= len(boundary) <= 70:
+        raise MultipartError("Missing or invalid multipart boundary")
+    return boundary.encode("latin-1")
+
+
+class MultipartPart:
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+        disposition = parse_options(headers.get("content-disposition", ""))
+        self.name = disposition.get("name")
+        self.filename = disposition.get("filename")
+        self.content_type = headers.get("content-type")
+
+
+# Incremental multipart/form-data reader (RFC 7578). Request bodies are consumed chunk
+# by chunk and part bodies are handed out the same way, so at most one chunk plus a
+# boundary's worth of bytes is held in memory regardless of the upload size.
+class MultipartReader:
+
+    def __init__(self, chunks: AsyncIterator[bytes], boundary: bytes):
+        self._chunks = chunks.__aiter__()
+        # Leading CRLF lets the opening boundary match the same delimiter as the rest.
+        self._buffer = bytearray(b"\r\n")
+        self._delimiter = b"\r\n--" + boundary
+        self._in_part = False
+        self._finished = False
+
+    async def _fill(self) -> None:
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            raise MultipartError("Unexpected end of multipart body")
+        self._buffer += chunk
+
+    async def _find(self, marker: bytes, limit: int) -> int:
+        while True:
+            index = self._buffer.find(marker)
+            if index >= 0:
+                return index
+            if len(self._buffer) > limit:
+                raise MultipartError("Multipart headers are too large")
+            await self._fill()
+
+    async def next_part(self) -> Optional[MultipartPart]:
+        if self._in_part:
+            async for _ in self.read_part():
+                pass
+        if self._finished:
+            return None
+
+        # Skip the preamble (or an unread part body) up to the next delimiter.
+        while (index := self._buffer.find(self._delimiter)) < 0:
+            del self._buffer[: max(len(self._buffer) - len(self._delimiter), 0)]
+            await self._fill()
+        del self._buffer[: index + len(self._delimiter)]
+
+        while len(self._buffer) < 2:
+            await self._fill()
+        if self._buffer.startswith(b"--"):
+            self._finished = True
+            return None
+
+        line_end = await self._find(b"\r\n", MAX_PART_HEADER_BYTES)
+        del self._buffer[: line_end + 2]
+
+        while len(self._buffer) < 2:
+            await self._fill()
+        if self._buffer.startswith(b"\r\n"):
+            raw_headers = b""
+            del self._buffer[:2]
+        else:
+            headers_end = await self._find(b"\r\n\r\n", MAX_PART_HEADER_BYTES)
+            raw_headers = bytes(self._buffer[:headers_end])
+            del self._buffer[: headers_end + 4]
+
+        headers = {}
+        for line in raw_headers.decode("utf-8", "replace").split("\r\n"):
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise MultipartError("Malformed multipart header")
+            headers[name.strip().lower()] = value.strip()
+
+        self._in_part = True
+        return MultipartPart(headers)
+
+    async def read_part(self) -> AsyncIterator[bytes]:
+        if not self._in_part:
+            return
+        keep = len(self._delimiter) - 1
+        while True:
+            index = self._buffer.find(self._delimiter)
+            if index >= 0:
+                if index:
+                    yield bytes(self._buffer[:index])
+                    del self._buffer[:index]
+                self._in_part = False
+                return
+            if len(self._buffer) > keep:
+                yield bytes(self._buffer[:-keep])
+                del self._buffer[:-keep]
+            await self._fill()
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger("kindle.redis")
+
+RECONNECT_DELAY_SECONDS = 1.0
+FAILURE_BACKOFF_SECONDS = 0.5
+MAX_FAILURE_BACKOFF_SECONDS = 30.0
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisUnavailable(RedisError):
+    pass
+
+
+def encode_command(*args: Any) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readuntil(b"\r\n")
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix == b"+":
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        raise RedisError(payload.decode("utf-8"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length == -1:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length == -1:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+
+    raise RedisError(f"Unexpected reply prefix {prefix!r}")
+
+
+# Minimal RESP2 client: a small pool of command connections and one subscriber
+# connection that dispatches pub/sub messages to registered handlers. After a
+# connection failure, commands fail fast with RedisUnavailable for an exponentially
+# growing backoff window, so an outage costs callers nothing but a cache miss.
+class RedisClient:
+
+    def __init__(self, url: str, timeout: float = 1.0, pool_size: int = 4):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: List[Connection] = []
+        self.failures = 0
+        self._retry_at = 0.0
+
+        self._handlers: Dict[str, List[Callable[[Optional[str]], None]]] = {}
+        self._subscriber_task: Optional[asyncio.Task] = None
+        self._subscriber_writer: Optional[asyncio.StreamWriter] = None
+        self._closing = False
+
+    async def _open(self) -> Connection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        if self.password:
+            await self._call(reader, writer, "AUTH", self.password)
+        if self.db:
+            await self._call(reader, writer, "SELECT", self.db)
+        return reader, writer
+
+    @staticmethod
+    async def _call(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter, *args: Any
+    ) -> Any:
+        writer.write(encode_command(*args))
+        await writer.drain()
+        return await read_reply(reader)
+
+    # Error replies are returned in place so one failing command does not leave the
+    # replies of the others unread on the connection.
+    @staticmethod
+    async def _pipeline(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        commands: Tuple[Tuple[Any, ...], ...],
+    ) -> List[Any]:
+        writer.write(b"".join(encode_command(*command) for command in commands))
+        await writer.drain()
+        replies = []
+        for _ in commands:
+            try:
+                replies.append(await read_reply(reader))
+            except RedisError as error:
+                replies.append(error)
+        return replies
+
+    def _check_available(self) -> None:
+        if self.failures and time.monotonic() < self._retry_at:
+            raise RedisUnavailable(
+                "Redis is unavailable, skipping until the backoff ends"
+            )
+
+    def _record_failure(self) -> None:
+        self.failures += 1
+        backoff = FAILURE_BACKOFF_SECONDS * 2 ** min(self.failures - 1, 16)
+        self._retry_at = time.monotonic() + min(backoff, MAX_FAILURE_BACKOFF_SECONDS)
+
+    def _take_idle(self) -> Optional[Connection]:
+        while self._idle:
+            connection = self._idle.pop()
+            if not connection[1].is_closing():
+                return connection
+        return None
+
+    async def pipeline(self, *commands: Tuple[Any, ...]) -> List[Any]:
+        self._check_available()
+        async with self._slots:
+            # Callers queued behind a failing command give up without reconnecting.
+            self._check_available()
+            connection = self._take_idle()
+            try:
+                if connection is None:
+                    connection = await self._open()
+                replies = await asyncio.wait_for(
+                    self._pipeline(*connection, commands), self.timeout
+                )
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                self._record_failure()
+                if connection is not None:
+                    connection[1].close()
+                raise
+            except BaseException:
+                if connection is not None:
+                    connection[1].close()
+                raise
+
+            self.failures = 0
+            self._idle.append(connection)
+            return replies
+
+    async def execute(self, *args: Any) -> Any:
+        reply = (await self.pipeline(args))[0]
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    async def subscribe(
+        self, channel: str, handler: Callable[[Optional[str]], None]
+    ) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+        if self._subscriber_task is None:
+            self._subscriber_task = asyncio.create_task(self._listen())
+        elif self._subscriber_writer is not None:
+            self._subscriber_writer.write(encode_command("SUBSCRIBE", channel))
+            await self._subscriber_writer.drain()
+
+    def _dispatch(self, channel: str, message: Optional[str]) -> None:
+        for handler in self._handlers.get(channel, []):
+            handler(message)
+
+    # Messages published while the subscriber was disconnected are lost, so every
+    # (re)subscription tells handlers to drop everything they hold locally.
+    async def _listen(self) -> None:
+        while not self._closing:
+            writer = None
+            try:
+                reader, writer = await self._open()
+                writer.write(encode_command("SUBSCRIBE", *self._handlers))
+                await writer.drain()
+                self._subscriber_writer = writer
+                for channel in list(self._handlers):
+                    self._dispatch(channel, None)
+
+                while True:
+                    reply = await read_reply(reader)
+                    if isinstance(reply, list) and reply and reply[0] == b"message":
+                        self._dispatch(reply[1].decode("utf-8"), reply[2].decode("utf-8"))
+            except asyncio.CancelledError:
+                raise
+            except (
+                OSError,
+                RedisError,
+                asyncio.IncompleteReadError,
+                asyncio.TimeoutError,
+            ):
+                logger.warning("Redis subscriber disconnected, reconnecting")
+            finally:
+                self._subscriber_writer = None
+                if writer is not None:
+                    writer.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    # The flag also stops the subscriber when wait_for in _open swallows the cancel.
+    async def close(self) -> None:
+        self._closing = True
+        if self._subscriber_task is not None:
+            self._subscriber_task.cancel()
+            try:
+                await self._subscriber_task
+            except asyncio.CancelledError:
+                pass
+            self._subscriber_task = None
+        while self._idle:
+            self._idle.pop()[1].close()
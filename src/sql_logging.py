@@ -0,0 +1,117 @@
+import atexit
+import hashlib
+import json
+import logging
+import queue
+import random
+import re
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import SQL_LOG_SAMPLE_RATE, SQL_SLOW_QUERY_MS
+
+sql_logger = logging.getLogger("kindle.sql")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"(?:\$\d+|%\(\w+\)s)(?:::[\w\[\]]+)?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+_listener: Optional[QueueListener] = None
+
+
+@lru_cache(maxsize=2048)
+def fingerprint_statement(statement: str) -> Tuple[str, str]:
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("?+", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    return normalized, digest
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        payload.update(getattr(record, "sql", {}))
+        return json.dumps(payload)
+
+
+def _start_queue_listener() -> None:
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter())
+
+    sql_logger.addHandler(QueueHandler(log_queue))
+    sql_logger.setLevel(logging.INFO)
+    sql_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+# Timing is recorded for every statement, but only slow statements and a random
+# sample of the rest are logged. Records are handed to a background thread, so the
+# event loop never waits on stdout.
+class SQLQueryLogger:
+
+    def __init__(self, sample_rate: float, slow_query_ms: float):
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+
+    def install(self, bind: AsyncEngine) -> None:
+        _start_queue_listener()
+        event.listen(bind.sync_engine, "before_cursor_execute", self.before_execute)
+        event.listen(bind.sync_engine, "after_cursor_execute", self.after_execute)
+
+    # The start time lives on the execution context rather than on the connection:
+    # after_cursor_execute is skipped for statements that raise, so anything kept
+    # per connection would leak and skew the timings of later statements.
+    def before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    def after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = context._query_started_at
+        duration_ms = (time.perf_counter() - started_at) * 1000
+
+        slow = duration_ms >= self.slow_query_ms
+        if not slow and random.random() >= self.sample_rate:
+            return
+
+        normalized, fingerprint = fingerprint_statement(statement)
+        sql_logger.log(
+            logging.WARNING if slow else logging.INFO,
+            "slow_query" if slow else "query",
+            extra={
+                "sql": {
+                    "fingerprint": fingerprint,
+                    "statement": normalized,
+                    "duration_ms": round(duration_ms, 3),
+                    "rowcount": cursor.rowcount,
+                    "executemany": executemany,
+                }
+            },
+        )
+
+
+sql_query_logger = SQLQueryLogger(
+    sample_rate=SQL_LOG_SAMPLE_RATE, slow_query_ms=SQL_SLOW_QUERY_MS
+)
@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import os
+import pathlib
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, BinaryIO
+
+from src.config import MEDIA_ROOT, MEDIA_URL, STORAGE_BACKEND
+
+
+class StorageError(Exception):
+    pass
+
+
+class ObjectTooLarge(StorageError):
+    pass
+
+
+# Content-addressed blob storage: keys are derived from the SHA-256 of the content,
+# so identical uploads resolve to one stored object. Backends only need to accept a
+# chunk stream and map keys to public URLs, which an object store can do as well.
+class StorageBackend(ABC):
+
+    @abstractmethod
+    async def save(
+        self, chunks: AsyncIterator[bytes], extension: str, max_size: int
+    ) -> str: ...
+
+    @abstractmethod
+    def url_for(self, key: str) -> str: ...
+
+
+def content_key(digest: str, extension: str) -> str:
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+
+def _write_chunk(file: BinaryIO, digest: Any, chunk: bytes) -> None:
+    digest.update(chunk)
+    file.write(chunk)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class LocalFileStorage(StorageBackend):
+
+    def __init__(self, root: pathlib.Path, base_url: str):
+        self.root = pathlib.Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _open_temp_file(self) -> BinaryIO:
+        temp_dir = self.root / "tmp"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=temp_dir, delete=False)
+
+    def _commit(self, temp_path: str, key: str) -> None:
+        target = self.root / key
+        if target.exists():
+            _remove_quietly(temp_path)
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, target)
+
+    # File I/O and hashing run in worker threads (hashlib releases the GIL on large
+    # buffers), so the event loop only shuttles chunks from the request to the file.
+    async def save(
+        self, chunks: AsyncIterator[bytes], extension: str, max_size: int
+    ) -> str:
+        temp_file = await asyncio.to_thread(self._open_temp_file)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with temp_file:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > max_size:
+                        raise ObjectTooLarge(f"Object exceeds {max_size} bytes")
+                    await asyncio.to_thread(_write_chunk, temp_file, digest, chunk)
+                await asyncio.to_thread(temp_file.flush)
+                await asyncio.to_thread(os.fsync, temp_file.fileno())
+
+            key = content_key(digest.hexdigest(), extension)
+            await asyncio.to_thread(self._commit, temp_file.name, key)
+        except BaseException:
+            await asyncio.to_thread(_remove_quietly, temp_file.name)
+            raise
+        return key
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+def create_storage() -> StorageBackend:
+    if STORAGE_BACKEND == "local":
+        return LocalFileStorage(MEDIA_ROOT, MEDIA_URL)
+    raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
+
+
+media_storage = create_storage()
@@ -0,0 +1,61 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from src.cache import NegativeCache, SingleFlight, create_cache
+from src.config import (
+    MISSING_USER_CACHE_CAPACITY,
+    MISSING_USER_CACHE_TTL_SECONDS,
+    PROFILE_CACHE_MAXSIZE,
+    PROFILE_CACHE_TTL_SECONDS,
+)
+from src.user_profile.schemas import (
+    UserPhotoRead,
+    UserProfileRead,
+    UserRead,
+    UserSocialMediaLinkRead,
+)
+
+# Public profile reads keyed by user id. Every service that writes a user, photo or
+# link invalidates that user's keys after its transaction commits; with the shared
+# backend the invalidation is broadcast to every worker.
+user_cache = create_cache(
+    "user", TypeAdapter(UserRead), PROFILE_CACHE_MAXSIZE, PROFILE_CACHE_TTL_SECONDS
+)
+photos_cache = create_cache(
+    "photos",
+    TypeAdapter(List[UserPhotoRead]),
+    PROFILE_CACHE_MAXSIZE,
+    PROFILE_CACHE_TTL_SECONDS,
+)
+links_cache = create_cache(
+    "links",
+    TypeAdapter(List[UserSocialMediaLinkRead]),
+    PROFILE_CACHE_MAXSIZE,
+    PROFILE_CACHE_TTL_SECONDS,
+)
+profile_cache = create_cache(
+    "profile",
+    TypeAdapter(UserProfileRead),
+    PROFILE_CACHE_MAXSIZE,
+    PROFILE_CACHE_TTL_SECONDS,
+)
+
+PROFILE_CACHES = (user_cache, photos_cache, links_cache, profile_cache)
+
+# Cache misses for the same (namespace, user_id) share one database load.
+profile_loads = SingleFlight()
+
+# User ids that recently 404'd, so repeated lookups of random ids never reach
+# Postgres. The set is per worker; _create_user removes the new id locally, and
+# other workers forget it after at most MISSING_USER_CACHE_TTL_SECONDS.
+missing_users = NegativeCache(
+    capacity=MISSING_USER_CACHE_CAPACITY,
+    ttl=MISSING_USER_CACHE_TTL_SECONDS,
+)
+
+
+async def invalidate_user_profile(user_id: UUID) -> None:
+    for cache in PROFILE_CACHES:
+        await cache.invalidate(user_id)
@@ -1,12 +1,50 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import (
+    REAL,
+    Float,
+    Integer,
+    String,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
 
-from src.user_profile.models import User, UserPhoto, UserSocialMediaLinks
+from src.geo.dao import city_id_subquery
+from src.user_profile.models import (
+    BIO_SEARCH_CONFIG,
+    User,
+    UserPhoto,
+    UserSocialMediaLinks,
+)
+from src.user_profile.utils import HEADLINE_START_SEL, HEADLINE_STOP_SEL
+
+BIO_HEADLINE_OPTIONS = (
+    f"StartSel={HEADLINE_START_SEL}, StopSel={HEADLINE_STOP_SEL}, "
+    "MaxFragments=2, MaxWords=20"
+)
+
+
+# Binds a list of ids as one uuid[] parameter, so `= ANY(...)` compiles to the
+# same statement (and prepared-statement cache entry) whatever the batch size.
+def uuid_array(name: str, ids: List[UUID]):
+    return any_(bindparam(name, ids, type_=ARRAY(PG_UUID(as_uuid=True))))
 
 
 class UserDAO:
@@ -36,6 +74,7 @@ class UserDAO:
                 gender=gender,
                 country=country,
                 city=city,
+                city_id=city_id_subquery(country, city),
             )
             self.db_session.add(new_user)
             await self.db_session.flush()
@@ -50,12 +89,31 @@ class UserDAO:
         db_response = await self.db_session.execute(db_query)
         return db_response.scalar_one_or_none()
 
+    async def get_users_by_ids(self, ids: List[UUID]) -> List[User]:
+        db_query = select(User).where(User.id == uuid_array("ids", ids))
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
+    async def get_user_profiles(self, ids: List[UUID]) -> List[User]:
+        db_query = (
+            select(User)
+            .where(User.id.in_(ids))
+            .options(selectinload(User.photos), selectinload(User.social_media_links))
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         db_query = select(User).where(User.email == email)
         db_response = await self.db_session.execute(db_query)
         return db_response.scalar_one_or_none()
 
     async def update_user(self, id: UUID, **kwargs) -> Optional[User]:
+        if "country" in kwargs or "city" in kwargs:
+            kwargs["city_id"] = city_id_subquery(
+                kwargs.get("country", User.country), kwargs.get("city", User.city)
+            )
+
         try:
             db_query = update(User).where(User.id == id).values(**kwargs).returning(User)
             db_response = await self.db_session.execute(db_query)
@@ -70,16 +128,164 @@ class UserDAO:
         db_response = await self.db_session.execute(db_query)
         return db_response.scalar_one_or_none()
 
-    async def get_all_users(self) -> List[User]:
+    async def get_users_page(
+        self,
+        limit: int,
+        after_id: Optional[UUID] = None,
+        role: Optional[str] = None,
+        country: Optional[str] = None,
+        city: Optional[str] = None,
+    ) -> List[User]:
         db_query = select(User)
+        if after_id is not None:
+            db_query = db_query.where(User.id > after_id)
+        if role is not None:
+            db_query = db_query.where(User.role == role)
+        if country is not None:
+            db_query = db_query.where(User.country == country)
+        if city is not None:
+            db_query = db_query.where(User.city == city)
+
+        db_query = db_query.order_by(User.id).limit(limit)
         db_response = await self.db_session.execute(db_query)
         return db_response.scalars().all()
 
-    async def get_users_by_role(self, role: str) -> List[User]:
-        db_query = select(User).where(User.role == role)
+    @staticmethod
+    def _search_filters(
+        born_after: date,
+        born_on_or_before: date,
+        gender: Optional[str],
+        country: Optional[str],
+        city: Optional[str],
+        exclude_id: Optional[UUID],
+    ) -> List[Any]:
+        filters = [
+            User.date_of_birth > born_after,
+            User.date_of_birth <= born_on_or_before,
+        ]
+        if gender is not None:
+            filters.append(User.gender == gender)
+        if country is not None:
+            filters.append(User.country == country)
+        if city is not None:
+            filters.append(User.city == city)
+        if exclude_id is not None:
+            filters.append(User.id != exclude_id)
+        return filters
+
+    # Youngest first, ties broken by id; `after` is the (date_of_birth, id) of the
+    # last row of the previous page.
+    async def search_users(
+        self,
+        limit: int,
+        born_after: date,
+        born_on_or_before: date,
+        gender: Optional[str] = None,
+        country: Optional[str] = None,
+        city: Optional[str] = None,
+        exclude_id: Optional[UUID] = None,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> List[User]:
+        db_query = select(User).where(
+            *self._search_filters(
+                born_after, born_on_or_before, gender, country, city, exclude_id
+            )
+        )
+        if after is not None:
+            db_query = db_query.where(tuple_(User.date_of_birth, User.id) < after)
+
+        db_query = db_query.order_by(User.date_of_birth.desc(), User.id.desc()).limit(
+            limit
+        )
         db_response = await self.db_session.execute(db_query)
         return db_response.scalars().all()
 
+    # Best match first, ties broken by id; `after` is the (rank, id) of the last
+    # row of the previous page. Headlines are computed for the returned page only.
+    async def search_users_by_bio(
+        self,
+        text_query: str,
+        limit: int,
+        born_after: date,
+        born_on_or_before: date,
+        gender: Optional[str] = None,
+        country: Optional[str] = None,
+        city: Optional[str] = None,
+        exclude_id: Optional[UUID] = None,
+        after: Optional[Tuple[float, UUID]] = None,
+    ) -> List[Tuple[User, float, str]]:
+        ts_query = func.websearch_to_tsquery(BIO_SEARCH_CONFIG, text_query)
+        rank = func.ts_rank(User.bio_search, ts_query, type_=REAL)
+        headline = func.ts_headline(
+            BIO_SEARCH_CONFIG, User.bio, ts_query, BIO_HEADLINE_OPTIONS
+        )
+
+        db_query = select(User, rank, headline).where(
+            User.bio_search.bool_op("@@")(ts_query),
+            *self._search_filters(
+                born_after, born_on_or_before, gender, country, city, exclude_id
+            ),
+        )
+        if after is not None:
+            db_query = db_query.where(tuple_(rank, User.id) < after)
+
+        db_query = db_query.order_by(rank.desc(), User.id.desc()).limit(limit)
+        db_response = await self.db_session.execute(db_query)
+        return [tuple(row) for row in db_response.all()]
+
+    # `cities` lists (city_id, distance_km) nearest first. Each city is read in id
+    # order through ix_users_city_id_id by a LIMITed lateral subquery, so a page
+    # never scans more than `limit` matches per city. `after_id` resumes inside
+    # the first city of the list.
+    async def search_users_near(
+        self,
+        cities: List[Tuple[int, float]],
+        limit: int,
+        born_after: date,
+        born_on_or_before: date,
+        gender: Optional[str] = None,
+        exclude_id: Optional[UUID] = None,
+        after_id: Optional[UUID] = None,
+    ) -> List[Tuple[User, int, float]]:
+        if not cities:
+            return []
+
+        near = (
+            func.unnest(
+                bindparam("city_ids", [id for id, _ in cities], type_=ARRAY(Integer)),
+                bindparam("distances", [km for _, km in cities], type_=ARRAY(Float)),
+            )
+            .table_valued("city_id", "distance_km", with_ordinality="position")
+            .render_derived(name="near")
+        )
+        columns = [column for column in User.__table__.c if column.key != "bio_search"]
+        city_users = select(*columns).where(
+            User.city_id == near.c.city_id,
+            *self._search_filters(
+                born_after, born_on_or_before, gender, None, None, exclude_id
+            ),
+        )
+        if after_id is not None:
+            city_users = city_users.where(or_(near.c.position > 1, User.id > after_id))
+        city_users = city_users.order_by(User.id).limit(limit).lateral("city_users")
+
+        nearby_user = aliased(User, city_users)
+        db_query = (
+            select(nearby_user, near.c.city_id, near.c.distance_km)
+            .select_from(near)
+            .join(city_users, true())
+            .order_by(near.c.position, city_users.c.id)
+            .limit(limit)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return [tuple(row) for row in db_response.all()]
+
+    async def stream_users(self, batch_size: int) -> AsyncIterator[List[User]]:
+        db_query = select(User).order_by(User.id).execution_options(yield_per=batch_size)
+        db_response = await self.db_session.stream_scalars(db_query)
+        async for users in db_response.partitions():
+            yield users
+
     async def update_user_role(self, user_id: UUID, new_role: str) -> Optional[User]:
         db_query = (
             update(User).where(User.id == user_id).values(role=new_role).returning(User)
@@ -98,11 +304,33 @@ class UserPhotoDAO:
         await self.db_session.flush()
         return new_photo
 
+    async def create_photos(self, user_id: UUID, urls: List[str]) -> List[UserPhoto]:
+        db_query = insert(UserPhoto).returning(UserPhoto, sort_by_parameter_order=True)
+        try:
+            db_response = await self.db_session.scalars(
+                db_query, [{"user_id": user_id, "url": url} for url in urls]
+            )
+            return db_response.all()
+
+        except IntegrityError as error:
+            if "foreign key constraint" in str(error.orig):
+                raise ValueError(f"User with id {user_id} doesn't exist")
+            raise
+
     async def get_all_photos_by_user(self, user_id: UUID) -> List[UserPhoto]:
         db_query = select(UserPhoto).where(UserPhoto.user_id == user_id)
         db_response = await self.db_session.execute(db_query)
         return db_response.scalars().all()
 
+    async def get_photos_by_users(self, user_ids: List[UUID]) -> List[UserPhoto]:
+        db_query = (
+            select(UserPhoto)
+            .where(UserPhoto.user_id == uuid_array("user_ids", user_ids))
+            .order_by(UserPhoto.user_id, UserPhoto.id)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
     async def update_photo_by_id(self, photo_id: int, **kwargs) -> Optional[UserPhoto]:
         if not kwargs:
             return None
@@ -116,6 +344,33 @@ class UserPhotoDAO:
         db_response = await self.db_session.execute(db_query)
         return db_response.scalar_one_or_none()
 
+    async def update_photos(
+        self, user_id: UUID, changes: List[Tuple[int, str]]
+    ) -> List[UserPhoto]:
+        if not changes:
+            return []
+
+        rows = values(column("id", Integer), column("url", String), name="changes").data(
+            changes
+        )
+        db_query = (
+            update(UserPhoto)
+            .where(UserPhoto.id == rows.c.id, UserPhoto.user_id == user_id)
+            .values(url=rows.c.url)
+            .returning(UserPhoto)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
+    async def delete_photos(self, user_id: UUID, photo_ids: List[int]) -> List[UserPhoto]:
+        db_query = (
+            delete(UserPhoto)
+            .where(UserPhoto.user_id == user_id, UserPhoto.id.in_(photo_ids))
+            .returning(UserPhoto)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
     async def delete_photo_by_id(self, photo_id: int) -> Optional[UserPhoto]:
         db_query = delete(UserPhoto).where(UserPhoto.id == photo_id).returning(UserPhoto)
         db_response = await self.db_session.execute(db_query)
@@ -134,6 +389,27 @@ class UserSocialMediaLinkDAO:
         await self.db_session.flush()
         return new_link
 
+    async def create_links(
+        self, user_id: UUID, links: List[Tuple[str, str]]
+    ) -> List[UserSocialMediaLinks]:
+        db_query = insert(UserSocialMediaLinks).returning(
+            UserSocialMediaLinks, sort_by_parameter_order=True
+        )
+        try:
+            db_response = await self.db_session.scalars(
+                db_query,
+                [
+                    {"user_id": user_id, "link": link, "name": name}
+                    for link, name in links
+                ],
+            )
+            return db_response.all()
+
+        except IntegrityError as error:
+            if "foreign key constraint" in str(error.orig):
+                raise ValueError(f"User with id {user_id} doesn't exist")
+            raise
+
     async def get_all_links_by_user(self, user_id: UUID) -> List[UserSocialMediaLinks]:
         db_query = select(UserSocialMediaLinks).where(
             UserSocialMediaLinks.user_id == user_id
@@ -164,3 +440,45 @@ class UserSocialMediaLinkDAO:
         )
         db_response = await self.db_session.execute(db_query)
         return db_response.scalar_one_or_none()
+
+    # Fields left as None keep their current value.
+    async def update_links(
+        self, user_id: UUID, changes: List[Tuple[int, Optional[str], Optional[str]]]
+    ) -> List[UserSocialMediaLinks]:
+        if not changes:
+            return []
+
+        rows = values(
+            column("id", Integer),
+            column("link", String),
+            column("name", String),
+            name="changes",
+        ).data(changes)
+        db_query = (
+            update(UserSocialMediaLinks)
+            .where(
+                UserSocialMediaLinks.id == rows.c.id,
+                UserSocialMediaLinks.user_id == user_id,
+            )
+            .values(
+                link=func.coalesce(rows.c.link, UserSocialMediaLinks.link),
+                name=func.coalesce(rows.c.name, UserSocialMediaLinks.name),
+            )
+            .returning(UserSocialMediaLinks)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
+
+    async def delete_links(
+        self, user_id: UUID, link_ids: List[int]
+    ) -> List[UserSocialMediaLinks]:
+        db_query = (
+            delete(UserSocialMediaLinks)
+            .where(
+                UserSocialMediaLinks.user_id == user_id,
+                UserSocialMediaLinks.id.in_(link_ids),
+            )
+            .returning(UserSocialMediaLinks)
+        )
+        db_response = await self.db_session.execute(db_query)
+        return db_response.scalars().all()
@@ -1,12 +1,28 @@
 import uuid
 from datetime import date
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy import CHAR, UUID, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    CHAR,
+    UUID,
+    Computed,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+import src.geo.models  # noqa: F401  # registers cities for users.city_id
 from src.models import Base
 
+# Text search configuration of users.bio_search. "simple" does no stemming or
+# stop words, which suits bios written in any language.
+BIO_SEARCH_CONFIG = "simple"
+
 
 class User(Base):
     __tablename__ = "users"
@@ -25,20 +41,56 @@ class User(Base):
     gender: Mapped[str] = mapped_column(CHAR(1), nullable=False)
     country: Mapped[str] = mapped_column(String(50), nullable=False)
     city: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Gazetteer entry matching country and city, or None when there is none.
+    city_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("cities.id"), nullable=True
+    )
     role: Mapped[str] = mapped_column(String(10), default="user", nullable=False)
+    # Maintained by Postgres inside the same INSERT/UPDATE that writes bio, and
+    # deferred so regular reads never transfer it.
+    bio_search: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{BIO_SEARCH_CONFIG}', coalesce(bio, ''))", persisted=True
+        ),
+        nullable=True,
+        deferred=True,
+    )
 
     photos: Mapped[List["UserPhoto"]] = relationship(
         back_populates="user",
         cascade="all, delete-orphan",
+        order_by="UserPhoto.id",
     )
     social_media_links: Mapped[List["UserSocialMediaLinks"]] = relationship(
         back_populates="user",
         cascade="all, delete-orphan",
+        order_by="UserSocialMediaLinks.id",
     )
     refresh_tokens = relationship(
         "RefreshToken", back_populates="user", cascade="all, delete-orphan"
     )
 
+    # The search indexes end in (date_of_birth, id), the keyset order of
+    # GET /users/search, after the equality filters for city-, country- and
+    # worldwide searches respectively.
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id"),
+        Index("ix_users_country_city_id", "country", "city", "id"),
+        Index(
+            "ix_users_search_city",
+            "country",
+            "city",
+            "gender",
+            "date_of_birth",
+            "id",
+        ),
+        Index("ix_users_search_country", "country", "gender", "date_of_birth", "id"),
+        Index("ix_users_search_gender", "gender", "date_of_birth", "id"),
+        Index("ix_users_bio_search", "bio_search", postgresql_using="gin"),
+        Index("ix_users_city_id_id", "city_id", "id"),
+    )
+
 
 class UserPhoto(Base):
     __tablename__ = "user_photo"
@@ -52,6 +104,7 @@ class UserPhoto(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id"),
         nullable=False,
+        index=True,
     )
     url: Mapped[str] = mapped_column(String(255), nullable=False)
 
@@ -70,6 +123,7 @@ class UserSocialMediaLinks(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id"),
         nullable=False,
+        index=True,
     )
     link: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(50), nullable=False)
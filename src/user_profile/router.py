@@ -1,43 +1,206 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_user
+from src.config import (
+    USER_NEARBY_MAX_RADIUS_KM,
+    USER_NEARBY_RADIUS_KM,
+    USER_SEARCH_MAX_AGE,
+    USER_SEARCH_MAX_PAGE_SIZE,
+    USER_SEARCH_PAGE_SIZE,
+)
+from src.constraints import MIN_USER_AGE, GenderStr
 from src.database import get_async_db_session
+from src.responses import FastJSONRoute
 from src.user_profile.schemas import (
+    BatchDeleteRequest,
+    BioSearchPage,
+    NearbyPage,
+    UserBatchItem,
+    UserCardPage,
+    UserPhotoBatchCreate,
+    UserPhotoBatchResult,
+    UserPhotoBatchUpdate,
     UserPhotoCreate,
     UserPhotoRead,
     UserPhotoUpdate,
+    UserProfileRead,
+    UserProfilesRequest,
     UserRead,
+    UsersBatchRequest,
+    UserSocialMediaLinkBatchCreate,
+    UserSocialMediaLinkBatchResult,
+    UserSocialMediaLinkBatchUpdate,
     UserSocialMediaLinkCreate,
     UserSocialMediaLinkRead,
     UserSocialMediaLinkUpdate,
     UserUpdate,
 )
 from src.user_profile.service import (
+    _check_not_modified,
     _create_link,
+    _create_links,
     _create_photo,
+    _create_photos,
     _delete_link_by_id,
+    _delete_links,
     _delete_photo_by_id,
+    _delete_photos,
     _delete_user,
     _get_all_links_by_user,
     _get_all_photos_by_user,
     _get_user_by_id,
+    _get_user_profile,
+    _get_user_profiles,
+    _get_users_batch,
+    _search_users,
+    _search_users_by_bio,
+    _search_users_nearby,
     _update_link_by_id,
+    _update_links,
     _update_photo_by_id,
+    _update_photos,
     _update_user,
+    _upload_photo,
+)
+
+users_router = APIRouter(prefix="/users", tags=["users"], route_class=FastJSONRoute)
+
+
+@users_router.post(
+    "/profiles",
+    response_model=List[UserProfileRead],
+    status_code=status.HTTP_200_OK,
 )
+async def get_user_profiles(
+    body: UserProfilesRequest, db_session: AsyncSession = Depends(get_async_db_session)
+):
+    return await _get_user_profiles(body.ids, db_session)
+
+
+@users_router.post(
+    "/batch",
+    response_model=List[UserBatchItem],
+    status_code=status.HTTP_200_OK,
+)
+async def get_users_batch(
+    body: UsersBatchRequest, db_session: AsyncSession = Depends(get_async_db_session)
+):
+    return await _get_users_batch(body, db_session)
+
+
+@users_router.get("/search", response_model=UserCardPage, status_code=status.HTTP_200_OK)
+async def search_users(
+    limit: int = Query(USER_SEARCH_PAGE_SIZE, ge=1, le=USER_SEARCH_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    gender: Optional[GenderStr] = None,
+    min_age: int = Query(MIN_USER_AGE, ge=MIN_USER_AGE, le=USER_SEARCH_MAX_AGE),
+    max_age: int = Query(USER_SEARCH_MAX_AGE, ge=MIN_USER_AGE, le=USER_SEARCH_MAX_AGE),
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _search_users(
+        current_user,
+        db_session,
+        limit,
+        min_age,
+        max_age,
+        cursor,
+        gender=gender,
+        country=country,
+        city=city,
+    )
+
+
+@users_router.get(
+    "/search/bio", response_model=BioSearchPage, status_code=status.HTTP_200_OK
+)
+async def search_users_by_bio(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(USER_SEARCH_PAGE_SIZE, ge=1, le=USER_SEARCH_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    gender: Optional[GenderStr] = None,
+    min_age: int = Query(MIN_USER_AGE, ge=MIN_USER_AGE, le=USER_SEARCH_MAX_AGE),
+    max_age: int = Query(USER_SEARCH_MAX_AGE, ge=MIN_USER_AGE, le=USER_SEARCH_MAX_AGE),
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _search_users_by_bio(
+        current_user,
+        db_session,
+        q,
+        limit,
+        min_age,
+        max_age,
+        cursor,
+        gender=gender,
+        country=country,
+        city=city,
+    )
+
 
-users_router = APIRouter(prefix="/users", tags=["users"])
+@users_router.get("/nearby", response_model=NearbyPage, status_code=status.HTTP_200_OK)
+async def search_users_nearby(
+    radius_km: float = Query(USER_NEARBY_RADIUS_KM, gt=0, le=USER_NEARBY_MAX_RADIUS_KM),
+    city_id: Optional[int] = None,
+    limit: int = Query(USER_SEARCH_PAGE_SIZE, ge=1, le=USER_SEARCH_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    gender: Optional[GenderStr] = None,
+    min_age: int = Query(MIN_USER_AGE, ge=MIN_USER_AGE, le=USER_SEARCH_MAX_AGE),
+    max_age: int = Query(USER_SEARCH_MAX_AGE, ge=MIN_USER_AGE, le=USER_SEARCH_MAX_AGE),
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _search_users_nearby(
+        current_user,
+        db_session,
+        radius_km,
+        limit,
+        min_age,
+        max_age,
+        cursor,
+        gender=gender,
+        city_id=city_id,
+    )
 
 
 @users_router.get("/{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
 async def get_user(
-    user_id: UUID, db_session: AsyncSession = Depends(get_async_db_session)
+    user_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    body = await _get_user_by_id(user_id, db_session)
+    not_modified = _check_not_modified("user", user_id, body, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
+    return body
+
+
+@users_router.get(
+    "/{user_id}/profile",
+    response_model=UserProfileRead,
+    status_code=status.HTTP_200_OK,
+)
+async def get_user_profile(
+    user_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return await _get_user_by_id(user_id, db_session)
+    body = await _get_user_profile(user_id, db_session)
+    not_modified = _check_not_modified("profile", user_id, body, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
+    return body
 
 
 @users_router.patch("/{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
@@ -65,9 +228,16 @@ async def delete_user(
     status_code=status.HTTP_200_OK,
 )
 async def get_all_photos_by_user(
-    user_id: UUID, db_session: AsyncSession = Depends(get_async_db_session)
+    user_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return await _get_all_photos_by_user(user_id, db_session)
+    body = await _get_all_photos_by_user(user_id, db_session)
+    not_modified = _check_not_modified("photos", user_id, body, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
+    return body
 
 
 @users_router.post(
@@ -84,6 +254,65 @@ async def create_photo(
     return await _create_photo(body, user_id, current_user, db_session)
 
 
+# Takes the raw request so the multipart body is streamed to storage instead of
+# being spooled by form parsing first.
+@users_router.post(
+    "/{user_id}/photos/upload",
+    response_model=UserPhotoRead,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_photo(
+    request: Request,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _upload_photo(request, user_id, current_user, db_session)
+
+
+# Batch routes are declared before /{photo_id} so "batch" is not parsed as an id.
+@users_router.post(
+    "/{user_id}/photos/batch",
+    response_model=List[UserPhotoBatchResult],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_photos(
+    body: UserPhotoBatchCreate,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _create_photos(body, user_id, current_user, db_session)
+
+
+@users_router.patch(
+    "/{user_id}/photos/batch",
+    response_model=List[UserPhotoBatchResult],
+    status_code=status.HTTP_200_OK,
+)
+async def update_photos(
+    body: UserPhotoBatchUpdate,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _update_photos(body, user_id, current_user, db_session)
+
+
+@users_router.post(
+    "/{user_id}/photos/batch-delete",
+    response_model=List[UserPhotoBatchResult],
+    status_code=status.HTTP_200_OK,
+)
+async def delete_photos(
+    body: BatchDeleteRequest,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _delete_photos(body, user_id, current_user, db_session)
+
+
 @users_router.patch(
     "/{user_id}/photos/{photo_id}",
     response_model=UserPhotoRead,
@@ -117,9 +346,16 @@ async def delete_photo(
     status_code=status.HTTP_200_OK,
 )
 async def get_all_social_links_by_user(
-    user_id: UUID, db_session: AsyncSession = Depends(get_async_db_session)
+    user_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return await _get_all_links_by_user(user_id, db_session)
+    body = await _get_all_links_by_user(user_id, db_session)
+    not_modified = _check_not_modified("links", user_id, body, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
+    return body
 
 
 @users_router.post(
@@ -136,6 +372,48 @@ async def create_social_link(
     return await _create_link(body, user_id, current_user, db_session)
 
 
+@users_router.post(
+    "/{user_id}/social-links/batch",
+    response_model=List[UserSocialMediaLinkBatchResult],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_social_links(
+    body: UserSocialMediaLinkBatchCreate,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _create_links(body, user_id, current_user, db_session)
+
+
+@users_router.patch(
+    "/{user_id}/social-links/batch",
+    response_model=List[UserSocialMediaLinkBatchResult],
+    status_code=status.HTTP_200_OK,
+)
+async def update_social_links(
+    body: UserSocialMediaLinkBatchUpdate,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _update_links(body, user_id, current_user, db_session)
+
+
+@users_router.post(
+    "/{user_id}/social-links/batch-delete",
+    response_model=List[UserSocialMediaLinkBatchResult],
+    status_code=status.HTTP_200_OK,
+)
+async def delete_social_links(
+    body: BatchDeleteRequest,
+    user_id: UUID,
+    current_user: UserRead = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
+    return await _delete_links(body, user_id, current_user, db_session)
+
+
 @users_router.patch(
     "/{user_id}/social-links/{link_id}",
     response_model=UserSocialMediaLinkRead,
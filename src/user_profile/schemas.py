@@ -1,19 +1,31 @@
 from datetime import date
-from typing import Annotated, Optional
+from typing import Annotated, Any, ClassVar, Dict, List, Optional, get_args, get_origin
 from uuid import UUID
 
-from pydantic import AnyUrl, BaseModel, EmailStr, StringConstraints, field_validator
+from pydantic import (
+    AnyUrl,
+    BaseModel,
+    EmailStr,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+
+from src.config import (
+    USER_LOOKUP_BATCH_MAX,
+    USER_MEDIA_BATCH_MAX,
+    USER_PROFILES_BATCH_MAX,
+)
+from src.constraints import (
+    BioStr,
+    BirthDate,
+    CountryCityStr,
+    GenderStr,
+    NameStr,
+    PasswordStr,
+)
 
-NameStr = Annotated[
-    str, StringConstraints(min_length=1, max_length=50, strip_whitespace=True)
-]
-
-GenderStr = Annotated[
-    str, StringConstraints(min_length=1, max_length=1, strip_whitespace=True)
-]
-CountryCityStr = Annotated[
-    str, StringConstraints(min_length=1, max_length=50, strip_whitespace=True)
-]
 TitleStr = Annotated[
     str, StringConstraints(min_length=1, max_length=100, strip_whitespace=True)
 ]
@@ -23,75 +35,54 @@ LinkStr = Annotated[
 UrlStr = Annotated[
     str, StringConstraints(min_length=1, max_length=255, strip_whitespace=True)
 ]
-PasswordStr = Annotated[str, StringConstraints(min_length=8)]
+
+
+# Read models are built from rows that passed validation on their way into the
+# database, so from_orm_obj constructs them without re-running field validators.
+# __orm_fields__ maps a field to its ORM attribute where the names differ; list
+# fields of other read models are converted item by item.
+class ORMReadModel(BaseModel):
+    __orm_fields__: ClassVar[Dict[str, str]] = {}
+    __orm_plan__: ClassVar[List[tuple]] = []
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        plan = []
+        for name, field in cls.model_fields.items():
+            item_model = None
+            if get_origin(field.annotation) is list:
+                (item_type,) = get_args(field.annotation)
+                if isinstance(item_type, type) and issubclass(item_type, ORMReadModel):
+                    item_model = item_type
+            plan.append((name, cls.__orm_fields__.get(name, name), item_model))
+        cls.__orm_plan__ = plan
+
+    @classmethod
+    def from_orm_obj(cls, obj):
+        values = {}
+        for name, attribute, item_model in cls.__orm_plan__:
+            value = getattr(obj, attribute)
+            if item_model is not None:
+                value = [item_model.from_orm_obj(item) for item in value]
+            values[name] = value
+        return cls.model_construct(**values)
 
 
 class UserCreate(BaseModel):
     email: EmailStr
     name: NameStr
     surname: NameStr
-    date_of_birth: date
-    bio: Optional[str] = None
+    date_of_birth: BirthDate
+    bio: Optional[BioStr] = None
     gender: GenderStr
     country: CountryCityStr
     city: CountryCityStr
 
-    @field_validator("gender")
-    @classmethod
-    def validate_gender(cls, v):
-        if v not in ("m", "f"):
-            raise ValueError("Gender must be m or f")
-        return v
-
-    @field_validator("bio")
-    @classmethod
-    def validate_bio(cls, v):
-        if v is not None and len(v) > 5000:
-            raise ValueError("Bio must not exceed 5000 characters")
-        return v
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Name cannot be empty")
-        return v
-
-    @field_validator("surname")
-    @classmethod
-    def validate_surname(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Surname cannot be empty")
-        return v
-
-    @field_validator("country")
-    @classmethod
-    def validate_country(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Country cannot be empty")
-        return v
-
-    @field_validator("city")
-    @classmethod
-    def validate_city(cls, v):
-        if not v or not v.strip():
-            raise ValueError("City cannot be empty")
-        return v
-
-    @field_validator("date_of_birth")
-    @classmethod
-    def validate_date_of_birth(cls, v: date) -> date:
-        today = date.today()
-        min_age = 18
-        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
-        if v > today:
-            raise ValueError("Date of birth cannot be in the future")
-        if age < min_age:
-            raise ValueError(f"User must be at least {min_age} years old")
-        return v
 
+class UserRead(ORMReadModel):
+    __orm_fields__ = {"user_id": "id"}
 
-class UserRead(BaseModel):
     user_id: UUID
     email: EmailStr
     name: NameStr
@@ -115,47 +106,73 @@ class UserRead(BaseModel):
             )
         )
 
+
+class UserPage(BaseModel):
+    items: List[UserRead]
+    next_cursor: Optional[str] = None
+
+
+# What discovery results (search, nearby, feed, matches) show of other users: the
+# public profile without the account's email and role.
+class UserCard(ORMReadModel):
+    __orm_fields__ = {"user_id": "id"}
+
+    user_id: UUID
+    name: str
+    surname: str
+    date_of_birth: date
+    bio: Optional[str] = None
+    gender: str
+    country: str
+    city: str
+
     @classmethod
-    def from_orm_obj(cls, user) -> "UserRead":
-        return cls(
-            user_id=user.id,
-            email=user.email,
-            name=user.name,
-            surname=user.surname,
-            date_of_birth=user.date_of_birth,
-            bio=user.bio,
-            gender=user.gender,
-            country=user.country,
-            city=user.city,
-            role=user.role,
+    def from_user(cls, user: UserRead) -> "UserCard":
+        return cls.model_construct(
+            **{name: getattr(user, name) for name in cls.model_fields}
         )
 
 
+class UserCardPage(BaseModel):
+    items: List[UserCard]
+    next_cursor: Optional[str] = None
+
+
+# Bio search result: `headline` holds HTML-escaped excerpts of the bio with the
+# matching words wrapped in <mark> tags.
+class BioSearchHit(BaseModel):
+    user: UserCard
+    rank: float
+    headline: str
+
+
+class BioSearchPage(BaseModel):
+    items: List[BioSearchHit]
+    next_cursor: Optional[str] = None
+
+
+class NearbyUser(BaseModel):
+    user: UserCard
+    city_id: int
+    distance_km: float
+
+
+class NearbyPage(BaseModel):
+    items: List[NearbyUser]
+    next_cursor: Optional[str] = None
+
+
 class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
     password: Optional[PasswordStr] = None
     name: Optional[NameStr] = None
     surname: Optional[NameStr] = None
     date_of_birth: Optional[date] = None
-    bio: Optional[str] = None
+    bio: Optional[BioStr] = None
     gender: Optional[GenderStr] = None
     country: Optional[CountryCityStr] = None
     city: Optional[CountryCityStr] = None
 
-    @field_validator("gender")
-    @classmethod
-    def validate_gender(cls, v):
-        if v is not None and v not in ("m", "f"):
-            raise ValueError("Gender must be 'm' or 'f'")
-        return v
-
-    @field_validator("bio")
-    @classmethod
-    def validate_bio(cls, v):
-        if v is not None and len(v) > 5000:
-            raise ValueError("Bio must not exceed 5000 characters")
-        return v
-
 
 class UserSocialMediaLinkCreate(BaseModel):
     name: NameStr
@@ -175,21 +192,12 @@ class UserSocialMediaLinkCreate(BaseModel):
         return data
 
 
-class UserSocialMediaLinkRead(BaseModel):
+class UserSocialMediaLinkRead(ORMReadModel):
     id: int
     user_id: UUID
     name: str
     link: str
 
-    @classmethod
-    def from_orm_obj(cls, link):
-        return cls(
-            id=link.id,
-            user_id=link.user_id,
-            name=link.name,
-            link=link.link,
-        )
-
 
 class UserSocialMediaLinkUpdate(BaseModel):
     id: int
@@ -228,18 +236,34 @@ class UserPhotoCreate(BaseModel):
         return data
 
 
-class UserPhotoRead(BaseModel):
+class UserPhotoRead(ORMReadModel):
     id: int
     user_id: UUID
     url: str
 
-    @classmethod
-    def from_orm_obj(cls, photo):
-        return cls(
-            id=photo.id,
-            user_id=photo.user_id,
-            url=photo.url,
-        )
+
+class UserProfileRead(UserRead):
+    photos: List[UserPhotoRead]
+    social_media_links: List[UserSocialMediaLinkRead]
+
+
+class UserProfilesRequest(BaseModel):
+    ids: List[UUID] = Field(min_length=1, max_length=USER_PROFILES_BATCH_MAX)
+
+
+class UsersBatchRequest(BaseModel):
+    ids: List[UUID] = Field(min_length=1, max_length=USER_LOOKUP_BATCH_MAX)
+    include_photos: bool = False
+
+
+# One entry per requested id, in request order and duplicates included. Unknown
+# ids come back with found=False and no user; photos are only filled in when the
+# request asked for them.
+class UserBatchItem(BaseModel):
+    id: UUID
+    found: bool
+    user: Optional[UserRead] = None
+    photos: Optional[List[UserPhotoRead]] = None
 
 
 class UserPhotoUpdate(BaseModel):
@@ -251,3 +275,67 @@ class UserPhotoUpdate(BaseModel):
         if isinstance(data.get("url"), AnyUrl):
             data["url"] = str(data["url"])
         return data
+
+
+def check_unique_ids(ids: List[int]) -> None:
+    if len(set(ids)) != len(ids):
+        raise ValueError("Each id may appear only once in a batch")
+
+
+class UserPhotoBatchCreate(BaseModel):
+    items: List[UserPhotoCreate] = Field(min_length=1, max_length=USER_MEDIA_BATCH_MAX)
+
+
+class UserPhotoBatchUpdate(BaseModel):
+    items: List[UserPhotoUpdate] = Field(min_length=1, max_length=USER_MEDIA_BATCH_MAX)
+    atomic: bool = True
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self):
+        check_unique_ids([item.id for item in self.items])
+        return self
+
+
+class UserSocialMediaLinkBatchCreate(BaseModel):
+    items: List[UserSocialMediaLinkCreate] = Field(
+        min_length=1, max_length=USER_MEDIA_BATCH_MAX
+    )
+
+
+class UserSocialMediaLinkBatchUpdate(BaseModel):
+    items: List[UserSocialMediaLinkUpdate] = Field(
+        min_length=1, max_length=USER_MEDIA_BATCH_MAX
+    )
+    atomic: bool = True
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self):
+        check_unique_ids([item.id for item in self.items])
+        return self
+
+
+class BatchDeleteRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=USER_MEDIA_BATCH_MAX)
+    atomic: bool = True
+
+    @field_validator("ids")
+    @classmethod
+    def validate_unique_ids(cls, v):
+        check_unique_ids(v)
+        return v
+
+
+# One entry per requested item, in request order. `status` is the code the
+# matching single-item endpoint would have answered with.
+class UserPhotoBatchResult(BaseModel):
+    id: int
+    status: int
+    detail: Optional[str] = None
+    photo: Optional[UserPhotoRead] = None
+
+
+class UserSocialMediaLinkBatchResult(BaseModel):
+    id: int
+    status: int
+    detail: Optional[str] = None
+    social_link: Optional[UserSocialMediaLinkRead] = None
@@ -1,27 +1,119 @@
-from typing import List
+from datetime import date
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from uuid import UUID
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.dependencies import invalidate_current_user
+from src.cache import MemoryCache
+from src.config import PHOTO_UPLOAD_MAX_BYTES
+from src.geo.dao import CityDAO
+from src.geo.gazetteer import bounding_box, haversine_km
+from src.multipart import MultipartError, MultipartReader, parse_boundary
+from src.pagination import decode_cursor, encode_cursor
+from src.storage import ObjectTooLarge, media_storage
+from src.user_profile.cache import (
+    invalidate_user_profile,
+    links_cache,
+    missing_users,
+    photos_cache,
+    profile_cache,
+    profile_loads,
+    user_cache,
+)
 from src.user_profile.dao import UserDAO, UserPhotoDAO, UserSocialMediaLinkDAO
 from src.user_profile.schemas import (
+    BatchDeleteRequest,
+    BioSearchHit,
+    BioSearchPage,
+    NearbyPage,
+    NearbyUser,
+    UserBatchItem,
+    UserCard,
+    UserCardPage,
+    UserPhotoBatchCreate,
+    UserPhotoBatchResult,
+    UserPhotoBatchUpdate,
     UserPhotoCreate,
     UserPhotoRead,
     UserPhotoUpdate,
+    UserProfileRead,
     UserRead,
+    UsersBatchRequest,
+    UserSocialMediaLinkBatchCreate,
+    UserSocialMediaLinkBatchResult,
+    UserSocialMediaLinkBatchUpdate,
     UserSocialMediaLinkCreate,
     UserSocialMediaLinkRead,
     UserSocialMediaLinkUpdate,
     UserUpdate,
 )
 from src.user_profile.utils import (
+    PHOTO_SIGNATURE_BYTES,
     check_user_delete_permission,
     check_user_edit_permission,
+    detect_photo_extension,
+    etag_matches,
+    make_etag,
+    render_headline,
+    years_before,
 )
 
 
+async def _get_cached(
+    cache: MemoryCache,
+    id: UUID,
+    loader: Callable[[], Awaitable[Any]],
+    kind: Optional[str] = None,
+) -> Any:
+    if id in missing_users:
+        raise HTTPException(status_code=404, detail=f"User with id {id} doesn't exist")
+
+    key: Hashable = id if kind is None else (kind, id)
+    try:
+        return await cache.get_or_load(
+            key, lambda: profile_loads.do((cache.namespace, key), loader)
+        )
+    except HTTPException as exc:
+        if exc.status_code == 404:
+            missing_users.add(id)
+        raise
+
+
+# The ETag is a hash of the representation itself, so it always describes exactly
+# the body this worker would send, however old its cached copy is.
+def _check_not_modified(
+    kind: str,
+    id: UUID,
+    body: Any,
+    if_none_match: Optional[str],
+    response: Response,
+) -> Optional[Response]:
+    etag = make_etag(kind, id, body)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return None
+
+
 async def _get_user_by_id(id: UUID, db_session: AsyncSession) -> UserRead:
+    return await _get_cached(user_cache, id, lambda: _load_user_by_id(id, db_session))
+
+
+async def _load_user_by_id(id: UUID, db_session: AsyncSession) -> UserRead:
     async with db_session.begin():
         user_dao = UserDAO(db_session)
         user = await user_dao.get_user_by_id(id)
@@ -32,6 +124,287 @@ async def _get_user_by_id(id: UUID, db_session: AsyncSession) -> UserRead:
         return UserRead.from_orm_obj(user)
 
 
+async def _get_user_profile(id: UUID, db_session: AsyncSession) -> UserProfileRead:
+    return await _get_cached(
+        profile_cache, id, lambda: _load_user_profile(id, db_session)
+    )
+
+
+async def _load_user_profile(id: UUID, db_session: AsyncSession) -> UserProfileRead:
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        users = await user_dao.get_user_profiles([id])
+        if not users:
+            raise HTTPException(
+                status_code=404, detail=f"User with id {id} doesn't exist"
+            )
+        return UserProfileRead.from_orm_obj(users[0])
+
+
+async def _get_user_profiles(
+    ids: List[UUID], db_session: AsyncSession
+) -> List[UserProfileRead]:
+    unique_ids = list(dict.fromkeys(ids))
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        users = await user_dao.get_user_profiles(unique_ids)
+        profiles = {user.id: UserProfileRead.from_orm_obj(user) for user in users}
+        return [profiles[id] for id in unique_ids if id in profiles]
+
+
+async def _get_users_batch(
+    body: UsersBatchRequest, db_session: AsyncSession
+) -> List[UserBatchItem]:
+    candidate_ids = [id for id in dict.fromkeys(body.ids) if id not in missing_users]
+    users = await user_cache.get_or_load_many(
+        candidate_ids, lambda ids: _load_users_by_ids(ids, db_session)
+    )
+    for id in candidate_ids:
+        if id not in users:
+            missing_users.add(id)
+
+    photos: Dict[Any, List[UserPhotoRead]] = {}
+    if body.include_photos and users:
+        photos = await photos_cache.get_or_load_many(
+            list(users), lambda ids: _load_photos_by_users(ids, db_session)
+        )
+
+    return [
+        UserBatchItem(
+            id=id,
+            found=id in users,
+            user=users.get(id),
+            photos=photos.get(id) if id in users and body.include_photos else None,
+        )
+        for id in body.ids
+    ]
+
+
+async def _load_users_by_ids(
+    ids: List[UUID], db_session: AsyncSession
+) -> Dict[UUID, UserRead]:
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        users = await user_dao.get_users_by_ids(ids)
+        return {user.id: UserRead.from_orm_obj(user) for user in users}
+
+
+async def _load_photos_by_users(
+    user_ids: List[UUID], db_session: AsyncSession
+) -> Dict[UUID, List[UserPhotoRead]]:
+    async with db_session.begin():
+        photo_dao = UserPhotoDAO(db_session)
+        photos: Dict[UUID, List[UserPhotoRead]] = {id: [] for id in user_ids}
+        for photo in await photo_dao.get_photos_by_users(user_ids):
+            photos[photo.user_id].append(UserPhotoRead.from_orm_obj(photo))
+        return photos
+
+
+# Age bounds become a date_of_birth range, so the predicate stays sargable.
+def _search_birth_dates(
+    min_age: int, max_age: int, country: Optional[str], city: Optional[str]
+) -> Tuple[date, date]:
+    if min_age > max_age:
+        raise HTTPException(status_code=400, detail="min_age cannot exceed max_age")
+    if city is not None and country is None:
+        raise HTTPException(status_code=400, detail="city filter requires country")
+
+    today = date.today()
+    return years_before(today, max_age + 1), years_before(today, min_age)
+
+
+async def _search_users(
+    current_user: UserRead,
+    db_session: AsyncSession,
+    limit: int,
+    min_age: int,
+    max_age: int,
+    cursor: Optional[str] = None,
+    gender: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+) -> UserCardPage:
+    born_after, born_on_or_before = _search_birth_dates(min_age, max_age, country, city)
+
+    after = None
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        try:
+            after = (date.fromisoformat(values["date_of_birth"]), UUID(values["id"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        users = await user_dao.search_users(
+            limit=limit + 1,
+            born_after=born_after,
+            born_on_or_before=born_on_or_before,
+            gender=gender,
+            country=country,
+            city=city,
+            exclude_id=current_user.user_id,
+            after=after,
+        )
+
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = encode_cursor(
+            {
+                "date_of_birth": users[-1].date_of_birth.isoformat(),
+                "id": str(users[-1].id),
+            }
+        )
+
+    return UserCardPage(
+        items=[UserCard.from_orm_obj(user) for user in users], next_cursor=next_cursor
+    )
+
+
+async def _search_users_by_bio(
+    current_user: UserRead,
+    db_session: AsyncSession,
+    text_query: str,
+    limit: int,
+    min_age: int,
+    max_age: int,
+    cursor: Optional[str] = None,
+    gender: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+) -> BioSearchPage:
+    born_after, born_on_or_before = _search_birth_dates(min_age, max_age, country, city)
+
+    after = None
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        try:
+            after = (float(values["rank"]), UUID(values["id"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        rows = await user_dao.search_users_by_bio(
+            text_query,
+            limit=limit + 1,
+            born_after=born_after,
+            born_on_or_before=born_on_or_before,
+            gender=gender,
+            country=country,
+            city=city,
+            exclude_id=current_user.user_id,
+            after=after,
+        )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_user, last_rank, _ = rows[-1]
+        next_cursor = encode_cursor({"rank": last_rank, "id": str(last_user.id)})
+
+    return BioSearchPage(
+        items=[
+            BioSearchHit(
+                user=UserCard.from_orm_obj(user),
+                rank=rank,
+                headline=render_headline(headline),
+            )
+            for user, rank, headline in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+async def _search_users_nearby(
+    current_user: UserRead,
+    db_session: AsyncSession,
+    radius_km: float,
+    limit: int,
+    min_age: int,
+    max_age: int,
+    cursor: Optional[str] = None,
+    gender: Optional[str] = None,
+    city_id: Optional[int] = None,
+) -> NearbyPage:
+    born_after, born_on_or_before = _search_birth_dates(min_age, max_age, None, None)
+
+    async with db_session.begin():
+        city_dao = CityDAO(db_session)
+        if city_id is not None:
+            origin = await city_dao.get_city_by_id(city_id)
+            if origin is None:
+                raise HTTPException(
+                    status_code=404, detail=f"City with id {city_id} doesn't exist"
+                )
+        else:
+            origin = await city_dao.get_city_of_user(current_user.user_id)
+            if origin is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Your city is not in the gazetteer, pass city_id instead",
+                )
+
+        # The bounding box is served by ix_cities_latitude_longitude; the exact
+        # distance check and the nearest-first ordering happen here.
+        candidates = await city_dao.get_cities_in_box(
+            *bounding_box(origin.latitude, origin.longitude, radius_km)
+        )
+        cities = sorted(
+            (
+                (city.id, distance)
+                for city in candidates
+                if (
+                    distance := haversine_km(
+                        origin.latitude, origin.longitude, city.latitude, city.longitude
+                    )
+                )
+                <= radius_km
+            ),
+            key=lambda item: (item[1], item[0]),
+        )
+
+        after_id = None
+        if cursor is not None:
+            values = decode_cursor(cursor)
+            try:
+                position = [id for id, _ in cities].index(values["city_id"])
+                after_id = UUID(values["id"])
+            except (KeyError, TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            cities = cities[position:]
+
+        user_dao = UserDAO(db_session)
+        rows = await user_dao.search_users_near(
+            cities,
+            limit=limit + 1,
+            born_after=born_after,
+            born_on_or_before=born_on_or_before,
+            gender=gender,
+            exclude_id=current_user.user_id,
+            after_id=after_id,
+        )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_user, last_city_id, _ = rows[-1]
+        next_cursor = encode_cursor({"city_id": last_city_id, "id": str(last_user.id)})
+
+    return NearbyPage(
+        items=[
+            NearbyUser(
+                user=UserCard.from_orm_obj(user),
+                city_id=user_city_id,
+                distance_km=round(distance_km, 1),
+            )
+            for user, user_city_id, distance_km in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
 async def _update_user(
     body: UserUpdate, id: UUID, current_user: UserRead, db_session: AsyncSession
 ) -> UserRead:
@@ -61,7 +434,9 @@ async def _update_user(
                 status_code=404, detail=f"User with id {id} doesn't exist"
             )
 
-        return UserRead.from_orm_obj(updated_user)
+    await invalidate_current_user(id)
+    await invalidate_user_profile(id)
+    return UserRead.from_orm_obj(updated_user)
 
 
 async def _delete_user(
@@ -83,7 +458,10 @@ async def _delete_user(
             raise HTTPException(
                 status_code=404, detail=f"User with id {id} doesn't exist"
             )
-        return UserRead.from_orm_obj(deleted_user)
+
+    await invalidate_current_user(id)
+    await invalidate_user_profile(id)
+    return UserRead.from_orm_obj(deleted_user)
 
 
 async def _create_photo(
@@ -101,11 +479,96 @@ async def _create_photo(
 
         photo_dao = UserPhotoDAO(db_session)
         photo = await photo_dao.create_photo(user_id=user_id, url=str(body.url))
-        return UserPhotoRead.from_orm_obj(photo)
+
+    await invalidate_user_profile(user_id)
+    return UserPhotoRead.from_orm_obj(photo)
+
+
+async def _prepend(head: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield head
+    async for chunk in chunks:
+        yield chunk
+
+
+# The "file" part is streamed straight from the request into the storage backend,
+# which hashes it on the way; only the first bytes are held back to sniff the type.
+# Stored objects may be shared by several photos, so a failed insert leaves the
+# object in place.
+async def _upload_photo(
+    request: Request, user_id: UUID, current_user: UserRead, db_session: AsyncSession
+) -> UserPhotoRead:
+    check_user_edit_permission(current_user, user_id)
+    try:
+        boundary = parse_boundary(request.headers.get("content-type"))
+    except MultipartError as error:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(error)
+        )
+
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        if await user_dao.get_user_by_id(user_id) is None:
+            raise HTTPException(
+                status_code=404, detail=f"User with id {user_id} doesn't exist"
+            )
+
+    reader = MultipartReader(request.stream(), boundary)
+    try:
+        part = await reader.next_part()
+        while part is not None and part.name != "file":
+            part = await reader.next_part()
+        if part is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Missing "file" part in the upload',
+            )
+
+        chunks = reader.read_part()
+        head = b""
+        async for chunk in chunks:
+            head += chunk
+            if len(head) >= PHOTO_SIGNATURE_BYTES:
+                break
+
+        extension = detect_photo_extension(head)
+        if extension is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Only JPEG, PNG and WebP photos are supported",
+            )
+        key = await media_storage.save(
+            _prepend(head, chunks), extension, PHOTO_UPLOAD_MAX_BYTES
+        )
+
+    except MultipartError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+    except ObjectTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Photo must not exceed {PHOTO_UPLOAD_MAX_BYTES} bytes",
+        )
+
+    async with db_session.begin():
+        photo_dao = UserPhotoDAO(db_session)
+        try:
+            photos = await photo_dao.create_photos(user_id, [media_storage.url_for(key)])
+        except ValueError as error:
+            raise HTTPException(status_code=404, detail=str(error))
+
+    await invalidate_user_profile(user_id)
+    return UserPhotoRead.from_orm_obj(photos[0])
 
 
 async def _get_all_photos_by_user(
     user_id: UUID, db_session: AsyncSession
+) -> List[UserPhotoRead]:
+    return await _get_cached(
+        photos_cache, user_id, lambda: _load_all_photos_by_user(user_id, db_session)
+    )
+
+
+async def _load_all_photos_by_user(
+    user_id: UUID, db_session: AsyncSession
 ) -> List[UserPhotoRead]:
     async with db_session.begin():
         user_dao = UserDAO(db_session)
@@ -133,7 +596,8 @@ async def _delete_photo_by_id(
                 status_code=404, detail=f"Photo with id {photo_id} doesn't exist"
             )
 
-        return UserPhotoRead.from_orm_obj(deleted_photo)
+    await invalidate_user_profile(deleted_photo.user_id)
+    return UserPhotoRead.from_orm_obj(deleted_photo)
 
 
 async def _update_photo_by_id(
@@ -161,7 +625,8 @@ async def _update_photo_by_id(
                 status_code=404, detail=f"Photo with id {photo_id} doesn't exist"
             )
 
-        return UserPhotoRead.from_orm_obj(updated_photo)
+    await invalidate_user_profile(updated_photo.user_id)
+    return UserPhotoRead.from_orm_obj(updated_photo)
 
 
 async def _create_link(
@@ -184,11 +649,21 @@ async def _create_link(
         link = await link_dao.create_link(
             user_id=user_id, link=str(body.link), name=body.name
         )
-        return UserSocialMediaLinkRead.from_orm_obj(link)
+
+    await invalidate_user_profile(user_id)
+    return UserSocialMediaLinkRead.from_orm_obj(link)
 
 
 async def _get_all_links_by_user(
     user_id: UUID, db_session: AsyncSession
+) -> List[UserSocialMediaLinkRead]:
+    return await _get_cached(
+        links_cache, user_id, lambda: _load_all_links_by_user(user_id, db_session)
+    )
+
+
+async def _load_all_links_by_user(
+    user_id: UUID, db_session: AsyncSession
 ) -> List[UserSocialMediaLinkRead]:
     async with db_session.begin():
         user_dao = UserDAO(db_session)
@@ -227,7 +702,8 @@ async def _update_link_by_id(
                 status_code=404, detail=f"Link with id {link_id} doesn't exist"
             )
 
-        return UserSocialMediaLinkRead.from_orm_obj(updated_link)
+    await invalidate_user_profile(updated_link.user_id)
+    return UserSocialMediaLinkRead.from_orm_obj(updated_link)
 
 
 async def _delete_link_by_id(
@@ -243,4 +719,213 @@ async def _delete_link_by_id(
                 status_code=404, detail=f"Link with id {link_id} doesn't exist"
             )
 
-        return UserSocialMediaLinkRead.from_orm_obj(deleted_link)
+    await invalidate_user_profile(deleted_link.user_id)
+    return UserSocialMediaLinkRead.from_orm_obj(deleted_link)
+
+
+def _collect_batch_failures(
+    ids: List[int], empty_ids: Set[int], done: Dict[int, Any], kind: str
+) -> Dict[int, Tuple[int, str]]:
+    failures = {}
+    for id in ids:
+        if id in empty_ids:
+            failures[id] = (400, "No data provided for update")
+        elif id not in done:
+            failures[id] = (404, f"{kind} with id {id} doesn't exist")
+    return failures
+
+
+# Raised inside the transaction, so an all-or-nothing batch rolls back every item
+# and answers with the first failure, as the single-item endpoint would.
+def _check_atomic_batch(atomic: bool, failures: Dict[int, Tuple[int, str]]) -> None:
+    if atomic and failures:
+        status_code, detail = next(iter(failures.values()))
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+async def _create_photos(
+    body: UserPhotoBatchCreate,
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+) -> List[UserPhotoBatchResult]:
+    check_user_edit_permission(current_user, user_id)
+    async with db_session.begin():
+        photo_dao = UserPhotoDAO(db_session)
+        try:
+            photos = await photo_dao.create_photos(
+                user_id, [str(item.url) for item in body.items]
+            )
+        except ValueError as error:
+            raise HTTPException(status_code=404, detail=str(error))
+
+    await invalidate_user_profile(user_id)
+    return [
+        UserPhotoBatchResult(
+            id=photo.id, status=201, photo=UserPhotoRead.from_orm_obj(photo)
+        )
+        for photo in photos
+    ]
+
+
+async def _update_photos(
+    body: UserPhotoBatchUpdate,
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+) -> List[UserPhotoBatchResult]:
+    check_user_edit_permission(current_user, user_id)
+    ids = [item.id for item in body.items]
+    changes = [(item.id, str(item.url)) for item in body.items if item.url is not None]
+    empty_ids = set(ids) - {id for id, _ in changes}
+
+    async with db_session.begin():
+        photo_dao = UserPhotoDAO(db_session)
+        updated = {
+            photo.id: photo for photo in await photo_dao.update_photos(user_id, changes)
+        }
+        failures = _collect_batch_failures(ids, empty_ids, updated, "Photo")
+        _check_atomic_batch(body.atomic, failures)
+
+    if updated:
+        await invalidate_user_profile(user_id)
+    return [
+        (
+            UserPhotoBatchResult(id=id, status=failures[id][0], detail=failures[id][1])
+            if id in failures
+            else UserPhotoBatchResult(
+                id=id, status=200, photo=UserPhotoRead.from_orm_obj(updated[id])
+            )
+        )
+        for id in ids
+    ]
+
+
+async def _delete_photos(
+    body: BatchDeleteRequest,
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+) -> List[UserPhotoBatchResult]:
+    check_user_edit_permission(current_user, user_id)
+    async with db_session.begin():
+        photo_dao = UserPhotoDAO(db_session)
+        deleted = {
+            photo.id: photo for photo in await photo_dao.delete_photos(user_id, body.ids)
+        }
+        failures = _collect_batch_failures(body.ids, set(), deleted, "Photo")
+        _check_atomic_batch(body.atomic, failures)
+
+    if deleted:
+        await invalidate_user_profile(user_id)
+    return [
+        (
+            UserPhotoBatchResult(id=id, status=failures[id][0], detail=failures[id][1])
+            if id in failures
+            else UserPhotoBatchResult(
+                id=id, status=204, photo=UserPhotoRead.from_orm_obj(deleted[id])
+            )
+        )
+        for id in body.ids
+    ]
+
+
+async def _create_links(
+    body: UserSocialMediaLinkBatchCreate,
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+) -> List[UserSocialMediaLinkBatchResult]:
+    check_user_edit_permission(current_user, user_id)
+    async with db_session.begin():
+        link_dao = UserSocialMediaLinkDAO(db_session)
+        try:
+            links = await link_dao.create_links(
+                user_id, [(str(item.link), item.name) for item in body.items]
+            )
+        except ValueError as error:
+            raise HTTPException(status_code=404, detail=str(error))
+
+    await invalidate_user_profile(user_id)
+    return [
+        UserSocialMediaLinkBatchResult(
+            id=link.id,
+            status=201,
+            social_link=UserSocialMediaLinkRead.from_orm_obj(link),
+        )
+        for link in links
+    ]
+
+
+async def _update_links(
+    body: UserSocialMediaLinkBatchUpdate,
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+) -> List[UserSocialMediaLinkBatchResult]:
+    check_user_edit_permission(current_user, user_id)
+    ids = [item.id for item in body.items]
+    changes = [
+        (item.id, None if item.link is None else str(item.link), item.name)
+        for item in body.items
+        if item.link is not None or item.name is not None
+    ]
+    empty_ids = set(ids) - {id for id, _, _ in changes}
+
+    async with db_session.begin():
+        link_dao = UserSocialMediaLinkDAO(db_session)
+        updated = {
+            link.id: link for link in await link_dao.update_links(user_id, changes)
+        }
+        failures = _collect_batch_failures(ids, empty_ids, updated, "Link")
+        _check_atomic_batch(body.atomic, failures)
+
+    if updated:
+        await invalidate_user_profile(user_id)
+    return [
+        (
+            UserSocialMediaLinkBatchResult(
+                id=id, status=failures[id][0], detail=failures[id][1]
+            )
+            if id in failures
+            else UserSocialMediaLinkBatchResult(
+                id=id,
+                status=200,
+                social_link=UserSocialMediaLinkRead.from_orm_obj(updated[id]),
+            )
+        )
+        for id in ids
+    ]
+
+
+async def _delete_links(
+    body: BatchDeleteRequest,
+    user_id: UUID,
+    current_user: UserRead,
+    db_session: AsyncSession,
+) -> List[UserSocialMediaLinkBatchResult]:
+    check_user_edit_permission(current_user, user_id)
+    async with db_session.begin():
+        link_dao = UserSocialMediaLinkDAO(db_session)
+        deleted = {
+            link.id: link for link in await link_dao.delete_links(user_id, body.ids)
+        }
+        failures = _collect_batch_failures(body.ids, set(), deleted, "Link")
+        _check_atomic_batch(body.atomic, failures)
+
+    if deleted:
+        await invalidate_user_profile(user_id)
+    return [
+        (
+            UserSocialMediaLinkBatchResult(
+                id=id, status=failures[id][0], detail=failures[id][1]
+            )
+            if id in failures
+            else UserSocialMediaLinkBatchResult(
+                id=id,
+                status=204,
+                social_link=UserSocialMediaLinkRead.from_orm_obj(deleted[id]),
+            )
+        )
+        for id in body.ids
+    ]
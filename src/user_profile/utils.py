@@ -1,9 +1,22 @@
+import hashlib
+import html
+from datetime import date
+from typing import Any, Optional
 from uuid import UUID
 
+import pydantic_core
 from fastapi import HTTPException, status
 
 from src.user_profile.schemas import UserRead
 
+# ts_headline wraps matches in these control characters rather than in HTML, so
+# the bio can be escaped before the <mark> tags are put in.
+HEADLINE_START_SEL = "\x02"
+HEADLINE_STOP_SEL = "\x03"
+
+# Uploaded photos are typed by their leading bytes, not by the client's headers.
+PHOTO_SIGNATURE_BYTES = 12
+
 
 def check_user_ownership(current_user: UserRead, target_user_id: UUID) -> None:
     if current_user.user_id != target_user_id:
@@ -57,3 +70,44 @@ def check_user_delete_permission(
 
     else:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unknown role")
+
+
+# Hashes the JSON the parts serialise to, so the tag changes exactly when the body
+# sent to the client does.
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.sha1(pydantic_core.to_json(parts)).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        # 29 February in a year that has none.
+        return day.replace(year=day.year - years, day=28)
+
+
+def render_headline(headline: str) -> str:
+    return (
+        html.escape(headline)
+        .replace(HEADLINE_START_SEL, "<mark>")
+        .replace(HEADLINE_STOP_SEL, "</mark>")
+    )
+
+
+def detect_photo_extension(head: bytes) -> Optional[str]:
+    if head.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
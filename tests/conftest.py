@@ -10,7 +10,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.auth.utils import create_access_token
-from src.database import get_async_db_session
+from src.database import (
+    get_async_db_session,
+    get_db_engine,
+    request_session,
+    track_connection_checkouts,
+)
 from src.main import app
 from tests.config import TEST_DATABASE_URL
 
@@ -55,25 +60,27 @@ async def clean_test_db_tables(test_db_async_session: AsyncSession):
 
 async def get_test_db_async_session() -> AsyncGenerator[AsyncSession, None]:
     test_engine = create_async_engine(TEST_DATABASE_URL, future=True, echo=True)
-    test_async_session = sessionmaker(
-        test_engine, expire_on_commit=False, class_=AsyncSession
-    )
-    session = test_async_session()
+    track_connection_checkouts(test_engine)
     try:
-        yield session
+        async with request_session(test_engine) as session:
+            yield session
     finally:
-        await session.close()
         await test_engine.dispose()
 
 
 @pytest_asyncio.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
+    test_engine = create_async_engine(TEST_DATABASE_URL, future=True, echo=True)
     app.dependency_overrides[get_async_db_session] = get_test_db_async_session
+    app.dependency_overrides[get_db_engine] = lambda: test_engine
     transport = ASGITransport(app=app)
-    async with AsyncClient(
-        transport=transport, base_url="http://testserver"
-    ) as async_client:
-        yield async_client
+    try:
+        async with AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as async_client:
+            yield async_client
+    finally:
+        await test_engine.dispose()
 
 
 @pytest.fixture
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.redis_client import encode_command
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+# In-process server speaking the subset of RESP2 the cache client uses, so the
+# shared backend can be exercised without a Redis installation.
+class FakeRedisServer:
+
+    def __init__(self):
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.subscribers: Dict[bytes, Set[asyncio.StreamWriter]] = {}
+        self.connections: List[asyncio.StreamWriter] = []
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.commands: List[bytes] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self, port: int = 0) -> "FakeRedisServer":
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", port)
+        return self
+
+    async def stop(self) -> None:
+        for writer in self.connections:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def disconnect_all(self) -> None:
+        for writer in self.connections:
+            writer.close()
+        self.connections.clear()
+        self.subscribers.clear()
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> List[bytes]:
+        header = await reader.readuntil(b"\r\n")
+        args = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections.append(writer)
+        try:
+            while True:
+                args = await self._read_command(reader)
+                command = args[0].upper()
+                self.commands.append(command)
+
+                if command == b"GET":
+                    writer.write(_bulk(self._get(args[1])))
+                elif command == b"MGET":
+                    writer.write(b"*%d\r\n" % (len(args) - 1))
+                    for key in args[1:]:
+                        writer.write(_bulk(self._get(key)))
+                elif command == b"SET":
+                    expires_at = None
+                    if len(args) == 5 and args[3].upper() == b"PX":
+                        expires_at = time.monotonic() + int(args[4]) / 1000
+                    self.data[args[1]] = (args[2], expires_at)
+                    writer.write(b"+OK\r\n")
+                elif command == b"INCR":
+                    value = int(self._get(args[1]) or 0) + 1
+                    expires_at = self.data.get(args[1], (None, None))[1]
+                    self.data[args[1]] = (b"%d" % value, expires_at)
+                    writer.write(b":%d\r\n" % value)
+                elif command == b"PEXPIRE":
+                    item = self.data.get(args[1])
+                    if item is not None:
+                        expires_at = time.monotonic() + int(args[2]) / 1000
+                        self.data[args[1]] = (item[0], expires_at)
+                    writer.write(b":%d\r\n" % (item is not None))
+                elif command == b"DEL":
+                    deleted = sum(
+                        self.data.pop(key, None) is not None for key in args[1:]
+                    )
+                    writer.write(b":%d\r\n" % deleted)
+                elif command == b"PUBLISH":
+                    receivers = self.subscribers.get(args[1], set())
+                    for subscriber in receivers:
+                        subscriber.write(encode_command("message", args[1], args[2]))
+                    writer.write(b":%d\r\n" % len(receivers))
+                elif command == b"SUBSCRIBE":
+                    for index, channel in enumerate(args[1:], start=1):
+                        self.subscribers.setdefault(channel, set()).add(writer)
+                        writer.write(encode_command("subscribe", channel, index))
+                elif command in (b"PING", b"SELECT", b"AUTH"):
+                    writer.write(b"+OK\r\n")
+                else:
+                    writer.write(b"-ERR unknown command\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for receivers in self.subscribers.values():
+                receivers.discard(writer)
+            writer.close()
@@ -18,3 +18,47 @@ async def test_me_with_deleted_user_token_401(client, user_with_token):
 
     me = await client.get("/auth/me", headers=headers)
     assert me.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_me_served_from_cache_without_user_lookup(
+    client, user_with_token, monkeypatch
+):
+    from src.auth import dependencies
+    from src.user_profile.dao import UserDAO
+
+    calls = []
+    original = UserDAO.get_user_by_id
+
+    async def counting_get_user_by_id(self, id):
+        calls.append(id)
+        return await original(self, id)
+
+    monkeypatch.setattr(dependencies.UserDAO, "get_user_by_id", counting_get_user_by_id)
+    dependencies.current_user_cache.clear()
+
+    headers = user_with_token["headers"]
+    for _ in range(3):
+        me = await client.get("/auth/me", headers=headers)
+        assert me.status_code == 200
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_me_reflects_profile_update_after_cache_fill(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    me = await client.get("/auth/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["city"] == "Moscow"
+
+    patch = await client.patch(
+        f"/users/{user_id}", json={"city": "Kazan"}, headers=headers
+    )
+    assert patch.status_code == 200
+
+    me = await client.get("/auth/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["city"] == "Kazan"
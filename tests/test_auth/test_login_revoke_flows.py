@@ -29,3 +29,33 @@ async def test_second_login_revokes_previous_refresh(client, data_user_with_pass
     bad = await client.post("/auth/refresh")
     assert bad.status_code == 401
     assert bad.json()["detail"] == "Refresh token is not active"
+
+
+@pytest.mark.asyncio
+async def test_rotated_refresh_token_rejected_without_lookup(
+    client, data_user_with_password, monkeypatch
+):
+    from src.auth.dao import RefreshTokenDAO
+
+    reg = await client.post("/auth/register", json=data_user_with_password)
+    assert reg.status_code == 201
+    rt1 = reg.json()["refresh_token"]
+
+    client.cookies.set("refresh_token", rt1)
+    rotated = await client.post("/auth/refresh")
+    assert rotated.status_code == 200
+
+    calls = []
+    original = RefreshTokenDAO.get_refresh_token
+
+    async def counting_get_refresh_token(self, plain_token):
+        calls.append(plain_token)
+        return await original(self, plain_token)
+
+    monkeypatch.setattr(RefreshTokenDAO, "get_refresh_token", counting_get_refresh_token)
+
+    client.cookies.set("refresh_token", rt1)
+    bad = await client.post("/auth/refresh")
+    assert bad.status_code == 401
+    assert bad.json()["detail"] == "Refresh token is not active"
+    assert calls == []
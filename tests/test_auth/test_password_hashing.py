@@ -0,0 +1,50 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.auth.utils import PasswordHashExecutor, password_hash_executor
+
+
+@pytest.mark.asyncio
+async def test_password_hash_executor_rejects_when_saturated():
+    executor = PasswordHashExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+
+    busy = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as error:
+        await executor.run(lambda: None)
+    assert error.value.status_code == 503
+
+    release.set()
+    assert await busy is True
+
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_login_returns_503_when_hash_pool_saturated(
+    client, data_user_with_password, monkeypatch
+):
+    reg = await client.post("/auth/register", json=data_user_with_password)
+    assert reg.status_code == 201
+
+    monkeypatch.setattr(password_hash_executor, "max_queue", 0)
+    monkeypatch.setattr(
+        password_hash_executor, "in_flight", password_hash_executor.max_workers
+    )
+
+    resp = await client.post(
+        "/auth/login",
+        json={
+            "email": data_user_with_password["email"],
+            "password": data_user_with_password["password"],
+        },
+    )
+    assert resp.status_code == 503
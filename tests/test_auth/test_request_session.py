@@ -0,0 +1,40 @@
+import pytest
+
+from src.auth.dependencies import current_user_cache
+from src.database import count_connection_checkouts
+
+
+@pytest.mark.asyncio
+async def test_authenticated_patch_checks_out_one_connection(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    current_user_cache.clear()
+
+    with count_connection_checkouts() as checkouts:
+        resp = await client.patch(
+            f"/users/{user_id}", json={"name": "Petr"}, headers=headers
+        )
+    assert resp.status_code == 200
+    assert checkouts[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_logout_checks_out_one_connection(client, user_with_token):
+    headers = user_with_token["headers"]
+    current_user_cache.clear()
+
+    with count_connection_checkouts() as checkouts:
+        resp = await client.post("/auth/logout", headers=headers)
+    assert resp.status_code == 200
+    assert checkouts[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_forbidden_admin_request_checks_out_one_connection(client, user_with_token):
+    headers = user_with_token["headers"]
+    current_user_cache.clear()
+
+    with count_connection_checkouts() as checkouts:
+        resp = await client.get("/admin/users", headers=headers)
+    assert resp.status_code == 403
+    assert checkouts[0] == 1
@@ -0,0 +1,219 @@
+import asyncio
+from typing import Dict
+
+import pytest
+import pytest_asyncio
+from pydantic import TypeAdapter
+
+from src import redis_client
+from src.cache import RedisCache
+from src.redis_client import RedisClient, RedisError, RedisUnavailable
+from tests.fake_redis import FakeRedisServer
+
+ADAPTER = TypeAdapter(Dict[str, int])
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def fake_redis(monkeypatch):
+    monkeypatch.setattr(redis_client, "RECONNECT_DELAY_SECONDS", 0.01)
+    server = await FakeRedisServer().start()
+    try:
+        yield server
+    finally:
+        await server.stop()
+
+
+@pytest_asyncio.fixture
+async def workers(fake_redis):
+    clients = [RedisClient(fake_redis.url), RedisClient(fake_redis.url)]
+    caches = [
+        RedisCache("profile", ADAPTER, client, maxsize=100, ttl=60) for client in clients
+    ]
+    for cache in caches:
+        await cache.get("warmup")
+    await wait_until(
+        lambda: len(fake_redis.subscribers.get(b"kindle:invalidate:profile", ())) == 2
+    )
+    try:
+        yield caches
+    finally:
+        for client in clients:
+            await client.close()
+
+
+def counting_loader(calls, value):
+    async def loader():
+        calls.append(value)
+        return value
+
+    return loader
+
+
+@pytest.mark.asyncio
+async def test_value_loaded_by_one_worker_is_served_to_another(workers):
+    first, second = workers
+    calls = []
+
+    assert await first.get_or_load("u1", counting_loader(calls, {"v": 1})) == {"v": 1}
+    assert await second.get_or_load("u1", counting_loader(calls, {"v": 2})) == {"v": 1}
+    assert calls == [{"v": 1}]
+
+
+@pytest.mark.asyncio
+async def test_batch_load_reads_other_workers_values_with_one_mget(fake_redis, workers):
+    first, second = workers
+    await first.set("u1", {"v": 1})
+    requested = []
+
+    async def loader(keys):
+        requested.append(keys)
+        return {key: {"v": 2} for key in keys if key != "gone"}
+
+    fake_redis.commands.clear()
+    values = await second.get_or_load_many(["u1", "u2", "gone"], loader)
+
+    assert values == {"u1": {"v": 1}, "u2": {"v": 2}}
+    assert requested == [["u2", "gone"]]
+    assert fake_redis.commands.count(b"MGET") == 2
+    assert b"GET" not in fake_redis.commands
+    assert await first.get_or_load("u2", counting_loader([], None)) == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_batch_load_writes_back_in_one_round_trip(fake_redis, workers, monkeypatch):
+    first, second = workers
+    keys = [f"u{index}" for index in range(100)]
+    round_trips = []
+    pipeline = second.client.pipeline
+
+    async def counting_pipeline(*commands):
+        round_trips.append(len(commands))
+        return await pipeline(*commands)
+
+    async def loader(missing):
+        return {key: {"v": 1} for key in missing}
+
+    monkeypatch.setattr(second.client, "pipeline", counting_pipeline)
+    fake_redis.commands.clear()
+    await second.get_or_load_many(keys, loader)
+
+    assert fake_redis.commands.count(b"SET") == 100
+    assert len(round_trips) == 2
+    assert await first.get_or_load("u42", counting_loader([], None)) == {"v": 1}
+
+
+@pytest.mark.asyncio
+async def test_invalidation_evicts_local_copy_on_every_worker(workers):
+    first, second = workers
+    calls = []
+
+    await first.get_or_load("u1", counting_loader(calls, {"v": 1}))
+    await second.get_or_load("u1", counting_loader(calls, {"v": 1}))
+    assert second.local.get("u1") == {"v": 1}
+
+    await first.invalidate("u1")
+    await wait_until(lambda: second.local.get("u1") is None)
+
+    assert await second.get_or_load("u1", counting_loader(calls, {"v": 2})) == {"v": 2}
+    assert calls == [{"v": 1}, {"v": 2}]
+
+
+@pytest.mark.asyncio
+async def test_load_racing_a_write_is_not_shared(workers, monkeypatch):
+    first, second = workers
+    # The invalidation message reaches the first worker only after its load.
+    monkeypatch.setitem(first.client._handlers, first.channel, [])
+
+    async def stale_loader():
+        await second.invalidate("u1")
+        return {"v": 1}
+
+    assert await first.get_or_load("u1", stale_loader) == {"v": 1}
+    assert await second.get_or_load("u1", counting_loader([], {"v": 2})) == {"v": 2}
+    third_calls = []
+    first.local.clear()
+    assert await first.get_or_load("u1", counting_loader(third_calls, {"v": 3})) == {
+        "v": 2
+    }
+    assert third_calls == []
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_subscriber_drops_local_copies(fake_redis, workers):
+    _, second = workers
+    await second.set("u1", {"v": 1})
+    assert second.local.get("u1") == {"v": 1}
+
+    fake_redis.disconnect_all()
+    await wait_until(lambda: second.local.get("u1") is None)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_degrades_to_loader(fake_redis):
+    url = fake_redis.url
+    await fake_redis.stop()
+    client = RedisClient(url, timeout=0.2)
+    cache = RedisCache("profile", ADAPTER, client, maxsize=100, ttl=60)
+    calls = []
+
+    try:
+        assert await cache.get_or_load("u1", counting_loader(calls, {"v": 1})) == {"v": 1}
+        await cache.invalidate("u1")
+    finally:
+        await client.close()
+
+    assert calls == [{"v": 1}]
+    assert cache.stats()["errors"] == 1
+    assert cache.stats()["skipped"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_backs_off_then_recovers(fake_redis, monkeypatch):
+    url = fake_redis.url
+    await fake_redis.stop()
+    client = RedisClient(url, timeout=0.2)
+    opened = []
+    open_connection = client._open
+
+    async def counting_open():
+        opened.append(True)
+        return await open_connection()
+
+    monkeypatch.setattr(client, "_open", counting_open)
+    try:
+        with pytest.raises(OSError):
+            await client.execute("GET", "k")
+        for _ in range(20):
+            with pytest.raises(RedisUnavailable):
+                await client.execute("GET", "k")
+        assert len(opened) == 1
+
+        await fake_redis.start(port=client.port)
+        client._retry_at = 0.0
+        assert await client.execute("SET", "k", "v") == "OK"
+        assert client.failures == 0
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_share_a_bounded_pool(fake_redis):
+    client = RedisClient(fake_redis.url, pool_size=3)
+    try:
+        await client.execute("SET", "k", "v")
+        replies = await asyncio.gather(*(client.execute("GET", "k") for _ in range(20)))
+        assert replies == [b"v"] * 20
+        assert 1 < len(fake_redis.connections) <= 3
+
+        replies = await client.pipeline(("SET", "a", "1"), ("NOPE",), ("GET", "a"))
+        assert replies[0] == "OK" and replies[2] == b"1"
+        assert isinstance(replies[1], RedisError)
+    finally:
+        await client.close()
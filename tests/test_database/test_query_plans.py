@@ -0,0 +1,226 @@
+import json
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.auth.dao import RefreshTokenDAO
+from src.feed.dao import FeedDAO
+from src.geo.dao import CityDAO
+from src.likes.dao import LikeDAO
+from src.user_profile.dao import UserDAO, UserPhotoDAO, UserSocialMediaLinkDAO
+from tests.config import TEST_DATABASE_URL
+
+SEED_USERS = 20_000
+SEQ_SCAN_ROW_THRESHOLD = 1_000
+
+SEED_STATEMENTS = [
+    f"""
+    INSERT INTO users (
+        id, email, hash_password, name, surname, date_of_birth, bio,
+        gender, country, city, role
+    )
+    SELECT
+        gen_random_uuid(),
+        'seed_' || g || '@mail.com',
+        'x',
+        'Name',
+        'Surname',
+        date '1970-01-01' + (g % 12000),
+        CASE WHEN g % 10 = 0 THEN 'Books, coffee and hiking ' || g END,
+        CASE WHEN g % 2 = 0 THEN 'm' ELSE 'f' END,
+        'Country' || (g % 50),
+        'City' || (g % 500),
+        CASE WHEN g % 500 = 0 THEN 'moderator' ELSE 'user' END
+    FROM generate_series(1, {SEED_USERS}) AS g
+    """,
+    """
+    INSERT INTO user_photo (user_id, url)
+    SELECT id, 'https://example.com/' || n || '.jpg'
+    FROM users, generate_series(1, 3) AS n
+    """,
+    """
+    INSERT INTO user_social_media_links (user_id, link, name)
+    SELECT id, 'https://t.me/' || n, 'Telegram'
+    FROM users, generate_series(1, 2) AS n
+    """,
+    """
+    INSERT INTO refresh_tokens (user_id, token, created_at, active)
+    SELECT id, 'token_' || id, now(), true FROM users
+    """,
+    """
+    WITH numbered AS (
+        SELECT id, row_number() OVER (ORDER BY id) AS n FROM users
+    ), pairs AS (
+        SELECT least(a.id, b.id) AS low, greatest(a.id, b.id) AS high
+        FROM numbered a JOIN numbered b ON b.n = a.n + 1
+        WHERE a.n % 2 = 1
+    ), liked AS (
+        INSERT INTO likes (user_low, user_high, low_liked_at, high_liked_at)
+        SELECT low, high, now(), now() FROM pairs
+    )
+    INSERT INTO matches (user_id, other_id, matched_at)
+    SELECT low, high, now() FROM pairs
+    UNION ALL SELECT high, low, now() FROM pairs
+    """,
+    "ANALYZE users",
+    "ANALYZE user_photo",
+    "ANALYZE user_social_media_links",
+    "ANALYZE refresh_tokens",
+    "ANALYZE likes",
+    "ANALYZE matches",
+]
+
+
+@pytest_asyncio.fixture
+async def seeded_engine():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as connection:
+        for statement in SEED_STATEMENTS:
+            await connection.execute(text(statement))
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(
+                text(
+                    "TRUNCATE TABLE users, user_photo, user_social_media_links, "
+                    "refresh_tokens CASCADE"
+                )
+            )
+        await engine.dispose()
+
+
+async def run_dao_queries(db_session: AsyncSession) -> None:
+    sample = (
+        await db_session.execute(
+            text(
+                "SELECT u.id, u.email, p.id, l.id, t.token FROM users u "
+                "JOIN user_photo p ON p.user_id = u.id "
+                "JOIN user_social_media_links l ON l.user_id = u.id "
+                "JOIN refresh_tokens t ON t.user_id = u.id LIMIT 1"
+            )
+        )
+    ).one()
+    user_id, email, photo_id, link_id, token = sample
+
+    user_dao = UserDAO(db_session)
+    await user_dao.get_user_by_id(user_id)
+    await user_dao.get_user_by_email(email)
+    await user_dao.get_user_profiles([user_id])
+    await user_dao.get_users_by_ids([user_id])
+    await user_dao.get_users_page(limit=51)
+    await user_dao.get_users_page(limit=51, after_id=user_id)
+    await user_dao.get_users_page(limit=51, role="moderator")
+    await user_dao.get_users_page(limit=51, country="Country7", city="City7")
+    born = {"born_after": date(1980, 1, 1), "born_on_or_before": date(1995, 1, 1)}
+    await user_dao.search_users(21, **born, gender="f", country="Country7", city="City7")
+    await user_dao.search_users(21, **born, gender="f", country="Country7")
+    await user_dao.search_users(
+        21, **born, gender="f", after=(date(1990, 1, 1), user_id), exclude_id=user_id
+    )
+    await user_dao.search_users_by_bio("hiking trips", 21, **born, gender="f")
+    await user_dao.search_users_near(
+        [(1, 0.0), (2, 15.0)], 21, **born, gender="f", exclude_id=user_id
+    )
+    await user_dao.search_users_near([(2, 15.0)], 21, **born, after_id=user_id)
+    await user_dao.update_user(user_id, name="Renamed")
+    await user_dao.update_user(user_id, city="Moscow")
+    await user_dao.update_user_role(user_id, "moderator")
+
+    photo_dao = UserPhotoDAO(db_session)
+    await photo_dao.get_all_photos_by_user(user_id)
+    await photo_dao.get_photos_by_users([user_id])
+    await photo_dao.update_photo_by_id(photo_id, url="https://example.com/new.jpg")
+    await photo_dao.delete_photo_by_id(photo_id)
+    new_photos = await photo_dao.create_photos(user_id, ["https://example.com/a.jpg"])
+    await photo_dao.update_photos(
+        user_id, [(new_photos[0].id, "https://example.com/b.jpg")]
+    )
+    await photo_dao.delete_photos(user_id, [new_photos[0].id])
+
+    link_dao = UserSocialMediaLinkDAO(db_session)
+    await link_dao.get_all_links_by_user(user_id)
+    await link_dao.update_link_by_id(link_id, name="VK")
+    await link_dao.delete_link_by_id(link_id)
+    new_links = await link_dao.create_links(user_id, [("https://t.me/a", "Telegram")])
+    await link_dao.update_links(user_id, [(new_links[0].id, None, "TG")])
+    await link_dao.delete_links(user_id, [new_links[0].id])
+
+    city_dao = CityDAO(db_session)
+    await city_dao.get_city_by_id(1)
+    await city_dao.get_city_of_user(user_id)
+    await city_dao.get_cities_in_box(55.0, 56.5, 36.8, 38.4)
+
+    feed_dao = FeedDAO(db_session)
+    await feed_dao.save_feeds([(user_id, [user_id])])
+    await feed_dao.get_feed_page(user_id, 20, 20)
+
+    other_id = (await user_dao.get_users_page(limit=1, after_id=user_id))[0].id
+    like_dao = LikeDAO(db_session)
+    await like_dao.like(user_id, other_id)
+    await like_dao.like(other_id, user_id)
+    matches = await like_dao.get_matches_page(user_id, 21)
+    await like_dao.get_matches_page(user_id, 21, after=(matches[0].matched_at, other_id))
+    await like_dao.mark_matches_seen(user_id, [other_id])
+
+    refresh_dao = RefreshTokenDAO(db_session)
+    await refresh_dao.get_refresh_token(token)
+    await refresh_dao.revoke_refresh_token(token)
+    await refresh_dao.revoke_all_refresh_tokens_by_user(user_id)
+    await refresh_dao.delete_all_revoked_refresh_tokens_by_user(user_id)
+
+
+def iter_plan_nodes(node: Dict[str, Any]):
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+@pytest.mark.asyncio
+async def test_dao_queries_do_not_seq_scan_large_tables(seeded_engine):
+    captured: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(("EXPLAIN", "SELECT U.ID")):
+            captured.append((statement, parameters))
+
+    async with seeded_engine.connect() as connection:
+        relation_rows = {
+            name: rows
+            for name, rows in (
+                await connection.execute(
+                    text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r'")
+                )
+            ).all()
+        }
+
+        event.listen(connection.sync_connection, "before_cursor_execute", capture)
+        async with AsyncSession(bind=connection) as db_session:
+            async with db_session.begin():
+                await run_dao_queries(db_session)
+                event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+                offenders = []
+                for statement, parameters in captured:
+                    plan_result = await connection.exec_driver_sql(
+                        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                    )
+                    plan = plan_result.scalar()
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    for node in iter_plan_nodes(plan[0]["Plan"]):
+                        relation = node.get("Relation Name")
+                        if (
+                            node["Node Type"] == "Seq Scan"
+                            and relation_rows.get(relation, 0) > SEQ_SCAN_ROW_THRESHOLD
+                        ):
+                            offenders.append(f"{relation}: {statement}")
+
+                await db_session.rollback()
+
+    assert len(captured) >= 45
+    assert offenders == []
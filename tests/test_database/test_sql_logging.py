@@ -0,0 +1,91 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.sql_logging import SQLQueryLogger, fingerprint_statement, sql_logger
+from tests.config import TEST_DATABASE_URL
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def sql_records():
+    handler = ListHandler()
+    sql_logger.addHandler(handler)
+    try:
+        yield handler.records
+    finally:
+        sql_logger.removeHandler(handler)
+
+
+def test_fingerprint_strips_parameters_and_literals():
+    first, first_id = fingerprint_statement(
+        "SELECT users.id FROM users\n WHERE users.id = $1::UUID AND users.role = 'admin'"
+    )
+    second, second_id = fingerprint_statement(
+        "SELECT users.id FROM users WHERE users.id = $2::UUID AND users.role = 'user'"
+    )
+    assert first == "SELECT users.id FROM users WHERE users.id = ? AND users.role = ?"
+    assert first_id == second_id
+
+    in_list, _ = fingerprint_statement("SELECT 1 WHERE x IN ($1, $2, $3)")
+    assert in_list == "SELECT ? WHERE x IN (?+)"
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_always_logged(sql_records):
+    engine = create_async_engine(TEST_DATABASE_URL)
+    SQLQueryLogger(sample_rate=0.0, slow_query_ms=0.0).install(engine)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 42"))
+    finally:
+        await engine.dispose()
+
+    slow = [r for r in sql_records if r.sql["statement"] == "SELECT ?"]
+    assert len(slow) == 1
+    assert slow[0].levelno == logging.WARNING
+    assert slow[0].sql["duration_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_unsampled_fast_queries_are_skipped(sql_records):
+    engine = create_async_engine(TEST_DATABASE_URL)
+    SQLQueryLogger(sample_rate=0.0, slow_query_ms=60_000).install(engine)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 42"))
+    finally:
+        await engine.dispose()
+
+    assert sql_records == []
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_do_not_leave_timing_state(sql_records):
+    engine = create_async_engine(TEST_DATABASE_URL)
+    SQLQueryLogger(sample_rate=0.0, slow_query_ms=0.0).install(engine)
+    try:
+        async with engine.connect() as connection:
+            for _ in range(3):
+                with pytest.raises(DBAPIError):
+                    await connection.execute(text("SELECT 1 / 0"))
+                await connection.rollback()
+            await connection.execute(text("SELECT 42"))
+            assert "query_started_at" not in connection.sync_connection.info
+    finally:
+        await engine.dispose()
+
+    logged = [r.sql["statement"] for r in sql_records]
+    assert "SELECT ?" in logged
+    assert "SELECT ? / ?" not in logged
@@ -0,0 +1,206 @@
+import asyncio
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from src.feed import generator
+from src.feed.candidates import ProfileSnapshot
+from src.feed.generator import generate_feeds
+from src.user_profile.dao import UserDAO
+from src.user_profile.models import User
+
+# The fixture user is a man from Moscow with a bio, born 1990-05-15.
+PEOPLE = {
+    "anna": ("f", "Moscow", date(1990, 6, 1), "Reading"),
+    "vera": ("f", "Moscow", date(1990, 6, 1), None),
+    "olga": ("f", "Khimki", date(1991, 1, 1), "Hiking"),
+    "nina": ("f", "Tula", date(1990, 5, 15), "Cooking"),
+    "zoya": ("f", "Atlantis", date(1990, 5, 15), None),
+    "emma": ("f", "Berlin", date(1990, 5, 15), "Cycling"),
+    "lena": ("f", "Moscow", date(1970, 1, 1), "Gardening"),
+    "petr": ("m", "Moscow", date(1990, 5, 15), "Chess"),
+}
+
+
+@pytest_asyncio.fixture
+async def feed_candidates(test_db_async_session):
+    ids = {}
+    async with test_db_async_session.begin():
+        user_dao = UserDAO(test_db_async_session)
+        for name, (gender, city, date_of_birth, bio) in PEOPLE.items():
+            user = await user_dao.create_user(
+                email=f"{name}@mail.com",
+                hash_password="x",
+                name=name.title(),
+                surname="Feed",
+                date_of_birth=date_of_birth,
+                bio=bio,
+                gender=gender,
+                country="Germany" if city == "Berlin" else "Russia",
+                city=city,
+            )
+            ids[str(user.id)] = name
+    return ids
+
+
+async def get_feed(client, user, **params):
+    response = await client.get(
+        f"/users/{user['user_data']['user_id']}/feed",
+        params=params,
+        headers=user["headers"],
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_feed_is_empty_until_generated(client, user_with_token, feed_candidates):
+    assert await get_feed(client, user_with_token) == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_feed_ranks_by_location_age_and_bio(
+    client, user_with_token, feed_candidates, test_db_async_session
+):
+    assert await generate_feeds(test_db_async_session) == len(PEOPLE) + 1
+
+    page = await get_feed(client, user_with_token)
+    assert [feed_candidates[user["user_id"]] for user in page["items"]] == [
+        "anna",
+        "olga",
+        "vera",
+        "nina",
+        "zoya",
+    ]
+    assert page["next_cursor"] is None
+    assert not {"email", "role"} & set(page["items"][0])
+
+
+@pytest.mark.asyncio
+async def test_feed_pages_through_candidates(
+    client, user_with_token, feed_candidates, test_db_async_session
+):
+    await generate_feeds(test_db_async_session)
+
+    seen = []
+    page = await get_feed(client, user_with_token, limit=2)
+    while True:
+        seen.extend(feed_candidates[user["user_id"]] for user in page["items"])
+        if page["next_cursor"] is None:
+            break
+        page = await get_feed(
+            client, user_with_token, limit=2, cursor=page["next_cursor"]
+        )
+    assert seen == ["anna", "olga", "vera", "nina", "zoya"]
+
+
+@pytest.mark.asyncio
+async def test_feed_skips_deleted_candidates(
+    client, user_with_token, feed_candidates, test_db_async_session
+):
+    await generate_feeds(test_db_async_session)
+    anna_id = next(id for id, name in feed_candidates.items() if name == "anna")
+    async with test_db_async_session.begin():
+        await test_db_async_session.execute(delete(User).where(User.id == anna_id))
+
+    page = await get_feed(client, user_with_token)
+    assert [feed_candidates[user["user_id"]] for user in page["items"]] == [
+        "olga",
+        "vera",
+        "nina",
+        "zoya",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generation_skips_users_deleted_after_the_snapshot(
+    client, user_with_token, feed_candidates, test_db_async_session, monkeypatch
+):
+    anna_id = next(id for id, name in feed_candidates.items() if name == "anna")
+    load_snapshot = generator.load_snapshot
+
+    async def load_then_delete(db_session, batch_size):
+        snapshot = await load_snapshot(db_session, batch_size)
+        async with db_session.begin():
+            await db_session.execute(delete(User).where(User.id == anna_id))
+        return snapshot
+
+    monkeypatch.setattr(generator, "load_snapshot", load_then_delete)
+    assert await generate_feeds(test_db_async_session) == len(PEOPLE) + 1
+
+    page = await get_feed(client, user_with_token)
+    assert [feed_candidates[user["user_id"]] for user in page["items"]] == [
+        "olga",
+        "vera",
+        "nina",
+        "zoya",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generation_loop_survives_a_failed_run(monkeypatch):
+    runs = []
+
+    async def generate_feeds(db_session):
+        runs.append(db_session)
+        if len(runs) == 1:
+            raise RuntimeError("database went away")
+        return 0
+
+    async def sleep(seconds):
+        if len(runs) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(generator, "generate_feeds", generate_feeds)
+    monkeypatch.setattr(generator.asyncio, "sleep", sleep)
+    with pytest.raises(asyncio.CancelledError):
+        await generator.main(interval_seconds=60)
+    assert len(runs) == 2
+
+    with pytest.raises(RuntimeError):
+        runs.clear()
+        await generator.main(interval_seconds=0)
+
+
+def test_age_span_must_be_positive():
+    with pytest.raises(ValueError):
+        ProfileSnapshot([], age_span_years=0)
+
+
+@pytest.mark.asyncio
+async def test_feed_cursor_expires_on_regeneration(
+    client, user_with_token, feed_candidates, test_db_async_session
+):
+    await generate_feeds(test_db_async_session)
+    page = await get_feed(client, user_with_token, limit=2)
+
+    await generate_feeds(test_db_async_session)
+    response = await client.get(
+        f"/users/{user_with_token['user_data']['user_id']}/feed",
+        params={"limit": 2, "cursor": page["next_cursor"]},
+        headers=user_with_token["headers"],
+    )
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_feed_of_another_user_is_forbidden(client, two_users_with_tokens):
+    user1 = two_users_with_tokens["user1"]
+    user2 = two_users_with_tokens["user2"]
+    response = await client.get(
+        f"/users/{user2['user_data']['user_id']}/feed", headers=user1["headers"]
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["bad", "eyJvZmZzZXQiOi0xfQ"])
+async def test_feed_rejects_invalid_cursor(client, user_with_token, cursor):
+    response = await client.get(
+        f"/users/{user_with_token['user_data']['user_id']}/feed",
+        params={"cursor": cursor},
+        headers=user_with_token["headers"],
+    )
+    assert response.status_code == 400
@@ -0,0 +1,44 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_db_pool_metrics(client, user_with_token, admin_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    resp = await client.get(f"/users/{user_id}")
+    assert resp.status_code == 200
+
+    metrics = await client.get(
+        "/internal/metrics/db-pool", headers=admin_with_token["headers"]
+    )
+    assert metrics.status_code == 200
+    body = metrics.json()
+    for key in ("size", "checked_in", "checked_out", "overflow", "avg_wait_seconds"):
+        assert key in body
+    assert body["checkouts"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_password_hash_metrics(client, user_with_token, admin_with_token):
+    metrics = await client.get(
+        "/internal/metrics/password-hash", headers=admin_with_token["headers"]
+    )
+    assert metrics.status_code == 200
+    body = metrics.json()
+    assert body["completed"] >= 2
+    assert body["in_flight"] == 0
+    assert "avg_hash_seconds" in body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/internal/metrics/db-pool",
+        "/internal/metrics/password-hash",
+        "/internal/metrics/caches",
+    ],
+)
+async def test_metrics_require_admin(client, user_with_token, path):
+    assert (await client.get(path)).status_code == 401
+    response = await client.get(path, headers=user_with_token["headers"])
+    assert response.status_code == 403
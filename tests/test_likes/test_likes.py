@@ -0,0 +1,192 @@
+import asyncio
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.likes.dao import LikeDAO
+from src.likes.models import Like, Match
+from src.user_profile.dao import UserDAO
+from src.user_profile.models import User
+from tests.config import TEST_DATABASE_URL
+
+
+async def like(client, user, other_id):
+    response = await client.put(f"/likes/{other_id}", headers=user["headers"])
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def get_matches(client, user, **params):
+    response = await client.get("/matches", params=params, headers=user["headers"])
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def create_users(db_session, count):
+    ids = []
+    async with db_session.begin():
+        user_dao = UserDAO(db_session)
+        for n in range(count):
+            user = await user_dao.create_user(
+                email=f"liker_{n}@mail.com",
+                hash_password="x",
+                name="Liker",
+                surname="Test",
+                date_of_birth=date(1995, 1, 1),
+                bio=None,
+                gender="f",
+                country="Russia",
+                city="Moscow",
+            )
+            ids.append(user.id)
+    return ids
+
+
+async def count_rows(db_session, model):
+    async with db_session.begin():
+        return await db_session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_like_back_creates_match_for_both_users(client, two_users_with_tokens):
+    user1 = two_users_with_tokens["user1"]
+    user2 = two_users_with_tokens["user2"]
+    user1_id = user1["user_data"]["user_id"]
+    user2_id = user2["user_data"]["user_id"]
+
+    assert await like(client, user1, user2_id) == {"user_id": user2_id, "matched": False}
+    assert (await get_matches(client, user1))["items"] == []
+
+    assert await like(client, user2, user1_id) == {"user_id": user1_id, "matched": True}
+    assert await like(client, user1, user2_id) == {"user_id": user2_id, "matched": True}
+
+    inbox1 = await get_matches(client, user1)
+    inbox2 = await get_matches(client, user2)
+    assert [item["user"]["user_id"] for item in inbox1["items"]] == [user2_id]
+    assert [item["user"]["user_id"] for item in inbox2["items"]] == [user1_id]
+    assert inbox1["items"][0]["matched_at"] == inbox2["items"][0]["matched_at"]
+    assert inbox1["items"][0]["seen"] is False
+    assert not {"email", "role"} & set(inbox1["items"][0]["user"])
+
+
+@pytest.mark.asyncio
+async def test_like_rejects_self_and_unknown_users(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    response = await client.put(f"/likes/{user_id}", headers=headers)
+    assert response.status_code == 400
+
+    response = await client.put(f"/likes/{uuid.uuid4()}", headers=headers)
+    assert response.status_code == 404
+
+    response = await client.put(f"/likes/{uuid.uuid4()}")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_inbox_pages_newest_first_and_acknowledges_seen(
+    client, user_with_token, test_db_async_session
+):
+    user_id = uuid.UUID(user_with_token["user_data"]["user_id"])
+    other_ids = await create_users(test_db_async_session, 5)
+    for other_id in other_ids:
+        async with test_db_async_session.begin():
+            await LikeDAO(test_db_async_session).like(other_id, user_id)
+        assert (await like(client, user_with_token, other_id))["matched"] is True
+
+    seen = []
+    page = await get_matches(client, user_with_token, limit=2)
+    while True:
+        seen.extend(item["user"]["user_id"] for item in page["items"])
+        if page["next_cursor"] is None:
+            break
+        cursor = page["next_cursor"]
+        page = await get_matches(client, user_with_token, limit=2, cursor=cursor)
+    assert seen == [str(id) for id in reversed(other_ids)]
+
+    acknowledge = [str(other_ids[0]), str(other_ids[1]), str(other_ids[0])]
+    response = await client.post(
+        "/matches/seen",
+        json={"user_ids": acknowledge},
+        headers=user_with_token["headers"],
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()["acknowledged"]) == sorted(acknowledge[:2])
+
+    response = await client.post(
+        "/matches/seen",
+        json={"user_ids": acknowledge},
+        headers=user_with_token["headers"],
+    )
+    assert response.json() == {"acknowledged": []}
+
+    page = await get_matches(client, user_with_token)
+    assert {item["user"]["user_id"] for item in page["items"] if item["seen"]} == set(
+        acknowledge[:2]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body",
+    [{"user_ids": []}, {"user_ids": [str(uuid.uuid4()) for _ in range(101)]}],
+)
+async def test_seen_batch_is_bounded(client, user_with_token, body):
+    response = await client.post(
+        "/matches/seen", json=body, headers=user_with_token["headers"]
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["bad", "eyJpZCI6MX0"])
+async def test_inbox_rejects_invalid_cursor(client, user_with_token, cursor):
+    response = await client.get(
+        "/matches", params={"cursor": cursor}, headers=user_with_token["headers"]
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_mutual_likes_match_once(test_db_async_session):
+    user1_id, user2_id = await create_users(test_db_async_session, 2)
+    engine = create_async_engine(TEST_DATABASE_URL)
+
+    async def like_in_own_transaction(user_id, other_id):
+        async with AsyncSession(engine) as db_session:
+            async with db_session.begin():
+                return await LikeDAO(db_session).like(user_id, other_id)
+
+    try:
+        for _ in range(10):
+            results = await asyncio.gather(
+                like_in_own_transaction(user1_id, user2_id),
+                like_in_own_transaction(user2_id, user1_id),
+            )
+            assert True in results
+            assert await count_rows(test_db_async_session, Match) == 2
+            async with test_db_async_session.begin():
+                await test_db_async_session.execute(delete(Like))
+                await test_db_async_session.execute(delete(Match))
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_deleting_user_removes_likes_and_matches(test_db_async_session):
+    user1_id, user2_id, user3_id = await create_users(test_db_async_session, 3)
+    async with test_db_async_session.begin():
+        like_dao = LikeDAO(test_db_async_session)
+        await like_dao.like(user1_id, user2_id)
+        await like_dao.like(user2_id, user1_id)
+        await like_dao.like(user3_id, user1_id)
+
+    async with test_db_async_session.begin():
+        await test_db_async_session.execute(delete(User).where(User.id == user1_id))
+
+    assert await count_rows(test_db_async_session, Like) == 0
+    assert await count_rows(test_db_async_session, Match) == 0
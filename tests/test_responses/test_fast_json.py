@@ -0,0 +1,87 @@
+import json
+import uuid
+from datetime import date
+from typing import List
+
+import pytest
+from fastapi.routing import serialize_response
+
+from src.main import app
+from src.responses import FastJSONResponse, FastJSONRoute, PrerenderedResponseField
+from src.user_profile.schemas import UserRead
+
+USER = UserRead(
+    user_id=uuid.uuid4(),
+    email="ivan@mail.com",
+    name="Ivan",
+    surname="Ivanov",
+    date_of_birth=date(1990, 1, 1),
+    gender="m",
+    country="Russia",
+    city="Moscow",
+    role="user",
+)
+
+
+async def list_users() -> List[UserRead]:
+    return []
+
+
+def test_all_api_routes_use_fast_json():
+    api_routes = [route for route in app.routes if hasattr(route, "response_class")]
+    assert api_routes
+    for route in api_routes:
+        assert isinstance(route, FastJSONRoute), route.path
+        if route.response_model is not None:
+            assert route.response_class is FastJSONResponse, route.path
+
+
+@pytest.mark.asyncio
+async def test_fast_path_is_used_by_app_routes(client, user_with_token, monkeypatch):
+    calls = []
+    original = PrerenderedResponseField.serialize
+
+    def counting_serialize(self, value, **kwargs):
+        calls.append(self._is_trusted(value))
+        return original(self, value, **kwargs)
+
+    monkeypatch.setattr(PrerenderedResponseField, "serialize", counting_serialize)
+    user_id = user_with_token["user_data"]["user_id"]
+    resp = await client.get(f"/users/{user_id}")
+
+    assert resp.status_code == 200
+    assert resp.json()["user_id"] == user_id
+    assert calls == [True]
+
+
+@pytest.mark.asyncio
+async def test_prerendered_body_matches_model_dump():
+    route = FastJSONRoute("/users", list_users, response_model=List[UserRead])
+    content = await serialize_response(
+        field=route.secure_cloned_response_field, response_content=[USER, USER]
+    )
+
+    body = FastJSONResponse(content).body
+    assert json.loads(body) == [USER.model_dump(mode="json")] * 2
+
+
+@pytest.mark.asyncio
+async def test_untrusted_content_is_still_validated():
+    route = FastJSONRoute("/users", list_users, response_model=List[UserRead])
+    field = route.secure_cloned_response_field
+
+    value, errors = field.validate([USER.model_dump()], {}, loc=("response",))
+    assert errors is None
+    assert value == [USER]
+
+    value, errors = field.validate([{"email": "not-an-email"}], {}, loc=("response",))
+    assert errors
+
+
+@pytest.mark.asyncio
+async def test_cookies_and_headers_survive_fast_path(client, data_user_with_password):
+    resp = await client.post("/auth/register", json=data_user_with_password)
+    assert resp.status_code == 201
+    assert resp.headers["content-type"] == "application/json"
+    assert "access_token" in resp.cookies
+    assert set(resp.json()) >= {"access_token", "refresh_token"}
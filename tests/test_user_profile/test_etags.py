@@ -0,0 +1,133 @@
+import uuid
+
+import pytest
+
+from src.user_profile.cache import PROFILE_CACHES, user_cache
+from src.user_profile.dao import UserDAO
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_304_from_one_load(
+    client, user_with_token, monkeypatch
+):
+    user_id = user_with_token["user_data"]["user_id"]
+    first = await client.get(f"/users/{user_id}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    calls = []
+    original = UserDAO.get_user_by_id
+
+    async def counting_get_user_by_id(self, id):
+        calls.append(id)
+        return await original(self, id)
+
+    monkeypatch.setattr(UserDAO, "get_user_by_id", counting_get_user_by_id)
+    second = await client.get(f"/users/{user_id}", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+    assert calls == []
+
+    for cache in PROFILE_CACHES:
+        cache.clear()
+    third = await client.get(f"/users/{user_id}", headers={"If-None-Match": etag})
+    assert third.status_code == 304
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_etag_always_describes_the_cached_body(
+    client, user_with_token, test_db_async_session
+):
+    user_id = user_with_token["user_data"]["user_id"]
+    etag = (await client.get(f"/users/{user_id}")).headers["etag"]
+
+    # A write made elsewhere whose invalidation has not reached this worker yet.
+    async with test_db_async_session.begin():
+        await UserDAO(test_db_async_session).update_user(uuid.UUID(user_id), name="Petr")
+
+    stale = await client.get(f"/users/{user_id}", headers={"If-None-Match": etag})
+    assert stale.status_code == 304
+
+    user_cache.clear()
+    fresh = await client.get(f"/users/{user_id}", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["name"] == "Petr"
+    assert fresh.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_after_user_update(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    etag = (await client.get(f"/users/{user_id}")).headers["etag"]
+
+    patch = await client.patch(
+        f"/users/{user_id}", json={"name": "Petr"}, headers=headers
+    )
+    assert patch.status_code == 200
+
+    resp = await client.get(f"/users/{user_id}", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["name"] == "Petr"
+    assert resp.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_and_profile_etags_track_their_rows(
+    client, user_with_token, data_user_photo, data_user_social_link
+):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    paths = ["", "/photos", "/social-links", "/profile"]
+    before = {
+        path: (await client.get(f"/users/{user_id}{path}")).headers["etag"]
+        for path in paths
+    }
+
+    photo = await client.post(
+        f"/users/{user_id}/photos", json=data_user_photo, headers=headers
+    )
+    assert photo.status_code == 201
+    photo_id = photo.json()["id"]
+
+    after = {}
+    for path in paths:
+        resp = await client.get(
+            f"/users/{user_id}{path}", headers={"If-None-Match": before[path]}
+        )
+        after[path] = resp.headers["etag"]
+        expected_status = 304 if path in ("", "/social-links") else 200
+        assert resp.status_code == expected_status, path
+
+    patch = await client.patch(
+        f"/users/{user_id}/photos/{photo_id}",
+        json={"id": photo_id, "url": "https://example.com/other.jpg"},
+        headers=headers,
+    )
+    assert patch.status_code == 200
+
+    resp = await client.get(
+        f"/users/{user_id}/photos", headers={"If-None-Match": after["/photos"]}
+    )
+    assert resp.status_code == 200
+    assert resp.json()[0]["url"] == "https://example.com/other.jpg"
+
+
+@pytest.mark.asyncio
+async def test_etag_wildcard_and_weak_validators(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    etag = (await client.get(f"/users/{user_id}/photos")).headers["etag"]
+
+    for header in ("*", f'"other", W/{etag}'):
+        resp = await client.get(
+            f"/users/{user_id}/photos", headers={"If-None-Match": header}
+        )
+        assert resp.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_of_missing_user_404(client):
+    resp = await client.get(f"/users/{uuid.uuid4()}", headers={"If-None-Match": "*"})
+    assert resp.status_code == 404
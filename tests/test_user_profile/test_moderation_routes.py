@@ -13,7 +13,7 @@ async def test_admin_get_users_forbidden_for_user(client, user_with_token):
 async def test_admin_get_users_ok_for_admin(client, admin_with_token, user_with_token):
     resp = await client.get("/admin/users", headers=admin_with_token["headers"])
     assert resp.status_code == 200
-    users = resp.json()
+    users = resp.json()["items"]
     assert isinstance(users, list)
 
 
@@ -38,12 +38,12 @@ async def test_get_moderators_and_admins_lists(client, admin_with_token, user_wi
         "/admin/users/moderators", headers=admin_with_token["headers"]
     )
     assert moderators.status_code == 200
-    emails = [u["email"] for u in moderators.json()]
+    emails = [u["email"] for u in moderators.json()["items"]]
     assert user_with_token["user_data"]["email"] in emails
 
     admins = await client.get("/admin/users/admins", headers=admin_with_token["headers"])
     assert admins.status_code == 200
-    assert isinstance(admins.json(), list)
+    assert isinstance(admins.json()["items"], list)
 
 
 @pytest.mark.asyncio
@@ -82,3 +82,64 @@ async def test_promote_and_demote_permissions_and_errors(
         f"/admin/users/{uuid.uuid4()}/promote", headers=admin_with_token["headers"]
     )
     assert promote_404.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_admin_get_users_keyset_pagination(client, admin_with_token):
+    for i in range(5):
+        reg = await client.post(
+            "/auth/register",
+            json={
+                "email": f"page_{i}_{uuid.uuid4().hex[:8]}@mail.com",
+                "password": "PagePassword123!",
+                "name": "Page",
+                "surname": "User",
+                "date_of_birth": "1990-01-01",
+                "gender": "f",
+                "country": "Russia",
+                "city": "Kazan" if i % 2 else "Moscow",
+            },
+        )
+        assert reg.status_code == 201
+    client.cookies.clear()
+    headers = admin_with_token["headers"]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = await client.get("/admin/users", params=params, headers=headers)
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page["items"]) <= 2
+        seen.extend(u["user_id"] for u in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 6
+    assert len(set(seen)) == 6
+    assert seen == sorted(seen)
+
+    kazan = await client.get(
+        "/admin/users", params={"city": "Kazan", "country": "Russia"}, headers=headers
+    )
+    assert kazan.status_code == 200
+    assert len(kazan.json()["items"]) == 2
+    assert kazan.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_admin_get_users_rejects_bad_cursor_and_page_size(client, admin_with_token):
+    headers = admin_with_token["headers"]
+    bad_cursor = await client.get(
+        "/admin/users", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert bad_cursor.status_code == 400
+
+    too_large = await client.get(
+        "/admin/users", params={"limit": 10_000}, headers=headers
+    )
+    assert too_large.status_code == 422
@@ -0,0 +1,149 @@
+import hashlib
+
+import pytest
+
+from src.multipart import MultipartError, MultipartReader, parse_boundary
+from src.storage import StorageBackend, media_storage
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 40
+JPEG = b"\xff\xd8\xff\xe0" + b"jpeg body" * 1000
+
+
+@pytest.fixture
+def media_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(media_storage, "root", tmp_path)
+    return tmp_path
+
+
+def stored_files(root):
+    return sorted(
+        path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file()
+    )
+
+
+async def upload(client, user_id, headers, content, name="file", data=None):
+    return await client.post(
+        f"/users/{user_id}/photos/upload",
+        files={name: ("photo.bin", content, "application/octet-stream")},
+        data=data,
+        headers=headers,
+    )
+
+
+@pytest.mark.asyncio
+async def test_upload_stores_file_by_content_hash(client, user_with_token, media_root):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    response = await upload(client, user_id, headers, PNG, data={"caption": "hi"})
+    assert response.status_code == 201, response.text
+    photo = response.json()
+    digest = hashlib.sha256(PNG).hexdigest()
+    assert photo["user_id"] == user_id
+    assert photo["url"] == f"/media/{digest[:2]}/{digest[2:4]}/{digest}.png"
+    assert (media_root / photo["url"].removeprefix("/media/")).read_bytes() == PNG
+
+    photos = (await client.get(f"/users/{user_id}/photos")).json()
+    assert [item["id"] for item in photos] == [photo["id"]]
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_share_one_file(
+    client, two_users_with_tokens, media_root
+):
+    first = two_users_with_tokens["user1"]
+    second = two_users_with_tokens["user2"]
+
+    responses = [
+        await upload(client, user["user_data"]["user_id"], user["headers"], JPEG)
+        for user in (first, first, second)
+    ]
+    assert [response.status_code for response in responses] == [201, 201, 201]
+    assert len({response.json()["id"] for response in responses}) == 3
+    assert len({response.json()["url"] for response in responses}) == 1
+    assert responses[0].json()["url"].endswith(".jpg")
+    assert len(stored_files(media_root)) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_too_large_413(client, user_with_token, media_root, monkeypatch):
+    monkeypatch.setattr("src.user_profile.service.PHOTO_UPLOAD_MAX_BYTES", 1024)
+    user_id = user_with_token["user_data"]["user_id"]
+    response = await upload(client, user_id, user_with_token["headers"], PNG)
+    assert response.status_code == 413
+    assert stored_files(media_root) == []
+    assert (await client.get(f"/users/{user_id}/photos")).json() == []
+
+
+@pytest.mark.asyncio
+async def test_upload_rejects_invalid_bodies(client, user_with_token, media_root):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    response = await upload(client, user_id, headers, b"GIF89a not supported")
+    assert response.status_code == 415
+
+    response = await client.post(
+        f"/users/{user_id}/photos/upload", json={"url": "x"}, headers=headers
+    )
+    assert response.status_code == 415
+
+    response = await upload(client, user_id, headers, PNG, name="photo")
+    assert response.status_code == 400
+
+    response = await client.post(
+        f"/users/{user_id}/photos/upload",
+        content=b"--xyz\r\nContent-Disposition: form-data; name=file\r\n\r\n\x89PNG",
+        headers={**headers, "Content-Type": "multipart/form-data; boundary=xyz"},
+    )
+    assert response.status_code == 400
+    assert stored_files(media_root) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_for_other_user_403(client, two_users_with_tokens, media_root):
+    other_id = two_users_with_tokens["user2"]["user_data"]["user_id"]
+    headers = two_users_with_tokens["user1"]["headers"]
+    response = await upload(client, other_id, headers, PNG)
+    assert response.status_code == 403
+    assert stored_files(media_root) == []
+
+
+@pytest.mark.asyncio
+async def test_multipart_reader_handles_split_chunks():
+    body = (
+        b"preamble\r\n--b0undary\r\n"
+        b'Content-Disposition: form-data; name="note"\r\n\r\n'
+        b"hello\r\n--b0undary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="a \\"b\\".png"\r\n'
+        b"Content-Type: image/png\r\n\r\n"
+        b"\r\n--b0undar\r\n-\r\n--b0undary--\r\nepilogue"
+    )
+
+    async def one_byte_chunks():
+        for index in range(len(body)):
+            yield body[index : index + 1]
+
+    reader = MultipartReader(one_byte_chunks(), b"b0undary")
+    note = await reader.next_part()
+    assert note.name == "note" and note.filename is None
+    part = await reader.next_part()
+    assert part.name == "file" and part.filename == 'a "b".png'
+    assert part.content_type == "image/png"
+    assert b"".join([chunk async for chunk in reader.read_part()]) == (
+        b"\r\n--b0undar\r\n-"
+    )
+    assert await reader.next_part() is None
+
+    assert parse_boundary('multipart/form-data; boundary="b0undary"') == b"b0undary"
+    with pytest.raises(MultipartError):
+        parse_boundary("application/json")
+
+
+def test_incomplete_storage_backend_cannot_be_created():
+    class UrlOnlyStorage(StorageBackend):
+        def url_for(self, key):
+            return key
+
+    with pytest.raises(TypeError):
+        UrlOnlyStorage()
@@ -0,0 +1,262 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from src.cache import NegativeCache, SingleFlight, TTLCache
+from src.user_profile.cache import (
+    PROFILE_CACHES,
+    missing_users,
+    profile_loads,
+    user_cache,
+)
+from src.user_profile.dao import UserDAO
+
+
+# Counts reads of single users from the users table.
+@pytest.fixture
+def count_user_lookups(monkeypatch):
+    calls = []
+
+    def counting(name):
+        original = getattr(UserDAO, name)
+
+        async def counting_lookup(self, id):
+            calls.append((name, id))
+            return await original(self, id)
+
+        monkeypatch.setattr(UserDAO, name, counting_lookup)
+
+    counting("get_user_by_id")
+    for cache in PROFILE_CACHES:
+        cache.clear()
+    missing_users.clear()
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_get_user_served_from_cache(client, user_with_token, count_user_lookups):
+    user_id = user_with_token["user_data"]["user_id"]
+
+    for _ in range(3):
+        resp = await client.get(f"/users/{user_id}")
+        assert resp.status_code == 200
+
+    assert len(count_user_lookups) == 1
+    assert user_cache.local.hits >= 2
+
+
+@pytest.mark.asyncio
+async def test_users_batch_loads_only_uncached_ids(
+    client, two_users_with_tokens, count_user_lookups, monkeypatch
+):
+    user1_id = two_users_with_tokens["user1"]["user_data"]["user_id"]
+    user2_id = two_users_with_tokens["user2"]["user_data"]["user_id"]
+    missing_id = str(uuid.uuid4())
+    batches = []
+    original = UserDAO.get_users_by_ids
+
+    async def counting_batch(self, ids):
+        batches.append(sorted(str(id) for id in ids))
+        return await original(self, ids)
+
+    monkeypatch.setattr(UserDAO, "get_users_by_ids", counting_batch)
+
+    assert (await client.get(f"/users/{user1_id}")).status_code == 200
+    body = {"ids": [user1_id, user2_id, missing_id]}
+    for _ in range(2):
+        response = await client.post("/users/batch", json=body)
+        assert [item["found"] for item in response.json()] == [True, True, False]
+
+    assert batches == [sorted([user2_id, missing_id])]
+
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_cached_profile(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    first = await client.get(f"/users/{user_id}")
+    assert first.json()["name"] == "Ivan"
+
+    patch = await client.patch(
+        f"/users/{user_id}", json={"name": "Petr"}, headers=headers
+    )
+    assert patch.status_code == 200
+
+    second = await client.get(f"/users/{user_id}")
+    assert second.json()["name"] == "Petr"
+
+
+@pytest.mark.asyncio
+async def test_photo_and_link_mutations_invalidate_cached_lists(
+    client, user_with_token, data_user_photo, data_user_social_link
+):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    assert (await client.get(f"/users/{user_id}/photos")).json() == []
+    assert (await client.get(f"/users/{user_id}/social-links")).json() == []
+
+    photo = await client.post(
+        f"/users/{user_id}/photos", json=data_user_photo, headers=headers
+    )
+    link = await client.post(
+        f"/users/{user_id}/social-links", json=data_user_social_link, headers=headers
+    )
+    assert len((await client.get(f"/users/{user_id}/photos")).json()) == 1
+    assert len((await client.get(f"/users/{user_id}/social-links")).json()) == 1
+
+    photo_id = photo.json()["id"]
+    link_id = link.json()["id"]
+    await client.delete(f"/users/{user_id}/photos/{photo_id}", headers=headers)
+    await client.delete(f"/users/{user_id}/social-links/{link_id}", headers=headers)
+    assert (await client.get(f"/users/{user_id}/photos")).json() == []
+    assert (await client.get(f"/users/{user_id}/social-links")).json() == []
+
+
+@pytest.fixture
+def slow_user_lookups(monkeypatch, count_user_lookups):
+    def slowed(name):
+        counting_lookup = getattr(UserDAO, name)
+
+        async def slow_lookup(self, id):
+            await asyncio.sleep(0.2)
+            return await counting_lookup(self, id)
+
+        monkeypatch.setattr(UserDAO, name, slow_lookup)
+
+    slowed("get_user_by_id")
+    return count_user_lookups
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_lookup(
+    client, user_with_token, slow_user_lookups
+):
+    user_id = user_with_token["user_data"]["user_id"]
+    collapsed_before = profile_loads.collapsed
+
+    responses = await asyncio.gather(*(client.get(f"/users/{user_id}") for _ in range(8)))
+
+    assert [resp.status_code for resp in responses] == [200] * 8
+    assert [name for name, _ in slow_user_lookups] == ["get_user_by_id"]
+    assert profile_loads.collapsed - collapsed_before == 7
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_of_missing_user_all_get_404(client, slow_user_lookups):
+    missing_id = uuid.uuid4()
+
+    responses = await asyncio.gather(
+        *(client.get(f"/users/{missing_id}") for _ in range(5))
+    )
+
+    assert [resp.status_code for resp in responses] == [404] * 5
+    assert len({resp.json()["detail"] for resp in responses}) == 1
+    assert len(slow_user_lookups) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_hands_over_when_leader_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def hanging_loader():
+        started.set()
+        await asyncio.sleep(60)
+
+    async def quick_loader():
+        return "value"
+
+    leader = asyncio.ensure_future(flight.do("key", hanging_loader))
+    await started.wait()
+    follower = asyncio.ensure_future(flight.do("key", quick_loader))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "value"
+    assert flight.stats() == {"calls": 2, "collapsed": 1, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_repeated_misses_answered_from_negative_cache(client, count_user_lookups):
+    missing_id = uuid.uuid4()
+
+    for path in ("", "/photos", "/social-links", ""):
+        resp = await client.get(f"/users/{missing_id}{path}")
+        assert resp.status_code == 404
+        assert resp.json()["detail"] == f"User with id {missing_id} doesn't exist"
+
+    assert len(count_user_lookups) == 1
+
+
+def test_negative_cache_is_exact_and_bounded():
+    cache = NegativeCache(capacity=100, ttl=60)
+    missing = [uuid.uuid4() for _ in range(150)]
+    for key in missing:
+        cache.add(key)
+
+    assert not any(uuid.uuid4() in cache for _ in range(10_000))
+    assert all(key in cache for key in missing[50:])
+    assert not any(key in cache for key in missing[:50])
+
+
+def test_negative_cache_discard_and_expiry():
+    cache = NegativeCache(capacity=100, ttl=0.2)
+    created, missing = uuid.uuid4(), uuid.uuid4()
+    cache.add(created)
+    cache.add(missing)
+
+    cache.discard(created)
+    assert created not in cache
+    assert missing in cache
+
+    time.sleep(0.25)
+    assert missing not in cache
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_load_overlapping_invalidation():
+    cache = TTLCache(maxsize=10, ttl=60)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return "stale"
+
+    load = asyncio.ensure_future(cache.get_or_load("key", slow_loader))
+    await started.wait()
+    cache.delete("key")
+    release.set()
+
+    assert await load == "stale"
+    assert cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics_endpoint(client, admin_with_token):
+    resp = await client.get(
+        "/internal/metrics/caches", headers=admin_with_token["headers"]
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert {"backend", "hits", "misses", "evictions"} <= set(body["profile"])
+    assert {"current_user", "refresh_token_state", "user"} <= set(body)
+    assert {"calls", "collapsed"} <= set(body["profile_loads"])
+    assert {"capacity", "size", "hits"} <= set(body["missing_users"])
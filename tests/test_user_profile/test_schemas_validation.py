@@ -117,3 +117,39 @@ def test_user_photo_create_invalid(payload):
 
     with pytest.raises(Exception):
         UserPhotoCreate(**payload)
+
+
+def test_read_models_built_from_orm_rows_without_revalidation(monkeypatch):
+    import uuid
+    from types import SimpleNamespace
+
+    from src.user_profile.schemas import UserProfileRead, UserRead
+
+    user_id = uuid.uuid4()
+    row = SimpleNamespace(
+        id=user_id,
+        email="ivan@mail.com",
+        name="Ivan",
+        surname="Ivanov",
+        date_of_birth=datetime.date(1990, 1, 1),
+        bio=None,
+        gender="m",
+        country="Russia",
+        city="Moscow",
+        role="user",
+        photos=[SimpleNamespace(id=1, user_id=user_id, url="https://x.com/1.jpg")],
+        social_media_links=[
+            SimpleNamespace(id=2, user_id=user_id, name="VK", link="https://vk.com/i")
+        ],
+    )
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("read models must not re-validate ORM rows")
+
+    monkeypatch.setattr(UserRead, "__init__", fail_validation)
+    profile = UserProfileRead.from_orm_obj(row)
+
+    assert profile.user_id == user_id
+    assert profile.photos[0].url == "https://x.com/1.jpg"
+    assert profile.social_media_links[0].name == "VK"
+    assert profile.model_dump(mode="json")["date_of_birth"] == "1990-01-01"
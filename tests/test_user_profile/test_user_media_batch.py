@@ -0,0 +1,258 @@
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from src.user_profile.dao import UserPhotoDAO
+
+
+async def create_photos(client, user_with_token, count):
+    user_id = user_with_token["user_data"]["user_id"]
+    payload = {"items": [{"url": f"https://example.com/{n}.jpg"} for n in range(count)]}
+    response = await client.post(
+        f"/users/{user_id}/photos/batch",
+        json=payload,
+        headers=user_with_token["headers"],
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_create_photos_batch_keeps_request_order(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+
+    results = await create_photos(client, user_with_token, 9)
+
+    assert [result["status"] for result in results] == [201] * 9
+    assert [result["photo"]["url"] for result in results] == [
+        f"https://example.com/{n}.jpg" for n in range(9)
+    ]
+    resp_get = await client.get(f"/users/{user_id}/photos")
+    assert sorted(photo["id"] for photo in resp_get.json()) == sorted(
+        result["id"] for result in results
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_photos_batch_is_one_insert(test_db_async_session, user_with_token):
+    user_id = uuid.UUID(user_with_token["user_data"]["user_id"])
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = test_db_async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        async with test_db_async_session.begin():
+            photos = await UserPhotoDAO(test_db_async_session).create_photos(
+                user_id, [f"https://example.com/{n}.jpg" for n in range(9)]
+            )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1
+    assert "RETURNING" in inserts[0]
+    assert len(photos) == 9
+
+
+@pytest.mark.asyncio
+async def test_create_photos_batch_wrong_user_forbidden(
+    client, two_users_with_tokens, data_user_photo
+):
+    user1 = two_users_with_tokens["user1"]
+    user2_id = two_users_with_tokens["user2"]["user_data"]["user_id"]
+
+    response = await client.post(
+        f"/users/{user2_id}/photos/batch",
+        json={"items": [data_user_photo]},
+        headers=user1["headers"],
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_create_photos_batch_for_nonexistent_user(
+    client, admin_with_token, data_user_photo
+):
+    response = await client.post(
+        f"/users/{uuid.uuid4()}/photos/batch",
+        json={"items": [data_user_photo]},
+        headers=admin_with_token["headers"],
+    )
+    assert response.status_code == 404
+    assert "doesn't exist" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_create_photos_batch_rejects_empty_and_oversized(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    for items in ([], [{"url": "https://example.com/x.jpg"}] * 51):
+        response = await client.post(
+            f"/users/{user_id}/photos/batch", json={"items": items}, headers=headers
+        )
+        assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_update_photos_batch_partial(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    first, second = [
+        result["id"] for result in await create_photos(client, user_with_token, 2)
+    ]
+
+    response = await client.patch(
+        f"/users/{user_id}/photos/batch",
+        json={
+            "atomic": False,
+            "items": [
+                {"id": 999999, "url": "https://example.com/missing.jpg"},
+                {"id": first, "url": "https://example.com/new.jpg"},
+                {"id": second},
+            ],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [(r["id"], r["status"]) for r in results] == [
+        (999999, 404),
+        (first, 200),
+        (second, 400),
+    ]
+    assert results[1]["photo"]["url"] == "https://example.com/new.jpg"
+    assert results[2]["detail"] == "No data provided for update"
+
+    photos = (await client.get(f"/users/{user_id}/photos")).json()
+    assert {photo["id"]: photo["url"] for photo in photos}[first] == (
+        "https://example.com/new.jpg"
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_photos_batch_atomic_rolls_back(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    (photo_id,) = [
+        result["id"] for result in await create_photos(client, user_with_token, 1)
+    ]
+
+    response = await client.patch(
+        f"/users/{user_id}/photos/batch",
+        json={
+            "items": [
+                {"id": photo_id, "url": "https://example.com/new.jpg"},
+                {"id": 999999, "url": "https://example.com/missing.jpg"},
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Photo with id 999999 doesn't exist"
+
+    photos = (await client.get(f"/users/{user_id}/photos")).json()
+    assert photos[0]["url"] == "https://example.com/0.jpg"
+
+
+@pytest.mark.asyncio
+async def test_update_photos_batch_rejects_duplicate_ids(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    response = await client.patch(
+        f"/users/{user_id}/photos/batch",
+        json={
+            "items": [
+                {"id": 1, "url": "https://example.com/a.jpg"},
+                {"id": 1, "url": "https://example.com/b.jpg"},
+            ]
+        },
+        headers=user_with_token["headers"],
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_delete_photos_batch_only_touches_own_photos(client, two_users_with_tokens):
+    user1 = two_users_with_tokens["user1"]
+    user2 = two_users_with_tokens["user2"]
+    own = [result["id"] for result in await create_photos(client, user1, 2)]
+    foreign = [result["id"] for result in await create_photos(client, user2, 1)]
+    user1_id = user1["user_data"]["user_id"]
+
+    response = await client.post(
+        f"/users/{user1_id}/photos/batch-delete",
+        json={"ids": [*own, *foreign], "atomic": False},
+        headers=user1["headers"],
+    )
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()] == [204, 204, 404]
+
+    assert (await client.get(f"/users/{user1_id}/photos")).json() == []
+    user2_photos = (
+        await client.get(f"/users/{user2['user_data']['user_id']}/photos")
+    ).json()
+    assert [photo["id"] for photo in user2_photos] == foreign
+
+
+@pytest.mark.asyncio
+async def test_delete_photos_batch_atomic_keeps_everything(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    own = [result["id"] for result in await create_photos(client, user_with_token, 2)]
+
+    response = await client.post(
+        f"/users/{user_id}/photos/batch-delete",
+        json={"ids": [*own, 999999]},
+        headers=user_with_token["headers"],
+    )
+    assert response.status_code == 404
+    assert len((await client.get(f"/users/{user_id}/photos")).json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_social_links_batch_round_trip(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    response = await client.post(
+        f"/users/{user_id}/social-links/batch",
+        json={
+            "items": [
+                {"name": "Telegram", "link": "https://t.me/example"},
+                {"name": "VK", "link": "https://vk.com/example"},
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    telegram, vk = [result["id"] for result in response.json()]
+
+    response = await client.patch(
+        f"/users/{user_id}/social-links/batch",
+        json={
+            "items": [
+                {"id": telegram, "name": "TG"},
+                {"id": vk, "link": "https://vk.com/renamed"},
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    links = {r["id"]: r["social_link"] for r in response.json()}
+    assert (links[telegram]["name"], links[telegram]["link"]) == (
+        "TG",
+        "https://t.me/example",
+    )
+    assert (links[vk]["name"], links[vk]["link"]) == ("VK", "https://vk.com/renamed")
+
+    response = await client.post(
+        f"/users/{user_id}/social-links/batch-delete",
+        json={"ids": [telegram, vk]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()] == [204, 204]
+    assert (await client.get(f"/users/{user_id}/social-links")).json() == []
@@ -0,0 +1,183 @@
+import math
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from src.geo.gazetteer import EARTH_RADIUS_KM, bounding_box, haversine_km
+from src.geo.models import City
+from src.user_profile.dao import UserDAO
+from src.user_profile.models import User
+
+
+async def city_ids(db_session):
+    async with db_session.begin():
+        rows = await db_session.execute(select(City.name, City.id))
+        return dict(rows.all())
+
+
+async def user_city_id(db_session, user_id):
+    async with db_session.begin():
+        return await db_session.scalar(select(User.city_id).where(User.id == user_id))
+
+
+@pytest_asyncio.fixture
+async def nearby_users(test_db_async_session):
+    people = {
+        "anna": ("f", "Moscow"),
+        "vera": ("f", "Khimki"),
+        "olga": ("f", "Podolsk"),
+        "petr": ("m", "Khimki"),
+        "nina": ("f", "Tula"),
+        "lena": ("f", "Atlantis"),
+    }
+    ids = {}
+    async with test_db_async_session.begin():
+        user_dao = UserDAO(test_db_async_session)
+        for name, (gender, city) in people.items():
+            user = await user_dao.create_user(
+                email=f"{name}@mail.com",
+                hash_password="x",
+                name=name.title(),
+                surname="Nearby",
+                date_of_birth=date(1995, 1, 1),
+                bio=None,
+                gender=gender,
+                country="Russia",
+                city=city,
+            )
+            ids[str(user.id)] = name
+    return ids
+
+
+async def nearby(client, headers, **params):
+    response = await client.get("/users/nearby", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_city_id_follows_country_and_city(
+    client, user_with_token, test_db_async_session
+):
+    cities = await city_ids(test_db_async_session)
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    assert await user_city_id(test_db_async_session, user_id) == cities["Moscow"]
+
+    response = await client.patch(
+        f"/users/{user_id}", json={"city": "tula"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert await user_city_id(test_db_async_session, user_id) == cities["Tula"]
+
+    response = await client.patch(
+        f"/users/{user_id}", json={"country": "Germany"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert await user_city_id(test_db_async_session, user_id) is None
+
+    response = await client.patch(
+        f"/users/{user_id}", json={"city": "Berlin"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert await user_city_id(test_db_async_session, user_id) == cities["Berlin"]
+
+
+@pytest.mark.asyncio
+async def test_nearby_orders_by_distance_within_radius(
+    client, user_with_token, nearby_users
+):
+    page = await nearby(client, user_with_token["headers"], radius_km=50)
+    names = [nearby_users[item["user"]["user_id"]] for item in page["items"]]
+    assert names[0] == "anna" and names[-1] == "olga"
+    assert set(names[1:3]) == {"vera", "petr"}
+    distances = [item["distance_km"] for item in page["items"]]
+    assert distances[0] == 0 and 10 < distances[1] < 25 and 30 < distances[3] < 45
+    assert page["next_cursor"] is None
+    assert not {"email", "role"} & set(page["items"][0]["user"])
+
+    page = await nearby(client, user_with_token["headers"], radius_km=200, gender="f")
+    assert [nearby_users[item["user"]["user_id"]] for item in page["items"]] == [
+        "anna",
+        "vera",
+        "olga",
+        "nina",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_nearby_paginates_across_cities(client, user_with_token, nearby_users):
+    headers = user_with_token["headers"]
+    seen = []
+    cursor = None
+    while True:
+        params = {"radius_km": 200, "limit": 1}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = await nearby(client, headers, **params)
+        seen.extend(nearby_users[item["user"]["user_id"]] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    full = await nearby(client, headers, radius_km=200)
+    assert seen == [nearby_users[item["user"]["user_id"]] for item in full["items"]]
+    assert len(seen) == 5
+
+
+@pytest.mark.asyncio
+async def test_nearby_from_explicit_city(
+    client, user_with_token, nearby_users, test_db_async_session
+):
+    cities = await city_ids(test_db_async_session)
+    page = await nearby(
+        client, user_with_token["headers"], city_id=cities["Tula"], radius_km=50
+    )
+    assert [nearby_users[item["user"]["user_id"]] for item in page["items"]] == ["nina"]
+
+    response = await client.get(
+        "/users/nearby", params={"city_id": 0}, headers=user_with_token["headers"]
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_nearby_requires_known_city(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+    response = await client.patch(
+        f"/users/{user_id}", json={"city": "Atlantis"}, headers=headers
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/users/nearby", headers=headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"cursor": "bad"},
+        {"cursor": "eyJjaXR5X2lkIjogLTEsICJpZCI6ICJ4In0"},
+        {"radius_km": 0},
+        {"radius_km": 5000},
+    ],
+)
+async def test_nearby_rejects_invalid_params(client, user_with_token, params):
+    response = await client.get(
+        "/users/nearby", params=params, headers=user_with_token["headers"]
+    )
+    assert response.status_code in (400, 422)
+
+
+@pytest.mark.parametrize("latitude", [-60.0, 0.0, 50.0, 75.0])
+def test_bounding_box_contains_points_at_the_radius(latitude):
+    radius_km = 1000
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, 10.0, radius_km)
+    d_lat = math.degrees((radius_km - 1) / EARTH_RADIUS_KM)
+    for point_lat in (latitude - d_lat, latitude + d_lat):
+        assert haversine_km(latitude, 10.0, point_lat, 10.0) < radius_km
+        assert min_lat <= point_lat <= max_lat
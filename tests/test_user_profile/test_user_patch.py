@@ -153,11 +153,11 @@ async def test_update_user_moderator_cannot_update_other_user(
         ({"surname": ""}, 422, "String should have at least 1 character"),
         ({"surname": "a" * 51}, 422, "String should have at most 50 characters"),
         ({"date_of_birth": "invalid-date"}, 422, "Input should be a valid date"),
-        ({"gender": "x"}, 422, "Gender must be 'm' or 'f'"),
-        ({"gender": "mm"}, 422, "String should have at most 1 character"),
-        ({"gender": "M"}, 422, "Gender must be 'm' or 'f'"),
-        ({"gender": "male"}, 422, "String should have at most 1 character"),
-        ({"gender": ""}, 422, "String should have at least 1 character"),
+        ({"gender": "x"}, 422, "Input should be 'm' or 'f'"),
+        ({"gender": "mm"}, 422, "Input should be 'm' or 'f'"),
+        ({"gender": "M"}, 422, "Input should be 'm' or 'f'"),
+        ({"gender": "male"}, 422, "Input should be 'm' or 'f'"),
+        ({"gender": ""}, 422, "Input should be 'm' or 'f'"),
         ({"country": ""}, 422, "String should have at least 1 character"),
         ({"country": "a" * 51}, 422, "String should have at most 50 characters"),
         ({"city": ""}, 422, "String should have at least 1 character"),
@@ -165,7 +165,7 @@ async def test_update_user_moderator_cannot_update_other_user(
         ({"email": 123}, 422, "Input should be a valid string"),
         ({"name": 123}, 422, "Input should be a valid string"),
         ({"surname": True}, 422, "Input should be a valid string"),
-        ({"gender": 123}, 422, "Input should be a valid string"),
+        ({"gender": 123}, 422, "Input should be 'm' or 'f'"),
         ({"country": ["Russia"]}, 422, "Input should be a valid string"),
         ({"city": {"city": "Moscow"}}, 422, "Input should be a valid string"),
         ({}, 400, "No data provided for update"),
@@ -260,7 +260,9 @@ async def test_update_user_bio_validation(client, user_with_token):
         error_messages = [e.get("msg", "") for e in detail]
     else:
         error_messages = [detail]
-    assert any("Bio must not exceed 5000 characters" in msg for msg in error_messages)
+    assert any(
+        "String should have at most 5000 characters" in msg for msg in error_messages
+    )
 
     valid_bio = "a" * 5000
     update_payload = {"bio": valid_bio}
@@ -269,3 +271,13 @@ async def test_update_user_bio_validation(client, user_with_token):
         f"/users/{user_id}", json=update_payload, headers=headers
     )
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_update_user_strips_gender(client, user_with_token):
+    user_id = user_with_token["user_data"]["user_id"]
+    response = await client.patch(
+        f"/users/{user_id}", json={"gender": " f "}, headers=user_with_token["headers"]
+    )
+    assert response.status_code == 200
+    assert response.json()["gender"] == "f"
@@ -0,0 +1,108 @@
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_get_user_profile_combines_photos_and_links(
+    client, user_with_token, data_user_photo, data_user_social_link
+):
+    user_id = user_with_token["user_data"]["user_id"]
+    headers = user_with_token["headers"]
+
+    for _ in range(2):
+        resp = await client.post(
+            f"/users/{user_id}/photos", json=data_user_photo, headers=headers
+        )
+        assert resp.status_code == 201
+    resp = await client.post(
+        f"/users/{user_id}/social-links", json=data_user_social_link, headers=headers
+    )
+    assert resp.status_code == 201
+
+    profile = await client.get(f"/users/{user_id}/profile")
+    assert profile.status_code == 200
+    body = profile.json()
+    assert body["user_id"] == user_id
+    assert body["email"] == user_with_token["user_data"]["email"]
+    assert len(body["photos"]) == 2
+    assert body["photos"][0]["id"] < body["photos"][1]["id"]
+    assert body["social_media_links"][0]["name"] == data_user_social_link["name"]
+
+
+@pytest.mark.asyncio
+async def test_get_user_profile_doesnt_exist(client):
+    resp = await client.get(f"/users/{uuid4()}/profile")
+    assert resp.status_code == 404
+    assert "doesn't exist" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_get_user_profiles_batch_keeps_request_order(client, two_users_with_tokens):
+    user1_id = two_users_with_tokens["user1"]["user_data"]["user_id"]
+    user2_id = two_users_with_tokens["user2"]["user_data"]["user_id"]
+
+    resp = await client.post(
+        "/users/profiles", json={"ids": [user2_id, str(uuid4()), user1_id, user2_id]}
+    )
+    assert resp.status_code == 200
+    assert [p["user_id"] for p in resp.json()] == [user2_id, user1_id]
+    assert resp.json()[0]["photos"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_user_profiles_batch_limits(client):
+    empty = await client.post("/users/profiles", json={"ids": []})
+    assert empty.status_code == 422
+
+    too_many = await client.post(
+        "/users/profiles", json={"ids": [str(uuid4()) for _ in range(101)]}
+    )
+    assert too_many.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_users_batch_keeps_order_and_marks_missing(client, two_users_with_tokens):
+    user1_id = two_users_with_tokens["user1"]["user_data"]["user_id"]
+    user2_id = two_users_with_tokens["user2"]["user_data"]["user_id"]
+    missing_id = str(uuid4())
+
+    response = await client.post(
+        "/users/batch", json={"ids": [user2_id, missing_id, user1_id, user2_id]}
+    )
+    assert response.status_code == 200
+    items = response.json()
+    assert [item["id"] for item in items] == [user2_id, missing_id, user1_id, user2_id]
+    assert [item["found"] for item in items] == [True, False, True, True]
+    assert items[0]["user"]["user_id"] == user2_id
+    assert items[1]["user"] is None
+    assert all(item["photos"] is None for item in items)
+
+    assert (await client.get(f"/users/{missing_id}")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_users_batch_embeds_photos(client, user_with_token, data_user_photo):
+    user_id = user_with_token["user_data"]["user_id"]
+    created = await client.post(
+        f"/users/{user_id}/photos",
+        json=data_user_photo,
+        headers=user_with_token["headers"],
+    )
+
+    response = await client.post(
+        "/users/batch", json={"ids": [user_id, str(uuid4())], "include_photos": True}
+    )
+    assert response.status_code == 200
+    found, missing = response.json()
+    assert [photo["id"] for photo in found["photos"]] == [created.json()["id"]]
+    assert missing["found"] is False and missing["photos"] is None
+
+
+@pytest.mark.asyncio
+async def test_users_batch_limits(client):
+    assert (await client.post("/users/batch", json={"ids": []})).status_code == 422
+    response = await client.post(
+        "/users/batch", json={"ids": [str(uuid4()) for _ in range(101)]}
+    )
+    assert response.status_code == 422
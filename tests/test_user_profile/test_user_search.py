@@ -0,0 +1,277 @@
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+
+from src.user_profile.dao import UserDAO
+from src.user_profile.utils import years_before
+
+TODAY = date.today()
+
+
+@pytest_asyncio.fixture
+async def seeded_users(test_db_async_session):
+    people = {
+        "anna": ("f", "Russia", "Moscow", years_before(TODAY, 25)),
+        "vera": ("f", "Russia", "Moscow", years_before(TODAY, 30)),
+        "olga": ("f", "Russia", "Saint Petersburg", years_before(TODAY, 30)),
+        "petr": ("m", "Russia", "Moscow", years_before(TODAY, 30)),
+        "nina": ("f", "Russia", "Moscow", years_before(TODAY, 36) + timedelta(days=1)),
+        "lena": ("f", "Russia", "Moscow", years_before(TODAY, 36)),
+        "emma": ("f", "Germany", "Berlin", years_before(TODAY, 30)),
+    }
+    ids = {}
+    async with test_db_async_session.begin():
+        user_dao = UserDAO(test_db_async_session)
+        for name, (gender, country, city, date_of_birth) in people.items():
+            user = await user_dao.create_user(
+                email=f"{name}@mail.com",
+                hash_password="x",
+                name=name.title(),
+                surname="Search",
+                date_of_birth=date_of_birth,
+                bio=None,
+                gender=gender,
+                country=country,
+                city=city,
+            )
+            ids[str(user.id)] = name
+    return ids
+
+
+async def search(client, headers, **params):
+    response = await client.get("/users/search", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_search_filters_by_gender_age_and_city(
+    client, user_with_token, seeded_users
+):
+    page = await search(
+        client,
+        user_with_token["headers"],
+        gender="f",
+        min_age=25,
+        max_age=35,
+        country="Russia",
+        city="Moscow",
+    )
+    assert [seeded_users[user["user_id"]] for user in page["items"]] == [
+        "anna",
+        "vera",
+        "nina",
+    ]
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_by_country_and_worldwide(client, user_with_token, seeded_users):
+    headers = user_with_token["headers"]
+
+    page = await search(client, headers, gender="f", country="Russia", max_age=30)
+    assert {seeded_users[user["user_id"]] for user in page["items"]} == {
+        "anna",
+        "vera",
+        "olga",
+    }
+
+    page = await search(client, headers, gender="f", min_age=30, max_age=30)
+    assert {seeded_users[user["user_id"]] for user in page["items"]} == {
+        "vera",
+        "olga",
+        "emma",
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_results_hide_account_fields(client, user_with_token, seeded_users):
+    page = await search(client, user_with_token["headers"])
+    assert len(page["items"]) == len(seeded_users)
+    for user in page["items"]:
+        assert "email" not in user and "role" not in user
+        assert user["name"] and user["city"]
+
+
+@pytest.mark.asyncio
+async def test_search_excludes_the_caller(client, user_with_token, seeded_users):
+    page = await search(client, user_with_token["headers"], gender="m")
+    assert [seeded_users[user["user_id"]] for user in page["items"]] == ["petr"]
+
+
+@pytest.mark.asyncio
+async def test_search_keyset_pages_cover_every_match_once(
+    client, user_with_token, seeded_users
+):
+    headers = user_with_token["headers"]
+    expected = await search(client, headers, gender="f", limit=100)
+
+    seen, cursor = [], None
+    while True:
+        params = {"gender": "f", "limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = await search(client, headers, **params)
+        seen.extend(user["user_id"] for user in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [user["user_id"] for user in expected["items"]]
+    assert len(seen) == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params, status_code",
+    [
+        ({"min_age": 40, "max_age": 30}, 400),
+        ({"city": "Moscow"}, 400),
+        ({"cursor": "not-a-cursor"}, 400),
+        ({"cursor": "eyJpZCI6MX0"}, 400),
+        ({"gender": "x"}, 422),
+        ({"min_age": 17}, 422),
+        ({"limit": 101}, 422),
+    ],
+)
+async def test_search_rejects_invalid_filters(
+    client, user_with_token, params, status_code
+):
+    response = await client.get(
+        "/users/search", params=params, headers=user_with_token["headers"]
+    )
+    assert response.status_code == status_code
+
+
+@pytest.mark.asyncio
+async def test_search_requires_authentication(client):
+    response = await client.get("/users/search")
+    assert response.status_code == 401
+
+
+@pytest_asyncio.fixture
+async def bio_users(test_db_async_session):
+    bios = {
+        "kate": ("f", "Hiking every weekend, hiking is my life. I <3 mountains"),
+        "mary": ("f", "Books, coffee and an occasional hiking trip"),
+        "john": ("m", "Hiking and climbing"),
+        "lisa": ("f", "Painting and jazz"),
+    }
+    ids = {}
+    async with test_db_async_session.begin():
+        user_dao = UserDAO(test_db_async_session)
+        for name, (gender, bio) in bios.items():
+            user = await user_dao.create_user(
+                email=f"{name}@mail.com",
+                hash_password="x",
+                name=name.title(),
+                surname="Bio",
+                date_of_birth=years_before(TODAY, 30),
+                bio=bio,
+                gender=gender,
+                country="Russia",
+                city="Moscow",
+            )
+            ids[str(user.id)] = name
+    return ids
+
+
+async def search_bio(client, headers, **params):
+    response = await client.get("/users/search/bio", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_bio_search_ranks_and_highlights(client, user_with_token, bio_users):
+    page = await search_bio(client, user_with_token["headers"], q="hiking")
+
+    names = [bio_users[hit["user"]["user_id"]] for hit in page["items"]]
+    assert names[0] == "kate"
+    assert set(names) == {"kate", "mary", "john"}
+    assert page["items"][0]["rank"] > page["items"][-1]["rank"]
+    assert not {"email", "role"} & set(page["items"][0]["user"])
+
+    headline = page["items"][0]["headline"]
+    assert "<mark>Hiking</mark>" in headline
+    assert "<mark>hiking</mark>" in headline
+
+
+@pytest.mark.asyncio
+async def test_bio_search_escapes_bio_html(client, user_with_token, bio_users):
+    page = await search_bio(client, user_with_token["headers"], q="mountains")
+
+    (hit,) = page["items"]
+    assert "&lt;3 <mark>mountains</mark>" in hit["headline"]
+
+
+@pytest.mark.asyncio
+async def test_bio_search_combines_with_profile_filters(
+    client, user_with_token, bio_users
+):
+    headers = user_with_token["headers"]
+
+    page = await search_bio(client, headers, q="hiking", gender="m")
+    assert [bio_users[hit["user"]["user_id"]] for hit in page["items"]] == ["john"]
+
+    page = await search_bio(client, headers, q="hiking", min_age=40)
+    assert page["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_bio_search_cursor_pages(client, user_with_token, bio_users):
+    headers = user_with_token["headers"]
+    expected = await search_bio(client, headers, q="hiking")
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": "hiking", "limit": 1}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = await search_bio(client, headers, **params)
+        seen.extend(hit["user"]["user_id"] for hit in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [hit["user"]["user_id"] for hit in expected["items"]]
+
+
+@pytest.mark.asyncio
+async def test_bio_search_follows_profile_updates(client, two_users_with_tokens):
+    user1 = two_users_with_tokens["user1"]
+    user1_id = user1["user_data"]["user_id"]
+    user2_headers = two_users_with_tokens["user2"]["headers"]
+
+    page = await search_bio(client, user2_headers, q="handsome")
+    assert [hit["user"]["user_id"] for hit in page["items"]] == [user1_id]
+
+    patch = await client.patch(
+        f"/users/{user1_id}", json={"bio": "Sailing and chess"}, headers=user1["headers"]
+    )
+    assert patch.status_code == 200
+
+    page = await search_bio(client, user2_headers, q="sailing")
+    assert [hit["user"]["user_id"] for hit in page["items"]] == [user1_id]
+    assert (await search_bio(client, user2_headers, q="handsome"))["items"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [{"q": "hiking", "cursor": "eyJpZCI6MX0"}, {"q": "hiking", "cursor": "bad"}],
+)
+async def test_bio_search_rejects_invalid_cursor(client, user_with_token, params):
+    response = await client.get(
+        "/users/search/bio", params=params, headers=user_with_token["headers"]
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bio_search_requires_query(client, user_with_token):
+    response = await client.get(
+        "/users/search/bio", params={"q": ""}, headers=user_with_token["headers"]
+    )
+    assert response.status_code == 422
@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_export_users_ndjson(client, admin_with_token, user_with_token):
+    resp = await client.get("/admin/users/export", headers=admin_with_token["headers"])
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(rows) == 2
+    emails = {row["email"] for row in rows}
+    assert user_with_token["user_data"]["email"] in emails
+    assert set(rows[0]) == {
+        "user_id",
+        "email",
+        "name",
+        "surname",
+        "date_of_birth",
+        "bio",
+        "gender",
+        "country",
+        "city",
+        "role",
+    }
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv(client, admin_with_token, user_with_token):
+    resp = await client.get(
+        "/admin/users/export",
+        params={"format": "csv"},
+        headers=admin_with_token["headers"],
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 2
+    assert user_with_token["user_data"]["email"] in {row["email"] for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_export_users_forbidden_for_user(client, user_with_token):
+    resp = await client.get("/admin/users/export", headers=user_with_token["headers"])
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_users_unknown_format_422(client, admin_with_token):
+    resp = await client.get(
+        "/admin/users/export",
+        params={"format": "xml"},
+        headers=admin_with_token["headers"],
+    )
+    assert resp.status_code == 422